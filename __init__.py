@@ -1,2 +1,2 @@
-__all__ = ["contract", "tier0", "kernel", "closures", "regime", "weld", "manifest", "pipeline", "eid"]
+__all__ = ["contract", "tier0", "kernel", "closures", "regime", "weld", "manifest", "pipeline", "eid", "backend", "returns", "parallel", "norms", "batch", "traceio", "seams", "sweeps", "cache", "streaming", "ndjson", "archive", "server", "jobs"]
 __version__ = "0.1.0"
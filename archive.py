@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import json
+import lzma
+import os
+import struct
+import tempfile
+import zlib
+
+from umcp.contract import FrozenContract
+from umcp.kernel import TIER1_COLUMNS, Tier1Frame, Tier1Row
+from umcp.manifest import canonical_json
+from umcp.pipeline import ComputeResult
+from umcp.regime import RegimeResult, RegimeTimeline
+from umcp.tier0 import ClipMask
+from umcp.traceio import pack_f64, unpack_f64
+
+ARCHIVE_FORMAT = "umcp-tier1-archive/1"
+ARCHIVE_CODECS = ("zlib", "lzma")
+DEFAULT_BLOCK_ROWS = 4096
+
+_MAGIC = b"UMCPA1\n\0"
+_TAIL = struct.Struct("<Q")
+
+_COMPRESS: Dict[str, Callable[[bytes], bytes]] = {
+    "zlib": lambda data: zlib.compress(data, 6),
+    "lzma": lambda data: lzma.compress(data, preset=6),
+}
+_DECOMPRESS: Dict[str, Callable[[bytes], bytes]] = {"zlib": zlib.decompress, "lzma": lzma.decompress}
+
+
+def _xor_delta(raw: bytes) -> bytes:
+    """Replace each little-endian 64-bit word by its XOR with the previous word (first word kept)."""
+    if not raw:
+        return raw
+    x = int.from_bytes(raw, "little")
+    mask = (1 << (8 * len(raw))) - 1
+    return ((x ^ (x << 64)) & mask).to_bytes(len(raw), "little")
+
+
+def _xor_undelta(data: bytes) -> bytes:
+    """Inverse of `_xor_delta`: prefix XOR over 64-bit words, in log2(words) whole-block steps."""
+    if not data:
+        return data
+    y = int.from_bytes(data, "little")
+    nbits = 8 * len(data)
+    mask = (1 << nbits) - 1
+    shift = 64
+    while shift < nbits:
+        y = (y ^ (y << shift)) & mask
+        shift *= 2
+    return y.to_bytes(len(data), "little")
+
+
+def _shuffle(raw: bytes) -> bytes:
+    """Group byte k of every 8-byte word together (k = 0..7); sign/exponent bytes then compress well."""
+    return b"".join(raw[k::8] for k in range(8))
+
+
+def _unshuffle(data: bytes) -> bytes:
+    out = bytearray(len(data))
+    words = len(data) // 8
+    for k in range(8):
+        out[k::8] = data[k * words:(k + 1) * words]
+    return bytes(out)
+
+
+def _encode_f64(raw: bytes, codec: str) -> bytes:
+    return _COMPRESS[codec](_shuffle(_xor_delta(raw)))
+
+
+def _decode_f64(data: bytes, codec: str) -> bytes:
+    return _xor_undelta(_unshuffle(_DECOMPRESS[codec](data)))
+
+
+def write_archive(
+    path: str | Path,
+    result: ComputeResult,
+    *,
+    contract: Optional[FrozenContract] = None,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    codec: str = "zlib",
+) -> Path:
+    """
+    Write a ComputeResult as a compact columnar archive.
+
+    Each column (Ψ, the Tier-1 columns, regime codes) is stored in blocks of `block_rows` rows; float
+    blocks are XOR-delta encoded over their IEEE-754 bits, byte-shuffled and compressed with `codec`
+    (stdlib zlib or lzma). The footer is canonical JSON with the contract snapshot, run disclosures,
+    shape and a per-column block index, so `Tier1Archive` decodes only the blocks a window touches.
+    Values are stored losslessly. The file is written under a temporary name and renamed into place,
+    so `path` never holds a partial archive.
+    """
+    if codec not in ARCHIVE_CODECS:
+        raise ValueError(f"codec must be one of {ARCHIVE_CODECS}")
+    if int(block_rows) < 1:
+        raise ValueError("block_rows must be >= 1")
+    B = int(block_rows)
+    frame = result.tier1
+    T = len(frame)
+    n = len(frame.weights) if T else 0
+    if frame.t0 != 0:
+        raise ValueError("archive rows must be numbered t = 0..T-1")
+    compress = _COMPRESS[codec]
+
+    index: Dict[str, List[List[int]]] = {name: [] for name in ("psi",) + TIER1_COLUMNS + ("regimes",)}
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", suffix=path.suffix, dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_MAGIC)
+            pos = len(_MAGIC)
+
+            def put(name: str, blob: bytes) -> None:
+                nonlocal pos
+                f.write(blob)
+                index[name].append([pos, len(blob)])
+                pos += len(blob)
+
+            for s in range(0, T, B):
+                put("psi", _encode_f64(pack_f64(x for v in frame.psi[s:s + B] for x in v), codec))
+                for name in TIER1_COLUMNS:
+                    put(name, _encode_f64(pack_f64(frame.column(name)[s:s + B]), codec))
+                put("regimes", compress(bytes(result.regimes.codes[s:s + B])))
+            clip: Dict[str, List[int]] = {}
+            for name, bits in (("clip_below", result.clip_mask.below), ("clip_above", result.clip_mask.above)):
+                blob = compress(bytes(bits))
+                f.write(blob)
+                clip[name] = [pos, len(blob)]
+                pos += len(blob)
+
+            footer = dict(
+                format=ARCHIVE_FORMAT,
+                contract=None if contract is None else contract.snapshot_dict(),
+                freeze=None if not T else dict(
+                    weights=list(frame.weights), dt=frame.dt, h_rec=frame.h_rec, eta=frame.eta,
+                    norm_id=frame.norm_id, domain_id=frame.domain_id,
+                ),
+                T=T,
+                n=n,
+                block_rows=B,
+                codec=codec,
+                index=index,
+                clip=dict(clip, below_counts=result.clip_mask.below_counts, above_counts=result.clip_mask.above_counts),
+            )
+            data = canonical_json(footer).encode("utf-8")
+            f.write(data)
+            f.write(_TAIL.pack(len(data)))
+            f.write(_MAGIC)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
+
+
+class Tier1Archive:
+    """
+    Random-access reader for archives written by `write_archive`.
+
+    `column(name, start, stop)`, `psi`, `rows` and `regimes` decode only the blocks overlapping the
+    half-open row window [start, stop); `load()` rebuilds the full ComputeResult. Rows come back as
+    `Tier1Row`s equal (bit for bit) to the rows that were written.
+    """
+
+    __slots__ = ("path", "header", "T", "n", "block_rows", "codec", "_f")
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        # The reader owns this handle for its lifetime (windows are read on demand); close() releases it.
+        self._f: IO[bytes] = open(self.path, "rb")  # noqa: SIM115
+        try:
+            self.header = self._read_footer()
+        except BaseException:
+            self._f.close()
+            raise
+        if self.header.get("format") != ARCHIVE_FORMAT:
+            self._f.close()
+            raise ValueError(f"{self.path}: not a {ARCHIVE_FORMAT} file")
+        self.T = int(self.header["T"])
+        self.n = int(self.header["n"])
+        self.block_rows = int(self.header["block_rows"])
+        self.codec = str(self.header["codec"])
+
+    def _read_footer(self) -> Dict[str, Any]:
+        f = self._f
+        f.seek(0, 2)
+        size = f.tell()
+        tail = len(_MAGIC) + _TAIL.size
+        f.seek(0)
+        if size < len(_MAGIC) + tail or f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{self.path}: not a UMCP Tier-1 archive")
+        f.seek(size - tail)
+        (flen,) = _TAIL.unpack(f.read(_TAIL.size))
+        if f.read(len(_MAGIC)) != _MAGIC or flen > size - len(_MAGIC) - tail:
+            raise ValueError(f"{self.path}: truncated UMCP Tier-1 archive")
+        f.seek(size - tail - flen)
+        return json.loads(f.read(flen).decode("utf-8"))
+
+    def __enter__(self) -> "Tier1Archive":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __len__(self) -> int:
+        return self.T
+
+    @property
+    def contract(self) -> Optional[Dict[str, Any]]:
+        return self.header["contract"]
+
+    @property
+    def freeze(self) -> Optional[Dict[str, Any]]:
+        return self.header["freeze"]
+
+    def _blob(self, ref: Sequence[int]) -> bytes:
+        self._f.seek(ref[0])
+        return self._f.read(ref[1])
+
+    def _window(self, start: int, stop: Optional[int]) -> Tuple[int, int, range]:
+        stop = self.T if stop is None else min(int(stop), self.T)
+        start = max(0, int(start))
+        if start >= stop:
+            return start, start, range(0)
+        B = self.block_rows
+        return start, stop, range(start // B, (stop - 1) // B + 1)
+
+    def _floats(self, name: str, start: int, stop: Optional[int], width: int) -> List[float]:
+        if name not in self.header["index"]:
+            raise KeyError(f"unknown archive column {name!r}")
+        start, stop, blocks = self._window(start, stop)
+        if not blocks:
+            return []
+        refs = self.header["index"][name]
+        raw = b"".join(_decode_f64(self._blob(refs[k]), self.codec) for k in blocks)
+        base = blocks[0] * self.block_rows
+        return unpack_f64(raw[(start - base) * 8 * width:(stop - base) * 8 * width]).tolist()
+
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> List[float]:
+        """Values of one Tier-1 column (one of TIER1_COLUMNS) for rows [start, stop)."""
+        if name not in TIER1_COLUMNS:
+            raise KeyError(f"unknown Tier-1 column {name!r}")
+        return self._floats(name, start, stop, 1)
+
+    def psi(self, start: int = 0, stop: Optional[int] = None) -> List[List[float]]:
+        flat = self._floats("psi", start, stop, self.n)
+        n = self.n
+        return [flat[k:k + n] for k in range(0, len(flat), n)]
+
+    def regime_codes(self, start: int = 0, stop: Optional[int] = None) -> bytes:
+        start, stop, blocks = self._window(start, stop)
+        if not blocks:
+            return b""
+        refs = self.header["index"]["regimes"]
+        raw = b"".join(_DECOMPRESS[self.codec](self._blob(refs[k])) for k in blocks)
+        base = blocks[0] * self.block_rows
+        return raw[start - base:stop - base]
+
+    def regimes(self, start: int = 0, stop: Optional[int] = None) -> List[RegimeResult]:
+        return [RegimeTimeline.result_for_code(c) for c in self.regime_codes(start, stop)]
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> List[Tier1Row]:
+        start, stop, _ = self._window(start, stop)
+        if start >= stop:
+            return []
+        fz = self.freeze
+        weights = tuple(fz["weights"])
+        psi = self.psi(start, stop)
+        cols = [self.column(name, start, stop) for name in TIER1_COLUMNS]
+        return [
+            Tier1Row(
+                t, tuple(p), weights, fz["dt"], fz["h_rec"], fz["eta"], *vals,
+                norm_id=fz["norm_id"], domain_id=fz["domain_id"],
+            )
+            for t, p, *vals in zip(range(start, stop), psi, *cols)
+        ]
+
+    def frame(self, start: int = 0, stop: Optional[int] = None) -> Tier1Frame:
+        """Rows [start, stop) as a columnar Tier1Frame (t0 = start); rows are built only on access."""
+        start, stop, _ = self._window(start, stop)
+        fz = self.freeze or dict(weights=[], dt=0.0, h_rec=0.0, eta=0.0, norm_id="L2", domain_id="full")
+        return Tier1Frame(
+            psi=self.psi(start, stop), weights=fz["weights"], dt=fz["dt"], h_rec=fz["h_rec"], eta=fz["eta"],
+            columns={name: array("d", self.column(name, start, stop)) for name in TIER1_COLUMNS},
+            norm_id=fz["norm_id"], domain_id=fz["domain_id"], t0=start,
+        )
+
+    def load(self) -> ComputeResult:
+        clip = self.header["clip"]
+        mask = ClipMask(
+            T=self.T,
+            n=self.n,
+            below=bytearray(_DECOMPRESS[self.codec](self._blob(clip["clip_below"]))),
+            above=bytearray(_DECOMPRESS[self.codec](self._blob(clip["clip_above"]))),
+            below_counts=clip["below_counts"],
+            above_counts=clip["above_counts"],
+        )
+        frame = self.frame()
+        return ComputeResult(
+            psi=frame.psi, clip_mask=mask, tier1=frame, regimes=RegimeTimeline(self.regime_codes())
+        )
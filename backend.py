@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+try:  # optional accelerator; the reference kernel is pure Python
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only on no-dependency installs
+    np = None  # type: ignore[assignment]
+
+
+BACKENDS = ("python", "numpy", "auto")
+
+
+def have_numpy() -> bool:
+    """Return True if the optional NumPy backend is importable."""
+    return np is not None
+
+
+def require_numpy(feature: str) -> Any:
+    """
+    Return the NumPy module or raise ImportError naming the feature that needs it.
+
+    The package declares no runtime dependencies; NumPy is an explicit opt-in (`pip install -e ".[fast]"`).
+    """
+    if np is None:
+        raise ImportError(f"{feature} requires NumPy; install the optional extra: pip install 'umcp-canon-kernel[fast]'")
+    return np
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    Resolve a backend name to a concrete engine.
+
+    - "python": pure-Python reference path (always available).
+    - "numpy":  vectorized path; raises ImportError if NumPy is missing.
+    - "auto":   "numpy" when installed, else "python".
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}; expected one of {BACKENDS}")
+    if backend == "auto":
+        return "numpy" if np is not None else "python"
+    if backend == "numpy":
+        require_numpy('backend="numpy"')
+    return backend
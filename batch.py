@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+import numbers
+
+from umcp.backend import require_numpy, resolve_backend
+from umcp.contract import FrozenContract
+from umcp.kernel import (
+    TIER1_COLUMNS,
+    Tier1Frame,
+    _metric_columns_numpy,
+    _normalize_weights,
+    _tau_R_column_numpy,
+    compute_tier1_frame,
+)
+from umcp.norms import NormLike, resolve_norm
+from umcp.regime import RegimeResult, classify_regime_columns
+from umcp.returns import FULL_HORIZON, ReturnDomain
+from umcp.tier0 import l2_norm
+
+
+@dataclass(frozen=True, slots=True)
+class TraceResult:
+    """Tier-1 frame and per-row regimes for one trace of a batch."""
+
+    frame: Tier1Frame
+    regimes: List[RegimeResult]
+
+
+def _per_trace_weights(weights: Any, B: int) -> List[Optional[Sequence[float]]]:
+    """Declared (unnormalized) weights for each trace."""
+    if weights is None or (len(weights) > 0 and isinstance(weights[0], numbers.Real)):
+        return [weights] * B
+    if len(weights) != B:
+        raise ValueError("per-trace weights must have one entry per trace")
+    return list(weights)
+
+
+def compute_tier1_batch(
+    traces: Sequence[Sequence[Sequence[float]]],
+    *,
+    contract: FrozenContract,
+    weights: Optional[Sequence[Any]] = None,
+    dt: float,
+    h_rec: float,
+    eta: Optional[float] = None,
+    norm: NormLike = l2_norm,
+    backend: str = "auto",
+    domain: Optional[ReturnDomain] = None,
+) -> List[TraceResult]:
+    """
+    Tier-1 metrics, τR and regimes for many independent traces under one frozen contract.
+
+    `traces` is a (B, T, n) array or a ragged list of (T_b, n) traces (same n, any lengths).
+    `weights` is None (uniform), one weight vector shared by all traces, or one vector per trace.
+
+    With the NumPy engine all traces are stacked end to end (never padded) and computed in a single
+    vectorized pass; τR lag scans stop at each trace's start. Each returned frame holds views into
+    the stacked columns and a reference to its input trace. Values equal per-trace
+    `compute_tier1_frame(..., backend="numpy")`; with the python engine each trace is computed by
+    the reference path.
+    """
+    B = len(traces)
+    if B == 0:
+        raise ValueError("traces is empty")
+    lengths = [len(tr) for tr in traces]
+    if min(lengths) == 0:
+        raise ValueError("every trace must have at least one sample")
+    n = len(traces[0][0])
+    w_declared = _per_trace_weights(weights, B)
+    eta_val = float(eta) if eta is not None else float(contract.eta)
+    nm = resolve_norm(norm)
+    dom = domain if domain is not None else FULL_HORIZON
+
+    if resolve_backend(backend) == "python":
+        out: List[TraceResult] = []
+        for tr, w in zip(traces, w_declared):
+            frame = compute_tier1_frame(
+                tr, contract=contract, weights=w, dt=dt, h_rec=h_rec, eta=eta_val, norm=nm, domain=dom
+            )
+            out.append(TraceResult(frame=frame, regimes=classify_regime_columns(frame.columns)))
+        return out
+
+    np = require_numpy("compute_tier1_batch")
+    if isinstance(traces, np.ndarray) and traces.ndim == 3:
+        P = np.ascontiguousarray(traces, dtype=np.float64).reshape(-1, n)
+    else:
+        blocks = [np.asarray(tr, dtype=np.float64) for tr in traces]
+        if any(b.ndim != 2 or b.shape[1] != n for b in blocks):
+            raise ValueError("every trace must be a (T_b, n) block with the same n")
+        P = np.concatenate(blocks, axis=0)
+
+    starts = np.cumsum([0] + lengths[:-1])
+    trace_of_row = np.repeat(np.arange(B), lengths)
+    local = np.arange(P.shape[0]) - starts[trace_of_row]
+    bounds = list(zip(starts.tolist(), lengths))
+    if all(w is w_declared[0] for w in w_declared):
+        w_all = [_normalize_weights(w_declared[0], n)] * B
+        cols = _metric_columns_numpy(P, np.asarray(w_all[0], dtype=np.float64), contract.epsilon)
+    else:
+        # Each trace's segment is reduced with its own weight vector; no (ΣT, n) weight matrix is built.
+        w_all = [_normalize_weights(w, n) for w in w_declared]
+        parts = [
+            _metric_columns_numpy(P[s0:s0 + T_b], np.asarray(w_b, dtype=np.float64), contract.epsilon)
+            for (s0, T_b), w_b in zip(bounds, w_all)
+        ]
+        cols = {k: np.concatenate([part[k] for part in parts]) for k in parts[0]}
+
+    cols["tau_R"] = _tau_R_column_numpy(P, P, dt=dt, eta=eta_val, h_rec=h_rec, norm=nm, domain=dom, local=local)
+    regimes = classify_regime_columns(cols)
+
+    results: List[TraceResult] = []
+    for b, (s0, T_b) in enumerate(bounds):
+        frame = Tier1Frame(
+            psi=traces[b],
+            weights=w_all[b],
+            dt=dt,
+            h_rec=h_rec,
+            eta=eta_val,
+            norm_id=nm.norm_id,
+            domain_id=dom.domain_id,
+            columns={k: cols[k][s0:s0 + T_b] for k in TIER1_COLUMNS},
+        )
+        results.append(TraceResult(frame=frame, regimes=regimes[s0:s0 + T_b]))
+    return results
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import contextlib
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import time
+
+from umcp.backend import np
+from umcp.contract import FrozenContract
+from umcp.kernel import TIER1_COLUMNS, Tier1Frame
+from umcp.manifest import canonical_json, sha256_canonical
+from umcp.norms import NORMS, CallableNorm, Norm, NormLike, WeightedL2Norm, resolve_norm
+from umcp.pipeline import ComputeResult
+from umcp.regime import RegimeTimeline
+from umcp.tier0 import ClipMask
+from umcp.traceio import pack_f64, unpack_f64
+
+CACHE_FORMAT = "umcp-compute-cache/2"
+DEFAULT_MAX_BYTES = 1 << 30
+
+_MAGIC = b"UMCPC1\n"
+_SUFFIX = ".umcpc"
+_TMP_PREFIX = ".tmp-"
+# Temp files older than this are leftovers of a crashed writer and may be removed.
+_STALE_TMP_SECONDS = 3600.0
+
+
+def trace_digest(x_series: Sequence[Sequence[float]]) -> str:
+    """SHA256 of a raw trace as (T, n) little-endian float64 values; the input part of a cache key."""
+    if np is not None and isinstance(x_series, np.ndarray):
+        X = np.ascontiguousarray(x_series, dtype="<f8")
+        if X.ndim != 2:
+            raise ValueError("x_series must be a (T, n) trace")
+        T, n = X.shape
+        h = hashlib.sha256(f"{T},{n};".encode("ascii"))
+        h.update(X.tobytes())
+        return h.hexdigest()
+    T = len(x_series)
+    n = len(x_series[0]) if T else 0
+    h = hashlib.sha256(f"{T},{n};".encode("ascii"))
+    for row in x_series:
+        if len(row) != n:
+            raise ValueError("x_series must have constant dimension n")
+        h.update(pack_f64(float(x) for x in row))
+    return h.hexdigest()
+
+
+def norm_cache_id(norm: Norm) -> Optional[str]:
+    """
+    Full-precision identity of a resolved norm for cache keys, or None when it cannot be keyed.
+
+    WeightedL2Norm is keyed on the repr of its weights (its `norm_id` rounds them). Other norms are
+    keyed by id only when registered under it in `norms.NORMS`; callable norms never are, since their
+    id says nothing about the function behind it.
+    """
+    if isinstance(norm, WeightedL2Norm):
+        return "WeightedL2(w=" + ",".join(repr(w) for w in norm.weights) + ")"
+    if isinstance(norm, CallableNorm) or NORMS.get(norm.norm_id) != norm:
+        return None
+    return norm.norm_id
+
+
+def compute_cache_key(
+    *,
+    contract: FrozenContract,
+    weights: Optional[Sequence[float]],
+    dt: float,
+    h_rec: float,
+    eta: float,
+    norm: NormLike,
+    domain_id: str,
+    lows: Sequence[float],
+    highs: Sequence[float],
+    input_sha256: str,
+) -> str:
+    """
+    Content address of a /compute result: `sha256_canonical` over the contract snapshot, the freeze
+    settings that affect Tier-1 values, the ingest bounds and the raw-input digest.
+
+    Raises ValueError for a norm without a cache identity (see `norm_cache_id`).
+    """
+    nid = norm_cache_id(resolve_norm(norm))
+    if nid is None:
+        raise ValueError(f"norm {resolve_norm(norm).norm_id!r} has no cache identity (unregistered or callable)")
+    return sha256_canonical(
+        dict(
+            format=CACHE_FORMAT,
+            contract=contract.snapshot_dict(),
+            freeze=dict(
+                weights=None if weights is None else [float(w) for w in weights],
+                dt=float(dt),
+                h_rec=float(h_rec),
+                eta=float(eta),
+                norm=nid,
+                domain_id=str(domain_id),
+            ),
+            ingest=dict(lows=[float(x) for x in lows], highs=[float(x) for x in highs]),
+            input_sha256=input_sha256,
+        )
+    )
+
+
+def _pack(result: ComputeResult) -> bytes:
+    frame = result.tier1
+    blobs: List[Tuple[str, bytes]] = [
+        ("psi", pack_f64(float(x) for row in result.psi for x in row)),
+        ("clip_below", result.clip_mask.below),
+        ("clip_above", result.clip_mask.above),
+    ]
+    blobs += [(k, pack_f64(frame.column(k))) for k in TIER1_COLUMNS]
+    blobs.append(("regimes", bytes(result.regimes.codes)))
+    header = dict(
+        format=CACHE_FORMAT,
+        T=len(frame),
+        n=len(frame.weights),
+        weights=list(frame.weights),
+        dt=frame.dt,
+        h_rec=frame.h_rec,
+        eta=frame.eta,
+        norm_id=frame.norm_id,
+        domain_id=frame.domain_id,
+        below_counts=result.clip_mask.below_counts,
+        above_counts=result.clip_mask.above_counts,
+        blobs=[[name, len(data)] for name, data in blobs],
+    )
+    h = canonical_json(header).encode("utf-8")
+    return b"".join([_MAGIC, struct.pack("<Q", len(h)), h] + [data for _, data in blobs])
+
+
+def _unpack(data: bytes) -> ComputeResult:
+    if not data.startswith(_MAGIC) or len(data) < len(_MAGIC) + 8:
+        raise ValueError("not a compute cache entry")
+    pos = len(_MAGIC)
+    (hlen,) = struct.unpack_from("<Q", data, pos)
+    pos += 8
+    header: Dict[str, Any] = json.loads(data[pos:pos + hlen].decode("utf-8"))
+    pos += hlen
+    if header.get("format") != CACHE_FORMAT:
+        raise ValueError("unsupported compute cache format")
+    blobs: Dict[str, bytes] = {}
+    for name, length in header["blobs"]:
+        blobs[name] = data[pos:pos + length]
+        pos += length
+    if pos != len(data) or any(len(blobs[k]) != 8 * header["T"] for k in TIER1_COLUMNS):
+        raise ValueError("truncated compute cache entry")
+
+    T, n = header["T"], header["n"]
+    flat = unpack_f64(blobs["psi"])
+    psi = [flat[t * n:(t + 1) * n].tolist() for t in range(T)]
+    frame = Tier1Frame(
+        psi=psi,
+        weights=header["weights"],
+        dt=header["dt"],
+        h_rec=header["h_rec"],
+        eta=header["eta"],
+        columns={k: unpack_f64(blobs[k]) for k in TIER1_COLUMNS},
+        norm_id=header["norm_id"],
+        domain_id=header["domain_id"],
+    )
+    mask = ClipMask(
+        T=T,
+        n=n,
+        below=blobs["clip_below"],
+        above=blobs["clip_above"],
+        below_counts=header["below_counts"],
+        above_counts=header["above_counts"],
+    )
+    return ComputeResult(psi=psi, clip_mask=mask, tier1=frame, regimes=RegimeTimeline(blobs["regimes"]))
+
+
+class ComputeCache:
+    """
+    Content-addressed on-disk cache of /compute results, shared safely between processes.
+
+    One file per key. Entries are written to a temporary file and atomically renamed into place,
+    so readers see either a whole entry or none; unreadable entries are treated as misses and
+    removed. A hit refreshes the entry's mtime, and `evict` removes least-recently-used entries
+    until the directory is within `max_bytes` (and `max_entries`, if set). Concurrent evictions
+    are harmless: a file that is already gone is skipped. Values round-trip bit-exactly.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.max_entries = None if max_entries is None else int(max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> Optional[ComputeResult]:
+        p = self.path(key)
+        try:
+            data = p.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            result = _unpack(data)
+        except (ValueError, KeyError, struct.error):
+            p.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(p)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: ComputeResult) -> Path:
+        data = _pack(result)
+        fd, tmp = tempfile.mkstemp(prefix=_TMP_PREFIX, suffix=_SUFFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+        return self.path(key)
+
+    def entries(self) -> List[Tuple[Path, int, float]]:
+        """(path, bytes, mtime) of every complete entry, least recently used first."""
+        out: List[Tuple[Path, int, float]] = []
+        for p in self.directory.glob(f"*{_SUFFIX}"):
+            if p.name.startswith(_TMP_PREFIX):
+                continue
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            out.append((p, st.st_size, st.st_mtime))
+        out.sort(key=lambda e: e[2])
+        return out
+
+    def evict(self) -> int:
+        """Remove least-recently-used entries (and stale temp files) until within budget; returns the count removed."""
+        now = time.time()
+        for p in self.directory.glob(f"{_TMP_PREFIX}*"):
+            try:
+                if now - p.stat().st_mtime > _STALE_TMP_SECONDS:
+                    p.unlink()
+            except FileNotFoundError:
+                pass
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        removed = 0
+        for p, size, _ in entries:
+            if total <= self.max_bytes and (self.max_entries is None or count <= self.max_entries):
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            count -= 1
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for p, _, _ in self.entries():
+            p.unlink(missing_ok=True)
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import os
+import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
 
+from umcp.backend import BACKENDS
 from umcp.closures import GammaOmegaPower
 from umcp.contract import FrozenContract
-from umcp.kernel import Tier1Row, compute_tier1_series
-from umcp.weld import evaluate_weld
+from umcp.kernel import IncrementalKernel, Tier1Row, iter_tier1_windows
+from umcp.ndjson import NDJSONWriter, read_ndjson
+from umcp.norms import NORMS
+from umcp.regime import classify_regime
+from umcp.returns import domain_from_spec
+from umcp.traceio import DEFAULT_WINDOW, TRACE_FORMATS, detect_format, iter_csv_rows, iter_trace_windows
+from umcp.weld import evaluate_weld, evaluate_weld_records
+
+# umcp.server, umcp.jobs and umcp.archive are imported by the commands that use them, so plain
+# `umcp kernel` / `umcp weld` runs do not pay for the HTTP, process-pool and codec modules.
+if TYPE_CHECKING:
+    from umcp.server import UMCPClient
 
 
 def _read_json(path: str | Path) -> Dict[str, Any]:
@@ -17,58 +32,194 @@ def _read_json(path: str | Path) -> Dict[str, Any]:
 
 def _row_from_json(d: Dict[str, Any]) -> Tier1Row:
     # Minimal parser for weld CLI; expects the Tier1Row fields used by evaluate_weld.
-    return Tier1Row(
-        t=int(d["t"]),
-        psi=tuple(d["psi"]),
-        weights=tuple(d["weights"]),
-        dt=float(d["dt"]),
-        h_rec=float(d["h_rec"]),
-        eta=float(d["eta"]),
-        F=float(d["F"]),
-        omega=float(d["omega"]),
-        S=float(d["S"]),
-        C=float(d["C"]),
-        tau_R=float(d["tau_R"]),
-        kappa=float(d["kappa"]),
-        I=float(d["I"]),
+    return Tier1Row.from_dict(d)
+
+
+def _client(args: argparse.Namespace) -> Optional[UMCPClient]:
+    url = args.server or os.environ.get("UMCP_SERVER")
+    if not url:
+        return None
+    from umcp.server import UMCPClient
+
+    return UMCPClient(url)
+
+
+def _forward(client: UMCPClient, op: str, payload: Dict[str, Any]) -> int:
+    # Error responses and an unreachable daemon become a one-line CLI error, not a traceback.
+    try:
+        sys.stdout.write(client.request(op, payload))
+    except RuntimeError as e:
+        raise SystemExit(f"umcp {op}: {e}") from None
+    return 0
+
+
+def _kernel_stream(args: argparse.Namespace, contract: FrozenContract, weights: Optional[List[float]]) -> int:
+    # One NDJSON line per row, flushed as soon as it is computed; memory is the τR horizon only.
+    kernel = IncrementalKernel(
+        contract=contract, weights=weights, dt=float(args.dt), h_rec=float(args.hrec), eta=float(args.eta),
+        norm=args.norm, domain=domain_from_spec(args.domain),
     )
+    path = args.csv or args.input
+    fmt = "csv" if args.csv else detect_format(path, args.format)
+    with contextlib.ExitStack() as stack:
+        if fmt == "csv":
+            stream = sys.stdin if path == "-" else stack.enter_context(open(path, "r", encoding="utf-8"))
+            rows: Iterator[Sequence[float]] = iter_csv_rows(stream)
+        else:
+            windows = iter_trace_windows(path, fmt=fmt, channels=args.channels, window=args.window, backend="python")
+            rows = (row for win in windows for row in win)
+        writer = NDJSONWriter(sys.stdout, contract=contract, buffer_rows=1)
+        try:
+            for psi in rows:
+                row = kernel.push(psi)
+                writer.write_row(row, classify_regime(row))
+            writer.close()
+        except BrokenPipeError:
+            # Downstream closed the pipe (e.g. `| head`); stop quietly.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
 
 
 def kernel_cmd(args: argparse.Namespace) -> int:
-    import csv
-
     contract = FrozenContract.canon_default()
 
-    psi: List[List[float]] = []
-    with open(args.csv, "r", newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if not row:
-                continue
-            psi.append([float(x) for x in row])
-
+    if args.stream:
+        # --stream always runs locally on the pure-Python incremental kernel.
+        if args.server or os.environ.get("UMCP_SERVER"):
+            raise SystemExit("umcp kernel: --stream runs locally and cannot be combined with --server/$UMCP_SERVER")
+        if args.backend != "python":
+            raise SystemExit("umcp kernel: --stream uses the python engine; --backend is not supported")
+        w = [float(x) for x in args.weights.split(",")] if args.weights else None
+        return _kernel_stream(args, contract, w)
+    if args.csv == "-":
+        raise SystemExit("umcp kernel: reading stdin (--csv -) requires --stream")
+    path, fmt = (args.csv, "csv") if args.csv else (args.input, args.format)
+    windows = iter_trace_windows(path, fmt=fmt, channels=args.channels, window=args.window, backend=args.backend)
     w = [float(x) for x in args.weights.split(",")] if args.weights else None
-    rows = compute_tier1_series(
-        psi,
+    client = _client(args)
+    if client is not None:
+        return _forward(client, "kernel", dict(
+            psi=[[float(x) for x in row] for win in windows for row in win], weights=w, dt=float(args.dt),
+            h_rec=float(args.hrec), eta=float(args.eta), norm=args.norm, domain=args.domain, ndjson=args.ndjson,
+        ))
+    frames = iter_tier1_windows(
+        windows,
         contract=contract,
         weights=w,
         dt=float(args.dt),
         h_rec=float(args.hrec),
         eta=float(args.eta),
+        norm=args.norm,
+        backend=args.backend,
+        domain=domain_from_spec(args.domain),
     )
-    out = [r.__dict__ for r in rows]  # dataclasses with slots don't have __dict__, but Tier1Row does; keep safe
-    # safer:
-    out = [dict(
-        t=r.t, psi=list(r.psi), weights=list(r.weights), dt=r.dt, h_rec=r.h_rec, eta=r.eta,
-        F=r.F, omega=r.omega, S=r.S, C=r.C, tau_R=r.tau_R, kappa=r.kappa, I=r.I
-    ) for r in rows]
+    if args.ndjson:
+        with NDJSONWriter(sys.stdout, contract=contract) as writer:
+            for frame in frames:
+                writer.write_rows(frame)
+        return 0
+    out = [r.to_dict() for frame in frames for r in frame]
     print(json.dumps(out, indent=2))
     return 0
 
 
+def _load_tier1(path: str) -> Sequence[Tier1Row]:
+    """Rows of an exported Tier-1 trace: a `umcp kernel` JSON array, an NDJSON export, or an archive."""
+    if Path(path).suffix == ".umcpa":
+        from umcp.archive import Tier1Archive
+
+        with Tier1Archive(path) as arc:
+            return arc.frame()
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(1)
+        while head.isspace():
+            head = f.read(1)
+        f.seek(0)
+        if head == "[":
+            return [Tier1Row.from_dict(d) for d in json.load(f)]
+        _, records = read_ndjson(f)
+        return [row for row, _ in records]
+
+
+def weld_batch_cmd(args: argparse.Namespace) -> int:
+    contract = FrozenContract.canon_default()
+    tier1 = _load_tier1(args.tier1) if args.tier1 else None
+    defaults = dict(
+        tauR=args.tauR, R=float(args.R) if args.R is not None else None, infer_R=bool(args.infer_R), theta=args.theta,
+        weld_id=args.weld_id, pre_id=args.pre_id, post_id=args.post_id,
+    )
+    start = time.perf_counter()
+    total = failed = errors = 0
+    # Input line number of each record not yet written; malformed lines become None records.
+    lines: Dict[int, int] = {}
+    bad: Dict[int, str] = {}
+
+    def parse(src: Any) -> Iterator[Any]:
+        k = 0
+        for lineno, ln in enumerate(src, 1):
+            if ln.isspace():
+                continue
+            lines[k] = lineno
+            try:
+                yield json.loads(ln)
+            except ValueError as e:
+                bad[k] = f"weld record {k}: invalid JSON: {e}"
+                yield None
+            k += 1
+
+    with contextlib.ExitStack() as stack:
+        src = sys.stdin if args.batch == "-" else stack.enter_context(open(args.batch, "r", encoding="utf-8"))
+        receipts = evaluate_weld_records(
+            parse(src), tier1=tier1, gamma=GammaOmegaPower(p=contract.p), alpha=contract.alpha,
+            tol_seam=contract.tol_seam, tol_id=contract.tol_id, defaults=defaults, chunk=args.chunk,
+            errors="report",
+        )
+        out: List[str] = []
+        for k, receipt in receipts:
+            total += 1
+            lineno = lines.pop(k)
+            if isinstance(receipt, ValueError):
+                errors += 1
+                error = bad.pop(k, None) or str(receipt)
+                out.append(json.dumps(dict(record=k, line=lineno, error=error), ensure_ascii=False) + "\n")
+            else:
+                if not receipt.pass_ok:
+                    failed += 1
+                elif args.failures_only:
+                    continue
+                out.append(json.dumps(dict(record=k, **receipt.to_dict()), ensure_ascii=False) + "\n")
+            if len(out) >= args.chunk:
+                sys.stdout.write("".join(out))
+                sys.stdout.flush()
+                out.clear()
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+    seconds = time.perf_counter() - start
+    print(
+        f"umcp weld --batch: {total} records, {failed} failed, {errors} invalid, {seconds:.3f}s"
+        f" ({total / seconds if seconds > 0 else 0.0:.0f} welds/s)",
+        file=sys.stderr,
+    )
+    return 1 if errors else 0
+
+
 def weld_cmd(args: argparse.Namespace) -> int:
+    if args.batch:
+        if args.server:
+            raise SystemExit("umcp weld: --batch runs locally and cannot be combined with --server")
+        return weld_batch_cmd(args)
+    if not (args.pre and args.post and args.tauR is not None):
+        raise SystemExit("umcp weld: --pre, --post and --tauR are required (or use --batch)")
     contract = FrozenContract.canon_default()
 
+    client = _client(args)
+    if client is not None:
+        return _forward(client, "weld", dict(
+            pre=_read_json(args.pre), post=_read_json(args.post), tauR=float(args.tauR), infer_R=bool(args.infer_R),
+            R=float(args.R) if args.R is not None else None, theta=args.theta, weld_id=args.weld_id,
+            pre_id=args.pre_id, post_id=args.post_id,
+        ))
+
     pre = _row_from_json(_read_json(args.pre))
     post = _row_from_json(_read_json(args.post))
 
@@ -92,22 +243,105 @@ def weld_cmd(args: argparse.Namespace) -> int:
     return 0
 
 
+def batch_cmd(args: argparse.Namespace) -> int:
+    from umcp.jobs import expand_inputs, run_batch
+
+    files = expand_inputs(args.inputs, pattern=args.pattern, manifest=args.manifest)
+    settings = dict(
+        format=args.format, channels=args.channels, window=args.window, backend=args.backend, dt=float(args.dt),
+        h_rec=float(args.hrec), eta=float(args.eta),
+        weights=[float(x) for x in args.weights.split(",")] if args.weights else None, norm=args.norm,
+        domain=args.domain, weld_lag=args.weld_lag,
+    )
+
+    def progress(entry: Dict[str, Any]) -> None:
+        if entry["status"] == "ok":
+            print(f"ok    {entry['input']}  rows={entry['rows']}  {entry['seconds']:.3f}s", file=sys.stderr, flush=True)
+        else:
+            print(f"error {entry['input']}  {entry['error']}", file=sys.stderr, flush=True)
+
+    summary = run_batch(
+        files, out_dir=args.out, settings=settings, jobs=args.jobs, skip_done=args.skip_done, progress=progress
+    )
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
+
+
+def serve_cmd(args: argparse.Namespace) -> int:
+    from umcp.server import DEFAULT_HOST, DEFAULT_MAX_SESSIONS, DEFAULT_PORT, DEFAULT_WORKERS, UMCPServer
+
+    server = UMCPServer(
+        args.host or DEFAULT_HOST,
+        DEFAULT_PORT if args.port is None else args.port,
+        workers=DEFAULT_WORKERS if args.workers is None else args.workers,
+        max_sessions=DEFAULT_MAX_SESSIONS if args.max_sessions is None else args.max_sessions,
+        verbose=args.verbose,
+    )
+    print(f"umcp daemon listening on {server.url}", file=sys.stderr, flush=True)
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+    return 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     p = argparse.ArgumentParser(prog="umcp", description="UMCP canon kernel + weld CLI")
+    p.add_argument(
+        "--server", default=None,
+        help="Forward kernel/weld to a running `umcp serve` daemon at this URL (default: $UMCP_SERVER, else run locally)",
+    )
     sp = p.add_subparsers(dest="cmd", required=True)
 
-    pk = sp.add_parser("kernel", help="Compute Tier-1 rows from a CSV of admitted Ψ(t)")
-    pk.add_argument("--csv", required=True, help="CSV file where each row is a Ψ(t) vector in [0,1]")
+    pk = sp.add_parser("kernel", help="Compute Tier-1 rows from a CSV or binary trace of admitted Ψ(t)")
+    src = pk.add_mutually_exclusive_group(required=True)
+    src.add_argument("--csv", help="CSV file where each row is a Ψ(t) vector in [0,1] (- for stdin with --stream)")
+    src.add_argument(
+        "--input",
+        help="Trace file: CSV, raw little-endian float64/float32 rows, or .npy. Read window by window, but the "
+        "default JSON array output holds every row in memory (O(T·n)); use --ndjson or --stream for large traces",
+    )
+    pk.add_argument(
+        "--format", default="auto", choices=TRACE_FORMATS,
+        help="--input format (default: from suffix .npy/.f64/.f32, else CSV)",
+    )
+    pk.add_argument("--channels", type=int, default=None, help="Channel count n for raw f64/f32 input")
+    pk.add_argument(
+        "--window", type=int, default=DEFAULT_WINDOW, help=f"Rows read and computed per window (default {DEFAULT_WINDOW})"
+    )
+    pk.add_argument("--backend", default="python", choices=BACKENDS, help="Kernel engine (default python)")
     pk.add_argument("--dt", required=True, type=float, help="Cadence (seconds)")
     pk.add_argument("--hrec", required=True, type=float, help="Return horizon Hrec (seconds)")
     pk.add_argument("--eta", required=True, type=float, help="Return threshold η")
     pk.add_argument("--weights", default=None, help="Comma-separated weights w_i (defaults uniform)")
+    pk.add_argument("--norm", default="L2", choices=sorted(NORMS), help="Registered return norm id (default L2)")
+    pk.add_argument(
+        "--domain", default="full", help="Return domain Dθ: full | strided:K[:R] | phase_locked:P[:TOL] (default full)"
+    )
+    pk.add_argument(
+        "--ndjson", action="store_true",
+        help="Write NDJSON (a header record, then one line per row) instead of one JSON array",
+    )
+    pk.add_argument(
+        "--stream", action="store_true",
+        help="Constant-memory mode: read rows lazily (--csv - for stdin) and write each row, with its regime, "
+        "as one NDJSON line as soon as it is computed. Runs locally with the python engine only",
+    )
     pk.set_defaults(func=kernel_cmd)
 
     pw = sp.add_parser("weld", help="Evaluate a weld row from PRE/POST Tier-1 JSON rows")
-    pw.add_argument("--pre", required=True, help="JSON file containing a Tier1Row dict (PRE)")
-    pw.add_argument("--post", required=True, help="JSON file containing a Tier1Row dict (POST)")
-    pw.add_argument("--tauR", required=True, type=float, help="Observed/declared τR for the seam")
+    pw.add_argument("--pre", default=None, help="JSON file containing a Tier1Row dict (PRE)")
+    pw.add_argument("--post", default=None, help="JSON file containing a Tier1Row dict (POST)")
+    pw.add_argument("--tauR", default=None, type=float, help="Observed/declared τR for the seam (batch default)")
+    pw.add_argument(
+        "--batch", default=None,
+        help="NDJSON weld records (- for stdin): {pre, post | pre_index, post_index, tauR, R, infer_R, theta, ids}; "
+        "receipts are streamed as NDJSON; an invalid record yields {record, line, error} and exit status 1. "
+        "Always runs locally",
+    )
+    pw.add_argument("--tier1", default=None, help="Exported Tier-1 trace that pre_index/post_index point into")
+    pw.add_argument(
+        "--failures-only", action="store_true", dest="failures_only", help="With --batch, output only failing receipts"
+    )
+    pw.add_argument("--chunk", type=int, default=4096, help="Records evaluated (and receipts written) per chunk")
     pw.add_argument("--R", default=None, help="Return credit rate R (optional if --infer-R)")
     pw.add_argument("--infer-R", action="store_true", dest="infer_R", help="Infer R from the ledger")
     pw.add_argument("--theta", default="θ", help="θ label for the receipt (e.g., PHYS-04)")
@@ -116,6 +350,44 @@ def main(argv: Sequence[str] | None = None) -> int:
     pw.add_argument("--post-id", default=FrozenContract.canon_default().post_doi, dest="post_id")
     pw.set_defaults(func=weld_cmd)
 
+    pb = sp.add_parser("batch", help="Run the kernel (and optionally welds) over many trace files in parallel")
+    pb.add_argument("inputs", nargs="*", help="Trace files, directories or glob patterns")
+    pb.add_argument("--manifest", default=None, help="File listing one input path per line")
+    pb.add_argument("--pattern", default="*.csv", help="File pattern used inside directory inputs (default *.csv)")
+    pb.add_argument("--out", required=True, help="Output directory (per-file NDJSON plus index.json)")
+    pb.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    pb.add_argument(
+        "--skip-done", action="store_true", dest="skip_done",
+        help="Skip inputs whose content hash and settings already have an ok entry in index.json",
+    )
+    pb.add_argument(
+        "--weld-lag", type=int, default=None, dest="weld_lag",
+        help="Also weld each row t against t-K; failure receipts go to <name>.welds.ndjson",
+    )
+    pb.add_argument("--format", default="auto", choices=TRACE_FORMATS, help="Input format (default: from suffix)")
+    pb.add_argument("--channels", type=int, default=None, help="Channel count n for raw f64/f32 input")
+    pb.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Rows read and computed per window")
+    pb.add_argument("--backend", default="python", choices=BACKENDS, help="Kernel engine (default python)")
+    pb.add_argument("--dt", required=True, type=float, help="Cadence (seconds)")
+    pb.add_argument("--hrec", required=True, type=float, help="Return horizon Hrec (seconds)")
+    pb.add_argument("--eta", required=True, type=float, help="Return threshold η")
+    pb.add_argument("--weights", default=None, help="Comma-separated weights w_i (defaults uniform)")
+    pb.add_argument("--norm", default="L2", choices=sorted(NORMS), help="Registered return norm id (default L2)")
+    pb.add_argument("--domain", default="full", help="Return domain Dθ (as for `umcp kernel`)")
+    pb.set_defaults(func=batch_cmd)
+
+    ps = sp.add_parser("serve", help="Run a long-lived local daemon serving kernel/weld/compute requests")
+    # Unset options fall back to umcp.server.DEFAULT_* in serve_cmd (the module is not imported here).
+    ps.add_argument("--host", default=None, help="Bind address (default 127.0.0.1)")
+    ps.add_argument("--port", type=int, default=None, help="Port (default 8765; 0 picks a free port)")
+    ps.add_argument("--workers", type=int, default=None, help="Requests served concurrently (default 4)")
+    ps.add_argument(
+        "--max-sessions", type=int, default=None, dest="max_sessions",
+        help="Distinct ingest/freeze settings kept warm in the session pool (default 64)",
+    )
+    ps.add_argument("--verbose", action="store_true", help="Log each request to stderr")
+    ps.set_defaults(func=serve_cmd)
+
     args = p.parse_args(argv)
     return int(args.func(args))
 
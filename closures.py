@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Any, Protocol
 
 import math
 
+from umcp.backend import np
+
 
 class GammaClosure(Protocol):
     """
@@ -18,6 +20,29 @@ class GammaClosure(Protocol):
     def __call__(self, omega: float) -> float: ...
 
 
+class BatchGammaClosure(GammaClosure, Protocol):
+    """
+    GammaClosure that can also evaluate a whole ω column at once.
+
+    `batch(omegas)` returns a list equal element-for-element to `[gamma(o) for o in omegas]` for
+    Python sequences; for a NumPy array it returns a float64 array computed with NumPy ufuncs, which
+    may differ from the scalar values in the last bits.
+    """
+
+    def batch(self, omega: Any) -> Any: ...
+
+
+def gamma_batch(gamma: GammaClosure, omega: Any) -> Any:
+    """Γ over a column of ω: the closure's `batch` when it has one, else one scalar call per value."""
+    batch = getattr(gamma, "batch", None)
+    if batch is not None:
+        return batch(omega)
+    values = [float(gamma(o)) for o in omega]
+    if np is not None and isinstance(omega, np.ndarray):
+        return np.asarray(values, dtype=np.float64)
+    return values
+
+
 @dataclass(frozen=True, slots=True)
 class GammaOmegaPower:
     """
@@ -38,6 +63,14 @@ class GammaOmegaPower:
             return -((-o) ** self.p)
         return o**self.p
 
+    def batch(self, omega: Any) -> Any:
+        p = self.p
+        if np is not None and isinstance(omega, np.ndarray):
+            o = omega.astype(np.float64, copy=False)
+            mag = np.abs(o) ** p
+            return np.where(o < 0.0, -mag, mag)
+        return [-((-o) ** p) if o < 0.0 else o**p for o in map(float, omega)]
+
 
 @dataclass(frozen=True, slots=True)
 class GammaNegLogOneMinusOmega:
@@ -55,3 +88,10 @@ class GammaNegLogOneMinusOmega:
 
     def __call__(self, omega: float) -> float:
         return -math.log(max(self.epsilon, 1.0 - float(omega) + self.epsilon))
+
+    def batch(self, omega: Any) -> Any:
+        eps = self.epsilon
+        if np is not None and isinstance(omega, np.ndarray):
+            return -np.log(np.maximum(eps, 1.0 - omega.astype(np.float64, copy=False) + eps))
+        log = math.log
+        return [-log(max(eps, 1.0 - o + eps)) for o in map(float, omega)]
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from umcp.closures import GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.kernel import Tier1Row, iter_tier1_windows
+from umcp.manifest import sha256_canonical
+from umcp.ndjson import NDJSONWriter
+from umcp.returns import domain_from_spec
+from umcp.traceio import DEFAULT_WINDOW, iter_trace_windows
+from umcp.weld import evaluate_weld_batch
+
+BATCH_INDEX = "index.json"
+BATCH_FORMAT = "umcp-batch-index/1"
+
+_HASH_CHUNK = 1 << 20
+
+
+def file_sha256(path: str | Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def expand_inputs(
+    inputs: Iterable[str],
+    *,
+    pattern: str = "*.csv",
+    manifest: Optional[str | Path] = None,
+) -> List[Path]:
+    """
+    Resolve batch inputs to a sorted, de-duplicated file list.
+
+    Each input is a directory (files matching `pattern`), a glob, or a file. A manifest lists one
+    path per line (relative to the manifest's directory; blank lines and # comments ignored).
+    """
+    found: List[Path] = []
+    for item in inputs:
+        p = Path(item)
+        if p.is_dir():
+            found.extend(q for q in p.glob(pattern) if q.is_file())
+        elif glob.has_magic(item):
+            found.extend(Path(q) for q in glob.glob(item, recursive=True) if Path(q).is_file())
+        else:
+            found.append(p)
+    if manifest is not None:
+        base = Path(manifest).parent
+        for ln in Path(manifest).read_text(encoding="utf-8").splitlines():
+            ln = ln.strip()
+            if ln and not ln.startswith("#"):
+                found.append(base / ln)
+    return sorted({p.resolve() for p in found})
+
+
+@contextmanager
+def _atomic_text(path: Path) -> Iterator[IO[str]]:
+    """Text file written under a temporary name and renamed to `path` only if the block succeeds."""
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _output_key(path: Path) -> Optional[str]:
+    """Batch key recorded in an output's NDJSON header, or None if the file is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+    return header.get("key") if isinstance(header, dict) else None
+
+
+def run_trace_file(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Process one batch input: Tier-1 rows as NDJSON and, with `weld_lag`, (t − lag → t) welds.
+
+    `job` holds plain data so it can be sent to a worker process. Rows are computed window by window;
+    weld failures are written as SS1m receipts to `<name>.welds.ndjson`. Returns the index entry.
+    """
+    start = time.perf_counter()
+    s = job["settings"]
+    contract = FrozenContract.canon_default()
+    gamma = GammaOmegaPower(p=contract.p)
+    out = Path(job["output"])
+    windows = iter_trace_windows(
+        job["input"], fmt=s["format"], channels=s["channels"], window=s["window"], backend=s["backend"]
+    )
+    frames = iter_tier1_windows(
+        windows, contract=contract, weights=s["weights"], dt=s["dt"], h_rec=s["h_rec"], eta=s["eta"],
+        norm=s["norm"], backend=s["backend"], domain=domain_from_spec(s["domain"]),
+    )
+    lag: Optional[int] = s["weld_lag"]
+    n_rows = weld_pass = weld_total = 0
+    welds = out.with_name(out.name[: -len(".ndjson")] + ".welds.ndjson")
+    meta = dict(input=Path(job["input"]).name, sha256=job["sha256"], key=job["key"])
+
+    # Rows and weld receipts are both streamed to temporary files; neither output appears unless
+    # the whole input was processed.
+    with ExitStack() as stack:
+        w = stack.enter_context(NDJSONWriter(stack.enter_context(_atomic_text(out)), contract=contract, meta=meta))
+        receipts = stack.enter_context(_atomic_text(welds)) if lag else None
+        tail: Deque[Tier1Row] = deque(maxlen=lag or 1)
+        for frame in frames:
+            rows = frame.to_rows()
+            w.write_rows(rows)
+            n_rows += len(rows)
+            if receipts is not None:
+                held = list(tail) + rows
+                posts = [b for b in range(len(tail), len(held)) if b >= lag]
+                if posts:
+                    batch = evaluate_weld_batch(
+                        held, pre_index=[b - lag for b in posts], post_index=posts, gamma=gamma,
+                        alpha=contract.alpha, tol_seam=contract.tol_seam, tol_id=contract.tol_id, infer_R=True,
+                        weld_id=contract.weld_id, pre_id=contract.pre_doi, post_id=contract.post_doi,
+                        backend=s["backend"],
+                    )
+                    weld_total += len(batch)
+                    weld_pass += batch.pass_count
+                    receipts.writelines(json.dumps(r.to_dict(), ensure_ascii=False) + "\n" for r in batch.receipts())
+                tail.extend(rows)
+
+    entry: Dict[str, Any] = dict(
+        input=str(job["input"]), sha256=job["sha256"], key=job["key"], output=out.name, status="ok",
+        rows=n_rows, seconds=time.perf_counter() - start,
+    )
+    if lag:
+        entry.update(weld_output=welds.name, weld_pass=weld_pass, weld_total=weld_total)
+    return entry
+
+
+def _safe_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return run_trace_file(job)
+    except Exception as e:
+        return dict(
+            input=str(job["input"]), sha256=job["sha256"], key=job["key"], status="error",
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
+def _is_done(out: Path, entry: Dict[str, Any], key: str) -> bool:
+    """An "ok" entry is reusable only if its output still carries `key` and its weld file exists."""
+    if _output_key(out / entry["output"]) != key:
+        return False
+    return "weld_output" not in entry or (out / entry["weld_output"]).exists()
+
+
+def load_index(out_dir: str | Path) -> Dict[str, Any]:
+    p = Path(out_dir) / BATCH_INDEX
+    if not p.exists():
+        return dict(format=BATCH_FORMAT, entries={})
+    index = json.loads(p.read_text(encoding="utf-8"))
+    if index.get("format") != BATCH_FORMAT:
+        raise ValueError(f"{p}: not a {BATCH_FORMAT} file")
+    return index
+
+
+def run_batch(
+    files: Sequence[Path],
+    *,
+    out_dir: str | Path,
+    settings: Dict[str, Any],
+    jobs: int = 1,
+    skip_done: bool = False,
+    progress: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Run `run_trace_file` over many inputs on a process pool of `jobs` workers.
+
+    Results are recorded in `<out_dir>/index.json`, keyed by `sha256_canonical` of the settings
+    and the input's content hash; outputs are named `<stem>-<key[:16]>.ndjson` and their NDJSON
+    header records the key. With `skip_done`, inputs whose key already has an "ok" entry are not
+    recomputed, provided the output on disk still carries that key (and the weld file exists). `progress(entry)` is called as each file
+    finishes. Returns a summary with per-status counts, rows and throughput.
+    """
+    start = time.perf_counter()
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    index = load_index(out)
+    done: Dict[str, Any] = index["entries"]
+    settings = dict(settings, window=int(settings.get("window") or DEFAULT_WINDOW))
+    # Window size does not change any value, so it is not part of the key. The engine is: NumPy
+    # rows agree with the reference only within kernel.numpy_tolerance.
+    keyed = {k: v for k, v in settings.items() if k != "window"}
+
+    pending: List[Dict[str, Any]] = []
+    skipped = 0
+    for path in files:
+        sha = file_sha256(path)
+        key = sha256_canonical(dict(format=BATCH_FORMAT, settings=keyed, input_sha256=sha))
+        prev = done.get(key)
+        if skip_done and prev is not None and prev.get("status") == "ok" and _is_done(out, prev, key):
+            skipped += 1
+            continue
+        name = f"{path.stem}-{key[:16]}.ndjson"
+        pending.append(dict(input=str(path), sha256=sha, key=key, output=str(out / name), settings=settings))
+
+    results: List[Dict[str, Any]] = []
+
+    def record(entry: Dict[str, Any]) -> None:
+        results.append(entry)
+        done[entry["key"]] = entry
+        if progress is not None:
+            progress(entry)
+
+    if jobs <= 1 or len(pending) <= 1:
+        for job in pending:
+            record(_safe_job(job))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for fut in as_completed([pool.submit(_safe_job, job) for job in pending]):
+                record(fut.result())
+
+    with _atomic_text(out / BATCH_INDEX) as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    seconds = time.perf_counter() - start
+    rows = sum(e.get("rows", 0) for e in results)
+    return dict(
+        files=len(files), processed=sum(e["status"] == "ok" for e in results),
+        failed=sum(e["status"] != "ok" for e in results), skipped=skipped, rows=rows, seconds=seconds,
+        rows_per_second=rows / seconds if seconds > 0 else 0.0, files_per_second=len(results) / seconds if seconds > 0 else 0.0,
+    )
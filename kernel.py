@@ -1,13 +1,40 @@
 from __future__ import annotations
 
+from array import array
+from collections import abc, deque
 from dataclasses import dataclass
-from statistics import pstdev
-from typing import Callable, List, Optional, Sequence
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 import math
 
+from umcp.backend import require_numpy, resolve_backend
 from umcp.contract import FrozenContract
-from umcp.tier0 import eps_guard, l2_norm
+from umcp.norms import NormLike, resolve_norm
+from umcp.returns import FULL_HORIZON, ReturnDomain, ReturnIndex, max_return_lag, tau_R_series
+from umcp.tier0 import l2_norm
+
+# Documented agreement between backend="numpy" and the reference path, per metric (see numpy_tolerance).
+# F, ω, S and C are bounded, so an absolute tolerance suffices. κ = Σ ln c_i is unbounded (each term
+# can be as low as ln ε), and a reordered n-term sum of same-signed terms differs by up to about
+# n·u·|κ|, so its tolerance scales with n·|κ|; I = exp(κ) inherits that as a relative error.
+# τR is not subject to these tolerances: both backends return the identical lag.
+NUMPY_ABS_TOL = 1e-12
+NUMPY_KAPPA_REL_TOL = 2.0 ** -52
+
+
+def numpy_tolerance(metric: str, n: int, kappa: float) -> float:
+    """
+    Documented |numpy − reference| bound for one metric of a row with n channels and reference κ.
+
+    NUMPY_ABS_TOL for F, ω, S and C; for κ, NUMPY_ABS_TOL + NUMPY_KAPPA_REL_TOL·n·|κ|; for I, the κ
+    bound taken relative to I = exp(κ) (plus NUMPY_ABS_TOL).
+    """
+    if metric not in ("kappa", "I"):
+        return NUMPY_ABS_TOL
+    dk = NUMPY_KAPPA_REL_TOL * n * abs(kappa)
+    if metric == "kappa":
+        return NUMPY_ABS_TOL + dk
+    return NUMPY_ABS_TOL + math.exp(kappa) * (dk + NUMPY_KAPPA_REL_TOL)
 
 
 @dataclass(frozen=True, slots=True)
@@ -40,11 +67,43 @@ class Tier1Row:
     kappa: float
     I: float
 
+    norm_id: str = "L2"  # τR disclosure: identity of ‖·‖ used for the return search
+    domain_id: str = "full"  # τR disclosure: return-domain generator Dθ and its parameters
+
     @property
     def IC(self) -> float:
         """Alias: canon sometimes labels I as IC in stack summaries."""
         return self.I
 
+    def to_dict(self) -> Dict[str, Any]:
+        # Slots dataclass (no __dict__); fields are listed explicitly in export order.
+        return dict(
+            t=self.t, psi=list(self.psi), weights=list(self.weights), dt=self.dt, h_rec=self.h_rec, eta=self.eta,
+            F=self.F, omega=self.omega, S=self.S, C=self.C, tau_R=self.tau_R, kappa=self.kappa, I=self.I,
+            norm_id=self.norm_id, domain_id=self.domain_id,
+        )
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "Tier1Row":
+        """Inverse of `to_dict`; norm_id and domain_id default to the canon L2 / full horizon."""
+        return cls(
+            t=int(d["t"]),
+            psi=tuple(d["psi"]),
+            weights=tuple(d["weights"]),
+            dt=float(d["dt"]),
+            h_rec=float(d["h_rec"]),
+            eta=float(d["eta"]),
+            F=float(d["F"]),
+            omega=float(d["omega"]),
+            S=float(d["S"]),
+            C=float(d["C"]),
+            tau_R=float(d["tau_R"]),
+            kappa=float(d["kappa"]),
+            I=float(d["I"]),
+            norm_id=str(d.get("norm_id", "L2")),
+            domain_id=str(d.get("domain_id", "full")),
+        )
+
 
 def _normalize_weights(w: Optional[Sequence[float]], n: int) -> List[float]:
     if w is None:
@@ -57,20 +116,61 @@ def _normalize_weights(w: Optional[Sequence[float]], n: int) -> List[float]:
     return [float(x) / s for x in w]
 
 
-def _weighted_bernoulli_entropy(c_eps: Sequence[float], w: Sequence[float]) -> float:
-    total = 0.0
-    for ci, wi in zip(c_eps, w):
-        ci = float(ci)
-        total += wi * (ci * math.log(ci) + (1.0 - ci) * math.log(1.0 - ci))
-    return -total
-
-
 def _curvature_sigma_over_half(c: Sequence[float]) -> float:
-    # pstdev is population standard deviation
-    sigma = pstdev([float(x) for x in c]) if len(c) > 1 else 0.0
+    # Population standard deviation, two-pass with exactly rounded sums (math.fsum).
+    n = len(c)
+    if n < 2:
+        return 0.0
+    mean = math.fsum(c) / n
+    sigma = math.sqrt(math.fsum([(x - mean) * (x - mean) for x in c]) / n)
     return sigma / 0.5
 
 
+def _row_metrics(
+    c: Sequence[float], w: Sequence[float], epsilon: float
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Per-row (F, ω, S, C, κ, I) on an already float-converted Ψ(t).
+
+    Fused single pass: the ε-guard (same clamp as tier0.eps_guard) is applied inline and each
+    ln c_i / ln(1 − c_i) is evaluated once and shared by S and κ. F and κ are accumulated with
+    Neumaier compensation (the algorithm of CPython ≥ 3.12 `sum()` on floats), so they do not depend
+    on the interpreter version.
+    """
+    lo = float(epsilon)
+    hi = 1.0 - lo
+    log = math.log
+    F = 0.0
+    F_err = 0.0
+    H = 0.0
+    kappa = 0.0
+    kappa_err = 0.0
+    for ci, wi in zip(c, w):
+        x = wi * ci
+        s = F + x
+        if abs(F) >= abs(x):
+            F_err += (F - s) + x
+        else:
+            F_err += (x - s) + F
+        F = s
+        ce = ci if ci > lo else lo
+        if not ce < hi:
+            ce = hi
+        ln_c = log(ce)
+        H += wi * (ce * ln_c + (1.0 - ce) * log(1.0 - ce))
+        s = kappa + ln_c
+        if abs(kappa) >= abs(ln_c):
+            kappa_err += (kappa - s) + ln_c
+        else:
+            kappa_err += (ln_c - s) + kappa
+        kappa = s
+    if F_err and math.isfinite(F_err):
+        F += F_err
+    if kappa_err and math.isfinite(kappa_err):
+        kappa += kappa_err
+    return F, 1.0 - F, -H, _curvature_sigma_over_half(c), kappa, math.exp(kappa)
+
+
 def _tau_R_for_index(
     psi_series: Sequence[Sequence[float]],
     t: int,
@@ -78,16 +178,23 @@ def _tau_R_for_index(
     dt: float,
     eta: float,
     h_rec: float,
-    norm: Callable[[Sequence[float], Sequence[float]], float],
+    norm: NormLike,
+    domain: Optional[ReturnDomain] = None,
+    t0: int = 0,
 ) -> float:
+    """
+    Reference τR scan: smallest lag in Dθ(t) (default: every earlier sample within Hrec) whose state
+    is within η. `t0` is the absolute index of psi_series[0], for domains keyed on absolute position.
+    """
     if t <= 0:
         return math.inf
-    max_lag = int(math.floor(h_rec / dt)) if dt > 0 else 0
-    max_lag = max(1, max_lag)
+    max_lag = max_return_lag(dt, h_rec)
+    within = resolve_norm(norm).within
+    lags = range(1, min(t, max_lag) + 1) if domain is None else domain.lags(t0 + t, min(t, max_lag))
     best: Optional[int] = None
-    for lag in range(1, min(t, max_lag) + 1):
+    for lag in lags:
         u = t - lag
-        if norm(psi_series[t], psi_series[u]) < eta:
+        if within(psi_series[t], psi_series[u], eta):
             best = lag
             break
     if best is None:
@@ -95,7 +202,315 @@ def _tau_R_for_index(
     return best * dt
 
 
-def compute_tier1_series(
+def _tau_R_column_numpy(
+    P: Any,
+    psi_series: Sequence[Sequence[float]],
+    *,
+    dt: float,
+    eta: float,
+    h_rec: float,
+    norm: NormLike,
+    domain: Optional[ReturnDomain] = None,
+    local: Any = None,
+    t0: int = 0,
+) -> Any:
+    """
+    τR for every row of a (T, n) array, scanning lags in increasing order for all rows at once.
+
+    `local` optionally gives each row's index within its own trace when several traces are stacked
+    end to end; a row then only looks back `local[t]` rows, never into the previous trace. The
+    absolute index seen by the return domain is t0 + local[t].
+
+    Distances from the norm's `array_distance` are compared to η with a relative guard band; rows
+    that fall inside the band are re-decided with `norm.within`, so the returned lag is identical to
+    the scan path. Norms without an array form fall back to the per-row scan.
+    """
+    np = require_numpy("τR vectorization")
+    nm = resolve_norm(norm)
+    dom = domain if domain is not None else FULL_HORIZON
+    T = P.shape[0]
+    tau = np.full(T, math.inf)
+    max_lag = max_return_lag(dt, h_rec)
+    if not hasattr(nm, "array_distance"):
+        for t in range(T):
+            if local is None:
+                tau[t] = _tau_R_for_index(psi_series, t, dt=dt, eta=eta, h_rec=h_rec, norm=nm, domain=dom, t0=t0)
+            else:
+                back = min(int(local[t]), max_lag)
+                tau[t] = _tau_R_for_index(
+                    psi_series[t - back:t + 1], back, dt=dt, eta=eta, h_rec=h_rec, norm=nm, domain=dom,
+                    t0=t0 + int(local[t]) - back,
+                )
+        return tau
+    if local is None:
+        local = np.arange(T)
+
+    lo, hi = eta * (1.0 - 1e-9), eta * (1.0 + 1e-9)
+    pending = np.flatnonzero(local >= 1)
+    for lag in dom.candidate_lags(min(T - 1, max_lag)):
+        pending = pending[local[pending] >= lag]
+        if pending.size == 0:
+            break
+        mask = dom.lag_mask(t0 + local[pending], lag)
+        rows = pending if mask is None else pending[mask]
+        if rows.size == 0:
+            continue
+        d = nm.array_distance(P[rows] - P[rows - lag])
+        hit = d < lo
+        for k in np.flatnonzero((d >= lo) & (d <= hi)):
+            t = int(rows[k])
+            hit[k] = nm.within(psi_series[t], psi_series[t - lag], eta)
+        if not hit.any():
+            continue
+        tau[rows[hit]] = lag * dt
+        # Drop the rows just resolved: map `hit` back through the domain mask onto `pending`.
+        keep = np.ones(pending.size, dtype=bool)
+        keep[hit if mask is None else np.flatnonzero(mask)[hit]] = False
+        pending = pending[keep]
+    return tau
+
+
+def _metric_columns_numpy(P: Any, W: Any, epsilon: float) -> Dict[str, Any]:
+    """
+    F, ω, S, C, κ, I for every row of a (T, n) float64 array.
+
+    W is a weight vector (n,). Reductions are row-wise sums (not a BLAS matvec), so a row's value
+    does not depend on how many other rows are in the array.
+    """
+    np = require_numpy('backend="numpy"')
+    Pe = np.clip(P, float(epsilon), 1.0 - float(epsilon))
+    ln_c = np.log(Pe)
+    F = (P * W).sum(axis=1)
+    kappa = ln_c.sum(axis=1)
+    return dict(
+        F=F,
+        omega=1.0 - F,
+        S=-((Pe * ln_c + (1.0 - Pe) * np.log(1.0 - Pe)) * W).sum(axis=1),
+        C=P.std(axis=1) / 0.5 if P.shape[1] > 1 else np.zeros(P.shape[0]),
+        kappa=kappa,
+        I=np.exp(kappa),
+    )
+
+
+def _tier1_columns_numpy(
+    psi_series: Sequence[Sequence[float]],
+    *,
+    w: Sequence[float],
+    epsilon: float,
+    dt: float,
+    h_rec: float,
+    eta: float,
+    norm: NormLike,
+    tau_R: Optional[Sequence[float]] = None,
+    domain: Optional[ReturnDomain] = None,
+    t0: int = 0,
+) -> Dict[str, Any]:
+    np = require_numpy('backend="numpy"')
+    P = np.asarray(psi_series, dtype=np.float64)
+    cols = _metric_columns_numpy(P, np.asarray(w, dtype=np.float64), epsilon)
+    cols["psi"] = P
+    cols["tau_R"] = (
+        np.asarray(tau_R, dtype=np.float64)
+        if tau_R is not None
+        else _tau_R_column_numpy(P, psi_series, dt=dt, eta=eta, h_rec=h_rec, norm=norm, domain=domain, t0=t0)
+    )
+    return cols
+
+
+TIER1_COLUMNS = ("F", "omega", "S", "C", "tau_R", "kappa", "I")
+
+
+def _tier1_columns_halo(
+    P: Any,
+    first: int,
+    *,
+    w: Sequence[float],
+    epsilon: float,
+    dt: float,
+    h_rec: float,
+    eta: float,
+    norm: NormLike,
+    engine: str,
+    return_search: str,
+    domain: ReturnDomain,
+    t0: int,
+) -> Dict[str, Any]:
+    """
+    Tier-1 columns for rows P[first:], where P[:first] is a τR halo (at least floor(Hrec/dt) rows
+    unless P starts the trace) that is read for return search only. `t0` is the absolute index of
+    P[0]. P is a float64 (T, n) array for engine="numpy", else a list of row lists. Every returned
+    row is computed by the same code as the whole-trace path, so results are bit-identical.
+    """
+    tau_col: Optional[Sequence[float]] = None
+    if return_search == "index":
+        rows = P.tolist() if engine == "numpy" else P
+        tau_col = tau_R_series(rows, dt=dt, eta=eta, h_rec=h_rec, norm=norm, domain=domain, t0=t0)
+    if engine == "numpy":
+        cols = _tier1_columns_numpy(
+            P, w=w, epsilon=epsilon, dt=dt, h_rec=h_rec, eta=eta, norm=norm, tau_R=tau_col, domain=domain, t0=t0
+        )
+        return {k: cols[k][first:].copy() for k in TIER1_COLUMNS}
+
+    columns = {k: array("d") for k in TIER1_COLUMNS}
+    for local in range(first, len(P)):
+        F, omega, S, C, kappa, I = _row_metrics(P[local], w, epsilon)
+        if tau_col is not None:
+            tau_R = tau_col[local]
+        else:
+            tau_R = _tau_R_for_index(
+                P, local, dt=dt, eta=eta, h_rec=h_rec, norm=norm,
+                domain=None if domain is FULL_HORIZON else domain, t0=t0,
+            )
+        for k, v in zip(TIER1_COLUMNS, (F, omega, S, C, tau_R, kappa, I)):
+            columns[k].append(v)
+    return columns
+
+
+class Tier1Frame(abc.Sequence):
+    """
+    Columnar Tier-1 result: one contiguous column per metric, disclosures stored once.
+
+    Columns are `array('d')` (python backend) or float64 NumPy arrays (numpy backend). `psi` is a
+    reference to the admitted trace that was computed on, not a copy. Indexing returns a lazily
+    built `Tier1Row` view, so the frame can be passed wherever a list of rows is expected
+    (`evaluate_weld`, `classify_regime`, iteration, len, negative indices). `t0` is the absolute
+    index of the frame's first row (nonzero for windows of a longer trace); row views carry t0 + t.
+    """
+
+    __slots__ = ("psi", "weights", "dt", "h_rec", "eta", "norm_id", "domain_id", "columns", "t0")
+
+    def __init__(
+        self,
+        *,
+        psi: Sequence[Sequence[float]],
+        weights: Sequence[float],
+        dt: float,
+        h_rec: float,
+        eta: float,
+        columns: Dict[str, Sequence[float]],
+        norm_id: str = "L2",
+        domain_id: str = "full",
+        t0: int = 0,
+    ) -> None:
+        missing = [k for k in TIER1_COLUMNS if k not in columns]
+        if missing:
+            raise ValueError(f"Tier1Frame is missing columns: {missing}")
+        if any(len(columns[k]) != len(psi) for k in TIER1_COLUMNS):
+            raise ValueError("Tier1Frame columns must have one entry per Ψ(t)")
+        self.psi = psi
+        self.weights = tuple(float(x) for x in weights)
+        self.dt = float(dt)
+        self.h_rec = float(h_rec)
+        self.eta = float(eta)
+        self.norm_id = str(norm_id)
+        self.domain_id = str(domain_id)
+        self.columns = {k: columns[k] for k in TIER1_COLUMNS}
+        self.t0 = int(t0)
+
+    def __len__(self) -> int:
+        return len(self.psi)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self.row(t) for t in range(*index.indices(len(self)))]
+        t = int(index)
+        if t < 0:
+            t += len(self)
+        if not 0 <= t < len(self):
+            raise IndexError("Tier1Frame index out of range")
+        return self.row(t)
+
+    def __repr__(self) -> str:
+        return (
+            f"Tier1Frame(t0={self.t0}, T={len(self)}, n={len(self.weights)}, dt={self.dt}, h_rec={self.h_rec}, "
+            f"eta={self.eta}, norm_id={self.norm_id!r}, domain_id={self.domain_id!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, abc.Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def column(self, name: str) -> Sequence[float]:
+        """Contiguous column for one of TIER1_COLUMNS."""
+        return self.columns[name]
+
+    def extend(self, other: "Tier1Frame") -> None:
+        """
+        Append the rows of `other`, a frame continuing this one (other.t0 == t0 + len, same disclosures).
+
+        Columns grow in place (NumPy columns are reallocated); `psi` is extended in place when it is a
+        list, so a trace list the frame references grows with it.
+        """
+        if other.t0 != self.t0 + len(self):
+            raise ValueError(f"frame starting at t0={other.t0} does not continue rows {self.t0}..{self.t0 + len(self) - 1}")
+        head = (self.weights, self.dt, self.h_rec, self.eta, self.norm_id, self.domain_id)
+        if (other.weights, other.dt, other.h_rec, other.eta, other.norm_id, other.domain_id) != head:
+            raise ValueError("frames disagree on weights/dt/h_rec/eta/norm_id/domain_id")
+        for k in TIER1_COLUMNS:
+            col, more = self.columns[k], other.columns[k]
+            if isinstance(col, array):
+                col.extend(more if isinstance(more, array) else array("d", more))
+            else:
+                np = require_numpy("Tier1Frame.extend")
+                self.columns[k] = np.concatenate([np.asarray(col, dtype=np.float64), np.asarray(more, dtype=np.float64)])
+        if isinstance(self.psi, list):
+            self.psi.extend(other.psi)
+        else:
+            self.psi = list(self.psi) + list(other.psi)
+
+    def row(self, t: int) -> Tier1Row:
+        """Materialize the Tier1Row view for index t (0 ≤ t < len); its `t` is t0 + t."""
+        cols = self.columns
+        return Tier1Row(
+            t=self.t0 + t,
+            psi=tuple(float(x) for x in self.psi[t]),
+            weights=self.weights,
+            dt=self.dt,
+            h_rec=self.h_rec,
+            eta=self.eta,
+            F=float(cols["F"][t]),
+            omega=float(cols["omega"][t]),
+            S=float(cols["S"][t]),
+            C=float(cols["C"][t]),
+            tau_R=float(cols["tau_R"][t]),
+            kappa=float(cols["kappa"][t]),
+            I=float(cols["I"][t]),
+            norm_id=self.norm_id,
+            domain_id=self.domain_id,
+        )
+
+    def to_rows(self) -> List[Tier1Row]:
+        return [self.row(t) for t in range(len(self))]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tier1Row]) -> "Tier1Frame":
+        """Pack row objects (e.g. parsed from JSON) into a frame; rows must share their disclosures."""
+        if not rows:
+            raise ValueError("rows is empty")
+        head = rows[0]
+        for r in rows:
+            if _disclosures(r) != _disclosures(head):
+                raise ValueError("rows disagree on weights/dt/h_rec/eta/norm_id/domain_id; cannot share one frame header")
+        return cls(
+            psi=[r.psi for r in rows],
+            weights=head.weights,
+            dt=head.dt,
+            h_rec=head.h_rec,
+            eta=head.eta,
+            columns={k: array("d", (getattr(r, k) for r in rows)) for k in TIER1_COLUMNS},
+            norm_id=head.norm_id,
+            domain_id=head.domain_id,
+        )
+
+
+def _disclosures(r: Tier1Row) -> Tuple[Any, ...]:
+    return (r.weights, r.dt, r.h_rec, r.eta, r.norm_id, r.domain_id)
+
+
+def compute_tier1_frame(
     psi_series: Sequence[Sequence[float]],
     *,
     contract: FrozenContract,
@@ -103,61 +518,317 @@ def compute_tier1_series(
     dt: float,
     h_rec: float,
     eta: Optional[float] = None,
-    norm: Callable[[Sequence[float], Sequence[float]], float] = l2_norm,
-) -> List[Tier1Row]:
+    norm: NormLike = l2_norm,
+    backend: str = "python",
+    return_search: str = "scan",
+    workers: Optional[int] = None,
+    domain: Optional[ReturnDomain] = None,
+    halo: Optional[Sequence[Sequence[float]]] = None,
+    t0: int = 0,
+) -> Tier1Frame:
     """
-    Compute Tier-1 rows for a discrete admitted trace.
+    Compute Tier-1 metrics for a discrete admitted trace into a columnar Tier1Frame.
 
     - psi_series must already be face-policy admitted: each channel in [0,1].
-    - dt, h_rec, norm, eta must be disclosed for τR to be reproducible.
+    - dt, h_rec, norm, eta must be disclosed for τR to be reproducible. `norm` is a registered norm id
+      ("L1", "L2", "Linf", ...), a `umcp.norms.Norm`, or a distance callable with a `norm_id` attribute;
+      its `norm_id` is recorded on the frame and every row.
+    - domain is the return-domain generator Dθ (`umcp.returns`: FullHorizon (default), StridedDomain,
+      PhaseLockedDomain, KeyframeDomain); its `domain_id` is recorded like the norm identity.
+    - backend selects the engine: "python" (reference), "numpy" (vectorized over the (T, n) trace)
+      or "auto" (NumPy when installed). The NumPy engine applies the same ε-guard and weight
+      normalization; F, ω, S, C, κ, I agree with the reference within `numpy_tolerance` (absolute for
+      F, ω, S, C; scaled by n·|κ| for κ and I) and τR is identical.
+    - return_search selects the τR finder: "scan" (reference lag scan) or "index" (returns.ReturnIndex,
+      L2/L∞ norms only). Both return the identical smallest lag.
+    - workers > 1 splits the trace into chunks computed by a process pool (see `umcp.parallel`); each
+      chunk reads an extra floor(Hrec/dt) halo for τR, so results are bit-identical to the serial path.
+    - t0 is the absolute index of psi_series[0] (rows are numbered from it) and `halo` the admitted
+      rows immediately before it, read for τR only (at least floor(Hrec/dt) of them, or all earlier
+      rows). Computing a trace in pieces this way gives the same rows as computing it whole; `workers`
+      is ignored for such a continuation.
     """
-    if not psi_series:
+    if len(psi_series) == 0:
         raise ValueError("psi_series is empty")
     n = len(psi_series[0])
     for v in psi_series:
         if len(v) != n:
             raise ValueError("psi_series must have constant dimension n")
+    halo = [] if halo is None else halo
+    if len(halo) > int(t0):
+        raise ValueError("halo is longer than the t0 rows before psi_series")
+    if any(len(v) != n for v in halo):
+        raise ValueError("psi_series must have constant dimension n")
 
     w = _normalize_weights(weights, n)
     eta_val = float(eta) if eta is not None else float(contract.eta)
+    if return_search not in ("scan", "index"):
+        raise ValueError("return_search must be 'scan' or 'index'")
+    engine = resolve_backend(backend)
+    norm = resolve_norm(norm)
+    dom = domain if domain is not None else FULL_HORIZON
+    header = dict(
+        psi=psi_series, weights=w, dt=dt, h_rec=h_rec, eta=eta_val, norm_id=norm.norm_id, domain_id=dom.domain_id
+    )
 
-    out: List[Tier1Row] = []
-    for t, psi in enumerate(psi_series):
-        c = [float(x) for x in psi]
-        c_eps = eps_guard(c, contract.epsilon)
-
-        F = sum(wi * ci for wi, ci in zip(w, c))
-        omega = 1.0 - F
-        S = _weighted_bernoulli_entropy(c_eps, w)
-        C = _curvature_sigma_over_half(c)
-
-        tau_R = _tau_R_for_index(
-            psi_series,
-            t,
-            dt=dt,
-            eta=eta_val,
-            h_rec=h_rec,
-            norm=norm,
+    if halo or t0:
+        rows = [[float(x) for x in v] for v in halo] + [[float(x) for x in v] for v in psi_series]
+        if engine == "numpy":
+            np = require_numpy('backend="numpy"')
+            rows = np.asarray(rows, dtype=np.float64)
+        cols = _tier1_columns_halo(
+            rows, len(halo), w=w, epsilon=contract.epsilon, dt=dt, h_rec=h_rec, eta=eta_val, norm=norm,
+            engine=engine, return_search=return_search, domain=dom, t0=int(t0) - len(halo),
+        )
+        return Tier1Frame(columns=cols, t0=int(t0), **header)
+
+    if workers is not None and workers > 1:
+        from umcp.parallel import MIN_CHUNK_ROWS, tier1_columns_parallel
+
+        if len(psi_series) > MIN_CHUNK_ROWS:
+            cols = tier1_columns_parallel(
+                psi_series, n=n, w=w, epsilon=contract.epsilon, dt=dt, h_rec=h_rec, eta=eta_val,
+                norm=norm, backend=engine, return_search=return_search, workers=int(workers), domain=dom,
+            )
+            return Tier1Frame(columns=cols, **header)
+
+    tau_col: Optional[Sequence[float]] = None
+    if return_search == "index":
+        tau_col = tau_R_series(psi_series, dt=dt, eta=eta_val, h_rec=h_rec, norm=norm, domain=dom)
+
+    if engine == "numpy":
+        cols = _tier1_columns_numpy(
+            psi_series, w=w, epsilon=contract.epsilon, dt=dt, h_rec=h_rec, eta=eta_val, norm=norm,
+            tau_R=tau_col, domain=dom,
         )
+        del cols["psi"]
+        return Tier1Frame(columns=cols, **header)
 
-        kappa = sum(math.log(ci) for ci in c_eps)
-        I = math.exp(kappa)
+    columns = {k: array("d") for k in TIER1_COLUMNS}
+    F_col, omega_col, S_col, C_col = columns["F"], columns["omega"], columns["S"], columns["C"]
+    tau_out, kappa_col, I_col = columns["tau_R"], columns["kappa"], columns["I"]
+    for t, psi in enumerate(psi_series):
+        c = [float(x) for x in psi]
+        F, omega, S, C, kappa, I = _row_metrics(c, w, contract.epsilon)
 
-        out.append(
-            Tier1Row(
-                t=t,
-                psi=tuple(c),
-                weights=tuple(w),
-                dt=float(dt),
-                h_rec=float(h_rec),
+        if tau_col is not None:
+            tau_R = tau_col[t]
+        else:
+            tau_R = _tau_R_for_index(
+                psi_series,
+                t,
+                dt=dt,
                 eta=eta_val,
-                F=float(F),
-                omega=float(omega),
-                S=float(S),
-                C=float(C),
-                tau_R=float(tau_R),
-                kappa=float(kappa),
-                I=float(I),
+                h_rec=h_rec,
+                norm=norm,
+                domain=None if dom is FULL_HORIZON else dom,
             )
+
+        F_col.append(F)
+        omega_col.append(omega)
+        S_col.append(S)
+        C_col.append(C)
+        tau_out.append(tau_R)
+        kappa_col.append(kappa)
+        I_col.append(I)
+    return Tier1Frame(columns=columns, **header)
+
+
+def compute_tier1_series(
+    psi_series: Sequence[Sequence[float]],
+    *,
+    contract: FrozenContract,
+    weights: Optional[Sequence[float]] = None,
+    dt: float,
+    h_rec: float,
+    eta: Optional[float] = None,
+    norm: NormLike = l2_norm,
+    backend: str = "python",
+    return_search: str = "scan",
+    workers: Optional[int] = None,
+    domain: Optional[ReturnDomain] = None,
+) -> List[Tier1Row]:
+    """
+    Compute Tier-1 rows for a discrete admitted trace.
+
+    Row-object form of `compute_tier1_frame` (same parameters, same values). Prefer the frame for
+    long traces: it stores disclosures once and one contiguous column per metric.
+    """
+    return compute_tier1_frame(
+        psi_series,
+        contract=contract,
+        weights=weights,
+        dt=dt,
+        h_rec=h_rec,
+        eta=eta,
+        norm=norm,
+        backend=backend,
+        return_search=return_search,
+        workers=workers,
+        domain=domain,
+    ).to_rows()
+
+
+def iter_tier1_windows(
+    windows: Iterable[Sequence[Sequence[float]]],
+    *,
+    contract: FrozenContract,
+    weights: Optional[Sequence[float]] = None,
+    dt: float,
+    h_rec: float,
+    eta: Optional[float] = None,
+    norm: NormLike = l2_norm,
+    backend: str = "python",
+    return_search: str = "scan",
+    domain: Optional[ReturnDomain] = None,
+) -> Iterator[Tier1Frame]:
+    """
+    Compute Tier-1 frames over a trace delivered as consecutive windows of rows.
+
+    Windows may come from any reader (e.g. `umcp.traceio.iter_trace_windows`) and may have any
+    sizes. The last floor(Hrec/dt) rows are carried over as a τR halo, so each yielded frame (with
+    `t0` set to its absolute start) holds exactly the values `compute_tier1_frame` gives for those
+    rows of the whole trace. Memory is bounded by one window plus the halo.
+    """
+    if return_search not in ("scan", "index"):
+        raise ValueError("return_search must be 'scan' or 'index'")
+    engine = resolve_backend(backend)
+    nm = resolve_norm(norm)
+    dom = domain if domain is not None else FULL_HORIZON
+    eta_val = float(eta) if eta is not None else float(contract.eta)
+    max_lag = max_return_lag(dt, h_rec)
+    np = require_numpy('backend="numpy"') if engine == "numpy" else None
+
+    w: Optional[List[float]] = None
+    halo: Any = None
+    start = 0
+    for block in windows:
+        if len(block) == 0:
+            continue
+        if engine == "numpy":
+            B = np.asarray(block, dtype=np.float64)
+            P = B if halo is None or len(halo) == 0 else np.concatenate([halo, B])
+        else:
+            B = [[float(x) for x in row] for row in block]
+            P = B if halo is None else halo + B
+        n = len(P[0])
+        if w is None:
+            w = _normalize_weights(weights, n)
+        if any(len(row) != n for row in B):
+            raise ValueError("psi_series must have constant dimension n")
+        first = len(P) - len(B)
+        cols = _tier1_columns_halo(
+            P, first, w=w, epsilon=contract.epsilon, dt=dt, h_rec=h_rec, eta=eta_val, norm=nm,
+            engine=engine, return_search=return_search, domain=dom, t0=start - first,
+        )
+        yield Tier1Frame(
+            psi=B, weights=w, dt=dt, h_rec=h_rec, eta=eta_val, columns=cols,
+            norm_id=nm.norm_id, domain_id=dom.domain_id, t0=start,
+        )
+        halo = P[max(0, len(P) - max_lag):] if max_lag > 0 else P[:0]
+        start += len(B)
+    if halo is None:
+        raise ValueError("psi_series is empty")
+
+
+class IncrementalKernel:
+    """
+    Streaming Tier-1 kernel: consumes Ψ(t) one sample at a time and emits its Tier1Row immediately.
+
+    Only the last floor(Hrec/dt) states are retained (ring buffer) for the τR search, so memory is
+    constant in the length of the run. Rows are identical to `compute_tier1_series` on the same trace.
+    """
+
+    def __init__(
+        self,
+        *,
+        contract: FrozenContract,
+        weights: Optional[Sequence[float]] = None,
+        dt: float,
+        h_rec: float,
+        eta: Optional[float] = None,
+        norm: NormLike = l2_norm,
+        return_search: str = "scan",
+        domain: Optional[ReturnDomain] = None,
+    ) -> None:
+        if return_search not in ("scan", "index"):
+            raise ValueError("return_search must be 'scan' or 'index'")
+        self.contract = contract
+        self.dt = float(dt)
+        self.h_rec = float(h_rec)
+        self.eta = float(eta) if eta is not None else float(contract.eta)
+        self.norm = resolve_norm(norm)
+        self.domain = domain if domain is not None else FULL_HORIZON
+        self.max_lag = max_return_lag(dt, h_rec)
+        self._raw_weights = weights
+        self._w: Optional[Tuple[float, ...]] = None
+        self._n: Optional[int] = None
+        self._t = 0
+        self._buffer: Deque[Tuple[float, ...]] = deque(maxlen=self.max_lag)
+        self._index: Optional[ReturnIndex] = (
+            ReturnIndex(eta=self.eta, max_lag=self.max_lag, norm=self.norm, domain=self.domain)
+            if return_search == "index"
+            else None
+        )
+
+    @property
+    def t(self) -> int:
+        """Index that the next pushed sample will receive."""
+        return self._t
+
+    @property
+    def weights(self) -> Optional[Tuple[float, ...]]:
+        """Normalized weights (None until the first sample fixes the dimension n)."""
+        return self._w
+
+    def _tau_R(self, c: Tuple[float, ...]) -> float:
+        if self._index is not None:
+            lag = self._index.query(self._t, c)
+            self._index.insert(self._t, c)
+            return math.inf if lag is None else lag * self.dt
+        buf = self._buffer
+        within = self.norm.within
+        for lag in self.domain.lags(self._t, len(buf)):
+            if within(c, buf[-lag], self.eta):
+                return lag * self.dt
+        return math.inf
+
+    def push(self, psi: Sequence[float]) -> Tier1Row:
+        """Admit Ψ(t) for the next t and return its Tier-1 row."""
+        c = tuple(float(x) for x in psi)
+        w = self._w
+        if w is None:
+            self._n = len(c)
+            w = self._w = tuple(_normalize_weights(self._raw_weights, self._n))
+        elif len(c) != self._n:
+            raise ValueError("psi_series must have constant dimension n")
+
+        F, omega, S, C, kappa, I = _row_metrics(c, w, self.contract.epsilon)
+        tau_R = self._tau_R(c)
+        if self._index is None:
+            # The ReturnIndex keeps its own copy of the last max_lag states.
+            self._buffer.append(c)
+
+        row = Tier1Row(
+            t=self._t,
+            psi=c,
+            weights=w,
+            dt=self.dt,
+            h_rec=self.h_rec,
+            eta=self.eta,
+            F=float(F),
+            omega=float(omega),
+            S=float(S),
+            C=float(C),
+            tau_R=float(tau_R),
+            kappa=float(kappa),
+            I=float(I),
+            norm_id=self.norm.norm_id,
+            domain_id=self.domain.domain_id,
         )
-    return out
+        self._t += 1
+        return row
+
+    def extend(self, psi_series: Iterable[Sequence[float]]) -> List[Tier1Row]:
+        """Push every sample of an iterable; convenience for replaying a recorded trace."""
+        return [self.push(psi) for psi in psi_series]
@@ -27,6 +27,11 @@ def canonical_json(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
+def sha256_canonical(obj: Any) -> str:
+    """SHA256 hex digest of `canonical_json(obj)` (UTF-8), the identity used for manifest provenance."""
+    return hashlib.sha256(canonical_json(obj).encode("utf-8")).hexdigest()
+
+
 @dataclass(frozen=True, slots=True)
 class Manifest:
     """
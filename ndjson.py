@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import json
+
+from umcp.contract import FrozenContract
+from umcp.kernel import TIER1_COLUMNS, Tier1Row
+from umcp.regime import RegimeResult
+
+NDJSON_FORMAT = "umcp-ndjson/1"
+
+# Rows buffered before one write() to the underlying stream.
+DEFAULT_BUFFER_ROWS = 1024
+
+# Run-level disclosures carried by every Tier1Row; written once in the header.
+_DISCLOSURES = ("weights", "dt", "h_rec", "eta", "norm_id", "domain_id")
+
+_float_repr = float.__repr__
+_COLUMN_KEYS = tuple(f'"{k}":' for k in TIER1_COLUMNS)
+
+
+def _num(x: float) -> str:
+    """JSON number text for a float; same digits as `json.dumps` (shortest repr, so it round-trips)."""
+    if x - x == 0.0:
+        return _float_repr(x)
+    if x != x:
+        return "NaN"
+    return "Infinity" if x > 0 else "-Infinity"
+
+
+def _nums(xs: Iterable[float]) -> str:
+    return "[" + ",".join(map(_num, xs)) + "]"
+
+
+def _disclosures(row: Tier1Row) -> Tuple[Any, ...]:
+    return (row.weights, row.dt, row.h_rec, row.eta, row.norm_id, row.domain_id)
+
+
+class NDJSONWriter:
+    """
+    Newline-delimited JSON export of Tier-1 rows, one record per t, in bounded memory.
+
+    The first line is a header record {"format", "contract", "freeze", ...} holding the contract
+    snapshot and the run disclosures (weights, dt, Hrec, η, norm and domain ids) taken from the first
+    row; row records then carry only t, Ψ(t), the kernel columns and, when given, the regime label.
+    A row whose disclosures differ from the header is rejected. Lines are formatted directly
+    (floats via their shortest repr, so values read back exactly) and written `buffer_rows` at a time.
+    """
+
+    __slots__ = ("stream", "contract", "meta", "buffer_rows", "rows_written", "_buf", "_header", "_closed")
+
+    def __init__(
+        self,
+        stream: IO[str],
+        *,
+        contract: Optional[FrozenContract] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        buffer_rows: int = DEFAULT_BUFFER_ROWS,
+    ) -> None:
+        if int(buffer_rows) < 1:
+            raise ValueError("buffer_rows must be >= 1")
+        self.stream = stream
+        self.contract = contract
+        self.meta = dict(meta or {})
+        self.buffer_rows = int(buffer_rows)
+        self.rows_written = 0
+        self._buf: List[str] = []
+        self._header: Optional[Tuple[Any, ...]] = None
+        self._closed = False
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _write_header(self, row: Optional[Tier1Row]) -> None:
+        freeze = None if row is None else dict(zip(_DISCLOSURES, _disclosures(row)))
+        if freeze is not None:
+            freeze["weights"] = list(row.weights)
+        header: Dict[str, Any] = dict(
+            format=NDJSON_FORMAT,
+            contract=None if self.contract is None else self.contract.snapshot_dict(),
+            freeze=freeze,
+        )
+        header.update(self.meta)
+        self._buf.append(json.dumps(header, ensure_ascii=False) + "\n")
+        self._header = () if row is None else _disclosures(row)
+
+    def write_row(self, row: Tier1Row, regime: Optional[RegimeResult] = None) -> None:
+        if self._closed:
+            raise ValueError("write to a closed NDJSONWriter")
+        if self._header is None:
+            self._write_header(row)
+        elif _disclosures(row) != self._header:
+            raise ValueError(f"row t={row.t} disclosures differ from the NDJSON header")
+        parts = [f'{{"t":{row.t:d},"psi":', _nums(row.psi)]
+        for key, name in zip(_COLUMN_KEYS, TIER1_COLUMNS):
+            parts.append(",")
+            parts.append(key)
+            parts.append(_num(getattr(row, name)))
+        if regime is not None:
+            parts.append(
+                f',"regime":"{regime.regime}","phi":"{regime.phi}","critical":{"true" if regime.critical else "false"}'
+            )
+        parts.append("}\n")
+        self._buf.append("".join(parts))
+        self.rows_written += 1
+        if len(self._buf) >= self.buffer_rows:
+            self.flush()
+
+    def write_rows(self, rows: Iterable[Tier1Row], regimes: Optional[Iterable[RegimeResult]] = None) -> int:
+        """Write rows (paired with `regimes` when given); returns the number written."""
+        before = self.rows_written
+        if regimes is None:
+            for row in rows:
+                self.write_row(row)
+        else:
+            for row, regime in zip(rows, regimes):
+                self.write_row(row, regime)
+        return self.rows_written - before
+
+    def flush(self) -> None:
+        if self._buf:
+            self.stream.write("".join(self._buf))
+            self._buf.clear()
+        flush = getattr(self.stream, "flush", None)
+        if flush is not None:
+            flush()
+
+    def close(self) -> None:
+        """Flush buffered lines (writing a header with `freeze: null` if no row was written). The stream stays open."""
+        if self._closed:
+            return
+        if self._header is None:
+            self._write_header(None)
+        self.flush()
+        self._closed = True
+
+
+def read_ndjson(lines: Iterable[str]) -> Tuple[Dict[str, Any], Iterator[Tuple[Tier1Row, Optional[RegimeResult]]]]:
+    """
+    Parse an NDJSON export: returns the header record and a lazy iterator of (Tier1Row, regime or None).
+
+    Rows are rebuilt with the header's disclosures, so they compare equal to the rows written.
+    """
+    it = (ln for ln in lines if ln.strip())
+    first = next(it, None)
+    if first is None:
+        raise ValueError("empty NDJSON export (no header record)")
+    header = json.loads(first)
+    if header.get("format") != NDJSON_FORMAT:
+        raise ValueError(f"not a {NDJSON_FORMAT} export")
+    freeze = header.get("freeze") or {}
+
+    def rows() -> Iterator[Tuple[Tier1Row, Optional[RegimeResult]]]:
+        weights = tuple(float(w) for w in freeze.get("weights", ()))
+        for ln in it:
+            rec = json.loads(ln)
+            row = Tier1Row(
+                t=int(rec["t"]),
+                psi=tuple(float(x) for x in rec["psi"]),
+                weights=weights,
+                dt=freeze["dt"],
+                h_rec=freeze["h_rec"],
+                eta=freeze["eta"],
+                norm_id=freeze["norm_id"],
+                domain_id=freeze["domain_id"],
+                **{k: float(rec[k]) for k in TIER1_COLUMNS},
+            )
+            regime = (
+                RegimeResult(regime=rec["regime"], phi=rec["phi"], critical=bool(rec["critical"]))
+                if "regime" in rec
+                else None
+            )
+            yield row, regime
+
+    return header, rows()
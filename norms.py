@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Protocol, Sequence, Tuple
+
+import math
+
+from umcp.backend import np
+from umcp.tier0 import l2_norm, linf_norm
+
+# Relative band around η inside which an early-exit or vectorized decision is re-checked exactly.
+_GUARD = 1e-6
+
+
+class Norm(Protocol):
+    """
+    Declared distance ‖Ψ(t) − Ψ(u)‖ for the τR return search.
+
+    The norm identity is part of the τR disclosure; `norm_id` is what gets exported.
+    `within(a, b, eta)` must return exactly `self(a, b) < eta`, but may stop early.
+    """
+
+    norm_id: str
+
+    def __call__(self, a: Sequence[float], b: Sequence[float]) -> float: ...
+
+    def within(self, a: Sequence[float], b: Sequence[float], eta: float) -> bool: ...
+
+    def distances(self, x: Sequence[float], Y: Sequence[Sequence[float]]) -> Any: ...
+
+
+class _NormBase:
+    """Shared `distances` for the built-in norms: NumPy row-wise when Y is an array, else a loop."""
+
+    __slots__ = ()
+
+    def distances(self, x: Sequence[float], Y: Sequence[Sequence[float]]) -> Any:
+        """
+        ‖x − y‖ for every candidate y in Y.
+
+        Returns a list of floats, or a float64 array when Y is a NumPy array. Array results may differ
+        from `__call__` in the last bits; use `within` for threshold decisions.
+        """
+        if np is not None and isinstance(Y, np.ndarray):
+            return self.array_distance(Y - np.asarray(x, dtype=np.float64))  # type: ignore[attr-defined]
+        return [self(x, y) for y in Y]  # type: ignore[operator]
+
+
+@dataclass(frozen=True, slots=True)
+class L2Norm(_NormBase):
+    """‖d‖₂ = sqrt(Σ d_i²) (canon default; same values as tier0.l2_norm)."""
+
+    @property
+    def norm_id(self) -> str:
+        return "L2"
+
+    def __call__(self, a: Sequence[float], b: Sequence[float]) -> float:
+        return l2_norm(a, b)
+
+    def within(self, a: Sequence[float], b: Sequence[float], eta: float) -> bool:
+        eta = float(eta)
+        if eta <= 0.0:
+            return False
+        eta2 = eta * eta
+        cut = eta2 * (1.0 + _GUARD)
+        acc = 0.0
+        for x, y in zip(a, b):
+            d = float(x) - float(y)
+            acc += d * d
+            if acc > cut:
+                return False
+        if acc < eta2 * (1.0 - _GUARD):
+            return True
+        return self(a, b) < eta
+
+    def array_distance(self, diff: Any) -> Any:
+        return np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+
+@dataclass(frozen=True, slots=True)
+class L1Norm(_NormBase):
+    """‖d‖₁ = Σ |d_i|."""
+
+    @property
+    def norm_id(self) -> str:
+        return "L1"
+
+    def __call__(self, a: Sequence[float], b: Sequence[float]) -> float:
+        return sum(abs(float(x) - float(y)) for x, y in zip(a, b))
+
+    def within(self, a: Sequence[float], b: Sequence[float], eta: float) -> bool:
+        eta = float(eta)
+        if eta <= 0.0:
+            return False
+        cut = eta * (1.0 + _GUARD)
+        acc = 0.0
+        for x, y in zip(a, b):
+            acc += abs(float(x) - float(y))
+            if acc > cut:
+                return False
+        if acc < eta * (1.0 - _GUARD):
+            return True
+        return self(a, b) < eta
+
+    def array_distance(self, diff: Any) -> Any:
+        return np.abs(diff).sum(axis=1)
+
+
+@dataclass(frozen=True, slots=True)
+class LinfNorm(_NormBase):
+    """‖d‖∞ = max |d_i| (same values as tier0.linf_norm)."""
+
+    @property
+    def norm_id(self) -> str:
+        return "Linf"
+
+    def __call__(self, a: Sequence[float], b: Sequence[float]) -> float:
+        return linf_norm(a, b)
+
+    def within(self, a: Sequence[float], b: Sequence[float], eta: float) -> bool:
+        eta = float(eta)
+        for x, y in zip(a, b):
+            if not abs(float(x) - float(y)) < eta:
+                return False
+        return 0.0 < eta
+
+    def array_distance(self, diff: Any) -> Any:
+        if diff.shape[1] == 0:
+            return np.zeros(diff.shape[0])
+        return np.abs(diff).max(axis=1)
+
+
+@dataclass(frozen=True, slots=True)
+class WeightedL2Norm(_NormBase):
+    """‖d‖_w = sqrt(Σ w_i d_i²) with declared (unnormalized) channel weights w_i ≥ 0."""
+
+    weights: Tuple[float, ...]
+
+    def __post_init__(self) -> None:
+        w = tuple(float(x) for x in self.weights)
+        if any(x < 0.0 for x in w):
+            raise ValueError("WeightedL2Norm weights must be nonnegative")
+        object.__setattr__(self, "weights", w)
+
+    @property
+    def norm_id(self) -> str:
+        return "WeightedL2(w=" + ",".join(f"{x:g}" for x in self.weights) + ")"
+
+    def __call__(self, a: Sequence[float], b: Sequence[float]) -> float:
+        return math.sqrt(sum(wi * (float(x) - float(y)) ** 2 for wi, x, y in zip(self.weights, a, b)))
+
+    def within(self, a: Sequence[float], b: Sequence[float], eta: float) -> bool:
+        eta = float(eta)
+        if eta <= 0.0:
+            return False
+        eta2 = eta * eta
+        cut = eta2 * (1.0 + _GUARD)
+        acc = 0.0
+        for wi, x, y in zip(self.weights, a, b):
+            d = float(x) - float(y)
+            acc += wi * d * d
+            if acc > cut:
+                return False
+        if acc < eta2 * (1.0 - _GUARD):
+            return True
+        return self(a, b) < eta
+
+    def array_distance(self, diff: Any) -> Any:
+        return np.sqrt((diff * diff) @ np.asarray(self.weights, dtype=np.float64))
+
+
+@dataclass(frozen=True, slots=True)
+class CallableNorm:
+    """
+    Adapter for an arbitrary distance callable; no early exit.
+
+    The norm identity is part of the τR disclosure, so it must be declared: pass `norm_id`, or give
+    the callable a `norm_id` attribute. A function's `__name__` (e.g. "<lambda>") is not an identity.
+    """
+
+    fn: Callable[[Sequence[float], Sequence[float]], float]
+    norm_id: str = ""
+
+    def __post_init__(self) -> None:
+        nid = self.norm_id or getattr(self.fn, "norm_id", "")
+        if not isinstance(nid, str) or not nid:
+            raise ValueError("a callable norm needs an explicit norm_id (CallableNorm(fn, norm_id=...) or fn.norm_id)")
+        object.__setattr__(self, "norm_id", nid)
+
+    def __call__(self, a: Sequence[float], b: Sequence[float]) -> float:
+        return float(self.fn(a, b))
+
+    def within(self, a: Sequence[float], b: Sequence[float], eta: float) -> bool:
+        return self.fn(a, b) < eta
+
+    def distances(self, x: Sequence[float], Y: Sequence[Sequence[float]]) -> List[float]:
+        return [float(self.fn(x, y)) for y in Y]
+
+
+NORMS: Dict[str, Norm] = {n.norm_id: n for n in (L1Norm(), L2Norm(), LinfNorm())}
+
+# Plain tier0 functions map onto their registered norms so callers passing them keep the same identity.
+_FUNCTION_ALIASES: Dict[Callable[..., float], str] = {l2_norm: "L2", linf_norm: "Linf"}
+
+NormLike = str | Norm | Callable[[Sequence[float], Sequence[float]], float]
+
+
+def register_norm(norm: Norm) -> Norm:
+    """Register a norm under its `norm_id` (e.g. a frozen WeightedL2Norm); ids must be unique."""
+    existing = NORMS.get(norm.norm_id)
+    if existing is not None and existing != norm:
+        raise ValueError(f"norm id {norm.norm_id!r} is already registered")
+    NORMS[norm.norm_id] = norm
+    return norm
+
+
+def get_norm(norm_id: str) -> Norm:
+    try:
+        return NORMS[norm_id]
+    except KeyError:
+        raise KeyError(f"unknown norm id {norm_id!r}; registered: {sorted(NORMS)}") from None
+
+
+def resolve_norm(norm: NormLike) -> Norm:
+    """
+    Turn a norm id, Norm object or plain distance callable into a Norm.
+
+    tier0.l2_norm / tier0.linf_norm resolve to the registered L2 / Linf norms; any other callable is
+    wrapped in CallableNorm and must carry a `norm_id` attribute (ValueError otherwise).
+    """
+    if isinstance(norm, str):
+        return get_norm(norm)
+    if hasattr(norm, "within") and hasattr(norm, "norm_id"):
+        return norm  # type: ignore[return-value]
+    for fn, alias in _FUNCTION_ALIASES.items():
+        if norm is fn:
+            return NORMS[alias]
+    return CallableNorm(norm)  # type: ignore[arg-type]
+
+
+def norm_id(norm: NormLike) -> str:
+    """Identity string to export alongside τR (dt, Hrec, η, norm)."""
+    return resolve_norm(norm).norm_id
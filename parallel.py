@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import math
+import sys
+
+from umcp.backend import np
+from umcp.kernel import TIER1_COLUMNS, _tier1_columns_halo
+from umcp.norms import Norm
+from umcp.returns import ReturnDomain, max_return_lag
+
+# A chunk smaller than this many rows is not worth a process hop.
+MIN_CHUNK_ROWS = 2048
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Pool workers share the parent's resource tracker; the parent owns (and unlinks) the segment.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _chunk_worker(
+    shm_name: str,
+    T: int,
+    n: int,
+    start: int,
+    stop: int,
+    params: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Compute Tier-1 columns for rows [start, stop) of the shared trace.
+
+    The worker also reads the halo [start − floor(Hrec/dt), start) so every τR lag the serial scan
+    would visit is present; halo rows contribute to τR only and are not returned.
+    """
+    shm = _attach(shm_name)
+    flat: Optional[memoryview] = None
+    try:
+        h0 = max(0, start - max_return_lag(params["dt"], params["h_rec"]))
+        if params["backend"] == "numpy":
+            P = np.ndarray((T, n), dtype=np.float64, buffer=shm.buf)[h0:stop]
+        else:
+            flat = shm.buf.cast("d")
+            P = [flat[i * n:(i + 1) * n].tolist() for i in range(h0, stop)]
+        out = _tier1_columns_halo(
+            P, start - h0, w=params["w"], epsilon=params["epsilon"], dt=params["dt"], h_rec=params["h_rec"],
+            eta=params["eta"], norm=params["norm"], engine=params["backend"],
+            return_search=params["return_search"], domain=params["domain"], t0=h0,
+        )
+        del P
+        return out
+    finally:
+        if flat is not None:
+            flat.release()
+        shm.close()
+
+
+def _chunks(T: int, workers: int) -> List[Tuple[int, int]]:
+    size = max(MIN_CHUNK_ROWS, math.ceil(T / (4 * workers)))
+    return [(s, min(T, s + size)) for s in range(0, T, size)]
+
+
+def tier1_columns_parallel(
+    psi_series: Sequence[Sequence[float]],
+    *,
+    n: int,
+    w: Sequence[float],
+    epsilon: float,
+    dt: float,
+    h_rec: float,
+    eta: float,
+    norm: Norm,
+    backend: str,
+    return_search: str,
+    workers: int,
+    domain: ReturnDomain,
+) -> Dict[str, Any]:
+    """
+    Tier-1 columns computed by a process pool over contiguous chunks of the trace.
+
+    Ψ is copied once into a float64 `multiprocessing.shared_memory` block that workers attach to;
+    only chunk bounds and frozen parameters are pickled. Every row is computed by the same code as
+    the serial path, so the columns are bit-identical and in order. `norm` must be picklable
+    (a built-in Norm, or a CallableNorm over a module-level function).
+    """
+    T = len(psi_series)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, T * n * 8))
+    try:
+        if backend == "numpy":
+            np.ndarray((T, n), dtype=np.float64, buffer=shm.buf)[:] = np.asarray(psi_series, dtype=np.float64)
+        else:
+            flat = shm.buf.cast("d")
+            for t, psi in enumerate(psi_series):
+                flat[t * n:(t + 1) * n] = array("d", (float(x) for x in psi))
+            flat.release()
+
+        params = dict(
+            w=list(w), epsilon=float(epsilon), dt=dt, h_rec=h_rec, eta=eta, norm=norm,
+            backend=backend, return_search=return_search, domain=domain,
+        )
+        bounds = _chunks(T, workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(
+                pool.map(
+                    _chunk_worker,
+                    [shm.name] * len(bounds),
+                    [T] * len(bounds),
+                    [n] * len(bounds),
+                    [b[0] for b in bounds],
+                    [b[1] for b in bounds],
+                    [params] * len(bounds),
+                )
+            )
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if backend == "numpy":
+        return {k: np.concatenate([p[k] for p in parts]) for k in TIER1_COLUMNS}
+    columns = {k: array("d") for k in TIER1_COLUMNS}
+    for p in parts:
+        for k in TIER1_COLUMNS:
+            columns[k].extend(p[k])
+    return columns
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 from umcp.closures import GammaClosure, GammaOmegaPower
 from umcp.contract import FrozenContract
-from umcp.kernel import Tier1Row, compute_tier1_series
-from umcp.regime import RegimeResult, classify_regime
-from umcp.tier0 import ClipFlag, normalize_to_admitted_trace, l2_norm
-from umcp.weld import WeldResult, evaluate_weld
+from umcp.kernel import Tier1Frame, compute_tier1_frame
+from umcp.ndjson import DEFAULT_BUFFER_ROWS, NDJSONWriter
+from umcp.norms import Norm, NormLike, resolve_norm
+from umcp.regime import RegimeIndex, RegimeTimeline, classify_regime_timeline
+from umcp.returns import FULL_HORIZON, ReturnDomain, max_return_lag
+from umcp.tier0 import ClipFlag, ClipMask, l2_norm, normalize_to_admitted_trace_compact
+from umcp.weld import WeldBatch, WeldResult, evaluate_weld, evaluate_weld_batch
+
+if TYPE_CHECKING:
+    from umcp.cache import ComputeCache
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,19 +43,29 @@ class FreezeSpec:
     dt: float
     h_rec: float
     eta: float
-    norm: Callable[[Sequence[float], Sequence[float]], float]
+    norm: Norm
     gamma: GammaClosure
     alpha: float
     tol_seam: float
     tol_id: float
+    domain: ReturnDomain = FULL_HORIZON
 
 
 @dataclass(frozen=True, slots=True)
 class ComputeResult:
+    """
+    /compute output. `tier1` is the columnar Tier1Frame over `psi` (rows are built on access), so a
+    result holds the metric columns once rather than T row objects.
+    """
     psi: List[List[float]]
-    clip_flags: List[List[ClipFlag]]
-    tier1: List[Tier1Row]
-    regimes: List[RegimeResult]
+    clip_mask: ClipMask
+    tier1: Tier1Frame
+    regimes: RegimeTimeline
+
+    @property
+    def clip_flags(self) -> List[List[ClipFlag]]:
+        """Per-cell clip flags, expanded from `clip_mask` on each access."""
+        return self.clip_mask.to_flags()
 
 
 class UMCPSession:
@@ -61,6 +78,7 @@ class UMCPSession:
         self._ingest: Optional[IngestSpec] = None
         self._freeze: Optional[FreezeSpec] = None
         self._compute: Optional[ComputeResult] = None
+        self._regime_index: Optional[RegimeIndex] = None
 
     def ingest(self, *, lows: Sequence[float], highs: Sequence[float]) -> "UMCPSession":
         self._ingest = IngestSpec(lows=list(lows), highs=list(highs))
@@ -74,11 +92,12 @@ class UMCPSession:
         dt: float,
         h_rec: float,
         eta: Optional[float] = None,
-        norm: Callable[[Sequence[float], Sequence[float]], float] = l2_norm,
+        norm: NormLike = l2_norm,
         gamma: Optional[GammaClosure] = None,
         alpha: Optional[float] = None,
         tol_seam: Optional[float] = None,
         tol_id: Optional[float] = None,
+        domain: Optional[ReturnDomain] = None,
     ) -> "UMCPSession":
         c = contract or FrozenContract.canon_default()
         self._freeze = FreezeSpec(
@@ -87,26 +106,58 @@ class UMCPSession:
             dt=float(dt),
             h_rec=float(h_rec),
             eta=float(eta) if eta is not None else float(c.eta),
-            norm=norm,
+            norm=resolve_norm(norm),
             gamma=gamma or GammaOmegaPower(p=c.p),
             alpha=float(alpha) if alpha is not None else float(c.alpha),
             tol_seam=float(tol_seam) if tol_seam is not None else float(c.tol_seam),
             tol_id=float(tol_id) if tol_id is not None else float(c.tol_id),
+            domain=domain if domain is not None else FULL_HORIZON,
         )
         return self
 
-    def compute(self, *, x_series: Sequence[Sequence[float]]) -> ComputeResult:
+    def compute(
+        self,
+        *,
+        x_series: Sequence[Sequence[float]],
+        cache: Optional[str | Path | ComputeCache] = None,
+    ) -> ComputeResult:
+        """
+        /compute: Tier-0 normalize, Tier-1 kernel and regime labels for a raw trace.
+
+        `cache` (a directory or `umcp.cache.ComputeCache`) reuses a stored result when the contract,
+        freeze settings, ingest bounds and raw input are identical (see `umcp.cache.compute_cache_key`).
+        Runs whose norm has no cache identity (callable or unregistered norms) bypass the cache.
+        """
         if self._ingest is None:
             raise RuntimeError("Nonconformant: /ingest must be declared before /compute")
         if self._freeze is None:
             raise RuntimeError("Nonconformant: /freeze must be declared before /compute")
 
-        psi, clip_flags = normalize_to_admitted_trace(
-            x_series=x_series,
+        self._regime_index = None
+        store: Optional["ComputeCache"] = None
+        key = ""
+        if cache is not None:
+            from umcp.cache import ComputeCache, compute_cache_key, norm_cache_id, trace_digest
+
+            fz = self._freeze
+            if norm_cache_id(fz.norm) is not None:
+                store = cache if isinstance(cache, ComputeCache) else ComputeCache(cache)
+                key = compute_cache_key(
+                    contract=fz.contract, weights=fz.weights, dt=fz.dt, h_rec=fz.h_rec, eta=fz.eta,
+                    norm=fz.norm, domain_id=fz.domain.domain_id, lows=self._ingest.lows,
+                    highs=self._ingest.highs, input_sha256=trace_digest(x_series),
+                )
+                hit = store.get(key)
+                if hit is not None:
+                    self._compute = hit
+                    return hit
+
+        psi, clip_mask = normalize_to_admitted_trace_compact(
+            x_series,
             lows=self._ingest.lows,
             highs=self._ingest.highs,
         )
-        tier1 = compute_tier1_series(
+        frame = compute_tier1_frame(
             psi,
             contract=self._freeze.contract,
             weights=self._freeze.weights,
@@ -114,11 +165,71 @@ class UMCPSession:
             h_rec=self._freeze.h_rec,
             eta=self._freeze.eta,
             norm=self._freeze.norm,
+            domain=self._freeze.domain,
         )
-        regimes = [classify_regime(r) for r in tier1]
-        self._compute = ComputeResult(psi=psi, clip_flags=clip_flags, tier1=tier1, regimes=regimes)
+        regimes = classify_regime_timeline(frame.columns)
+        self._compute = ComputeResult(psi=psi, clip_mask=clip_mask, tier1=frame, regimes=regimes)
+        if store is not None:
+            store.put(key, self._compute)
         return self._compute
 
+    def append(self, *, x_new: Sequence[Sequence[float]]) -> ComputeResult:
+        """
+        Extend the computed trace with newly observed samples, in place.
+
+        Only x_new is normalized and classified; τR for the new rows reads the last floor(Hrec/dt)
+        admitted rows already held, so the cost does not grow with the history and the extended
+        result equals a full /compute over the concatenated trace. Without a prior /compute this
+        is /compute.
+        """
+        if self._ingest is None:
+            raise RuntimeError("Nonconformant: /ingest must be declared before /compute")
+        if self._freeze is None:
+            raise RuntimeError("Nonconformant: /freeze must be declared before /compute")
+        if self._compute is None:
+            return self.compute(x_series=x_new)
+        if len(x_new) == 0:
+            return self._compute
+
+        fz = self._freeze
+        res = self._compute
+        psi_new, clip_new = normalize_to_admitted_trace_compact(
+            x_new,
+            lows=self._ingest.lows,
+            highs=self._ingest.highs,
+        )
+        T = len(res.psi)
+        halo = res.psi[max(0, T - max_return_lag(fz.dt, fz.h_rec)):]
+        n = len(psi_new[0])
+        if len(res.psi[0]) != n:
+            raise ValueError("psi_series must have constant dimension n")
+        frame = compute_tier1_frame(
+            psi_new, contract=fz.contract, weights=fz.weights, dt=fz.dt, h_rec=fz.h_rec, eta=fz.eta,
+            norm=fz.norm, domain=fz.domain, halo=halo, t0=T,
+        )
+        if res.tier1.psi is not res.psi:
+            res.psi.extend(psi_new)
+        res.tier1.extend(frame)  # also extends res.psi when the frame references it
+        res.clip_mask.extend(clip_new)
+        regimes = classify_regime_timeline(frame.columns)
+        res.regimes.extend(regimes)
+        if self._regime_index is not None:
+            self._regime_index.extend(regimes)
+        return res
+
+    def regime_index(self) -> RegimeIndex:
+        """
+        Window/transition query index over the computed regimes (see `umcp.regime.RegimeIndex`).
+
+        Built on first use and kept on the session: `append` extends it with the new rows and
+        /compute discards it.
+        """
+        if self._compute is None:
+            raise RuntimeError("Nonconformant: /compute must occur before /regime")
+        if self._regime_index is None:
+            self._regime_index = RegimeIndex(self._compute.regimes)
+        return self._regime_index
+
     def weld(
         self,
         *,
@@ -152,6 +263,116 @@ class UMCPSession:
             post_id=post_id or c.post_doi,
         )
 
+    def weld_batch(
+        self,
+        *,
+        pre_index: Optional[int | Sequence[int]] = None,
+        post_index: Optional[Sequence[int]] = None,
+        lag: Optional[int] = None,
+        tau_r: Optional[float | Sequence[float]] = None,
+        infer_R: bool = True,
+        R: Optional[float] = None,
+        theta: str = "θ",
+        weld_id: Optional[str] = None,
+        pre_id: Optional[str] = None,
+        post_id: Optional[str] = None,
+        backend: str = "python",
+    ) -> WeldBatch:
+        """
+        Bulk /weld over the computed trace: explicit pre/post index arrays (pre_index may be one
+        fixed anchor), or `lag=k` for every pair (t, t + k). tau_r=None uses each POST row's τR.
+        """
+        if self._freeze is None or self._compute is None:
+            raise RuntimeError("Nonconformant: /freeze and /compute must occur before /weld")
+        T = len(self._compute.tier1)
+        if lag is not None:
+            if pre_index is not None or post_index is not None:
+                raise ValueError("pass either lag or pre_index/post_index, not both")
+            if int(lag) < 1:
+                raise ValueError("lag must be >= 1")
+            pre_index, post_index = range(0, max(0, T - int(lag))), range(int(lag), T)
+        elif pre_index is None or post_index is None:
+            raise ValueError("pre_index and post_index are required unless lag is given")
+
+        c = self._freeze.contract
+        return evaluate_weld_batch(
+            self._compute.tier1,
+            pre_index=pre_index,
+            post_index=post_index,
+            tau_r=tau_r,
+            gamma=self._freeze.gamma,
+            alpha=self._freeze.alpha,
+            tol_seam=self._freeze.tol_seam,
+            tol_id=self._freeze.tol_id,
+            infer_R=infer_R,
+            R=R,
+            theta=theta,
+            weld_id=weld_id or c.weld_id,
+            pre_id=pre_id or c.pre_doi,
+            post_id=post_id or c.post_doi,
+            backend=backend,
+        )
+
+    def seam_search(
+        self,
+        *,
+        R: float,
+        max_span: int,
+        min_span: int = 1,
+        tau_r: Optional[float] = None,
+        theta: str = "θ",
+        weld_id: Optional[str] = None,
+        pre_id: Optional[str] = None,
+        post_id: Optional[str] = None,
+        backend: str = "python",
+    ) -> WeldBatch:
+        """
+        Find every PASSing seam (t0, t1) with min_span ≤ t1 − t0 ≤ max_span under the frozen closures
+        and a declared R (see `umcp.seams.search_seams`); same result as brute-force /weld over all pairs.
+        """
+        if self._freeze is None or self._compute is None:
+            raise RuntimeError("Nonconformant: /freeze and /compute must occur before /weld")
+        from umcp.seams import search_seams
+
+        c = self._freeze.contract
+        return search_seams(
+            self._compute.tier1,
+            R=R,
+            max_span=max_span,
+            min_span=min_span,
+            tau_r=tau_r,
+            gamma=self._freeze.gamma,
+            alpha=self._freeze.alpha,
+            tol_seam=self._freeze.tol_seam,
+            tol_id=self._freeze.tol_id,
+            theta=theta,
+            weld_id=weld_id or c.weld_id,
+            pre_id=pre_id or c.pre_doi,
+            post_id=post_id or c.post_doi,
+            backend=backend,
+        )
+
+    def export_ndjson(self, stream: IO[str], *, buffer_rows: int = DEFAULT_BUFFER_ROWS) -> int:
+        """
+        /export the compute result as NDJSON: a header with the contract and freeze disclosures, then
+        one record per t (Ψ, Tier-1 columns, regime). Returns the number of rows written.
+        """
+        if self._compute is None or self._freeze is None:
+            raise RuntimeError("Nothing to export; run /compute first")
+        with NDJSONWriter(stream, contract=self._freeze.contract, buffer_rows=buffer_rows) as writer:
+            return writer.write_rows(self._compute.tier1, self._compute.regimes)
+
+    def export_archive(self, path: str | Path, *, block_rows: Optional[int] = None, codec: str = "zlib") -> Path:
+        """/export the compute result as a compact columnar archive (see `umcp.archive.write_archive`)."""
+        if self._compute is None or self._freeze is None:
+            raise RuntimeError("Nothing to export; run /compute first")
+        from umcp.archive import DEFAULT_BLOCK_ROWS, write_archive
+
+        return write_archive(
+            path, self._compute, contract=self._freeze.contract, block_rows=block_rows or DEFAULT_BLOCK_ROWS,
+            codec=codec,
+        )
+
     def render_compute_json(self) -> str:
         """
         Render the compute result to JSON for export (simple reference serializer).
@@ -160,13 +381,7 @@ class UMCPSession:
             raise RuntimeError("Nothing to render; run /compute first")
         payload: Dict[str, Any] = {
             "psi": self._compute.psi,
-            "tier1": [
-                dict(
-                    t=r.t, psi=list(r.psi), weights=list(r.weights), dt=r.dt, h_rec=r.h_rec, eta=r.eta,
-                    F=r.F, omega=r.omega, S=r.S, C=r.C, tau_R=r.tau_R, kappa=r.kappa, I=r.I
-                )
-                for r in self._compute.tier1
-            ],
+            "tier1": [r.to_dict() for r in self._compute.tier1],
             "regimes": [asdict(rr) for rr in self._compute.regimes],
         }
         import json
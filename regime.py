@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import abc
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple
 
+from umcp.backend import np
 from umcp.kernel import Tier1Row
 
 
@@ -61,3 +65,361 @@ def classify_regime(
 
     critical = row.I < critical_I_min
     return RegimeResult(regime=regime, phi=phi, critical=critical)
+
+
+# Every RegimeResult is one of six values; column classification hands out these shared instances.
+# Row codes are 2·k + critical with k = 0 (Stable), 1 (Watch), 2 (Collapse).
+_BY_CODE = tuple(
+    RegimeResult(regime=regime, phi=phi, critical=critical)  # type: ignore[arg-type]
+    for regime, phi in (("Stable", "S"), ("Watch", "W"), ("Collapse", "C"))
+    for critical in (False, True)
+)
+_CODE_OF = {r: k for k, r in enumerate(_BY_CODE)}
+
+
+def _regime_codes(
+    columns: Mapping[str, Sequence[float]],
+    *,
+    stable_omega_max: float,
+    stable_F_min: float,
+    stable_S_max: float,
+    stable_C_max: float,
+    collapse_omega_min: float,
+    critical_I_min: float,
+) -> bytearray:
+    """One code byte per row (see _BY_CODE) for the Stable/Watch/Collapse gates and Critical overlay."""
+    F, omega, S, C, I = (columns[k] for k in ("F", "omega", "S", "C", "I"))
+    if np is not None and isinstance(omega, np.ndarray):
+        stable = (omega < stable_omega_max) & (F > stable_F_min) & (S < stable_S_max) & (C < stable_C_max)
+        collapse = ~stable & (omega >= collapse_omega_min)
+        code = np.where(stable, 0, np.where(collapse, 4, 2)) + (I < critical_I_min)
+        return bytearray(code.astype(np.uint8).tobytes())
+
+    out = bytearray()
+    for f, o, s, c, i in zip(F, omega, S, C, I):
+        if o < stable_omega_max and f > stable_F_min and s < stable_S_max and c < stable_C_max:
+            k = 0
+        elif o >= collapse_omega_min:
+            k = 4
+        else:
+            k = 2
+        out.append(k + (i < critical_I_min))
+    return out
+
+
+def classify_regime_columns(
+    columns: Mapping[str, Sequence[float]],
+    *,
+    stable_omega_max: float = 0.038,
+    stable_F_min: float = 0.90,
+    stable_S_max: float = 0.15,
+    stable_C_max: float = 0.14,
+    collapse_omega_min: float = 0.30,
+    critical_I_min: float = 0.30,
+) -> List[RegimeResult]:
+    """
+    `classify_regime` applied to whole Tier-1 columns (e.g. `Tier1Frame.columns`) at once.
+
+    Uses the same gates and thresholds; element t equals classify_regime(row t). Gates are evaluated
+    as array masks when the columns are NumPy arrays.
+    """
+    codes = _regime_codes(
+        columns, stable_omega_max=stable_omega_max, stable_F_min=stable_F_min, stable_S_max=stable_S_max,
+        stable_C_max=stable_C_max, collapse_omega_min=collapse_omega_min, critical_I_min=critical_I_min,
+    )
+    return [_BY_CODE[k] for k in codes]
+
+
+@dataclass(frozen=True, slots=True)
+class RegimeRun:
+    """Maximal interval [start, end) of rows sharing one regime and Critical flag."""
+
+    start: int
+    end: int
+    regime: Regime
+    critical: bool
+
+
+class RegimeTimeline(abc.Sequence):
+    """
+    Run-length-encoded regime labels for a trace, usable wherever a list of RegimeResult is expected.
+
+    Stores one code byte per row (O(1) indexing, returning shared RegimeResult instances) plus the
+    run boundaries, so `runs()` and `run_at(t)` never rescan the rows.
+    """
+
+    __slots__ = ("codes", "run_starts")
+
+    def __init__(self, codes: Iterable[int] = ()) -> None:
+        self.codes = bytearray(codes)
+        self.run_starts = array("q")
+        if np is not None and self.codes:
+            c = np.frombuffer(self.codes, dtype=np.uint8)
+            self.run_starts.frombytes(np.flatnonzero(np.r_[True, c[1:] != c[:-1]]).astype(np.int64).tobytes())
+            return
+        prev = -1
+        for t, k in enumerate(self.codes):
+            if k != prev:
+                self.run_starts.append(t)
+                prev = k
+
+    @classmethod
+    def from_results(cls, results: Iterable[RegimeResult]) -> "RegimeTimeline":
+        return cls(_CODE_OF[r] for r in results)
+
+    @staticmethod
+    def result_for_code(code: int) -> RegimeResult:
+        """The (shared) RegimeResult stored as one code byte in `codes`."""
+        return _BY_CODE[code]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [_BY_CODE[k] for k in self.codes[index]]
+        return _BY_CODE[self.codes[index]]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RegimeTimeline):
+            return self.codes == other.codes
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RegimeTimeline(T={len(self)}, runs={len(self.run_starts)})"
+
+    def append(self, result: RegimeResult) -> None:
+        k = _CODE_OF[result]
+        if not self.codes or self.codes[-1] != k:
+            self.run_starts.append(len(self.codes))
+        self.codes.append(k)
+
+    def extend(self, results: Iterable[RegimeResult]) -> None:
+        for r in results:
+            self.append(r)
+
+    def _run(self, j: int) -> RegimeRun:
+        start = self.run_starts[j]
+        end = self.run_starts[j + 1] if j + 1 < len(self.run_starts) else len(self.codes)
+        r = _BY_CODE[self.codes[start]]
+        return RegimeRun(start=start, end=end, regime=r.regime, critical=r.critical)
+
+    def runs(self) -> List[RegimeRun]:
+        """All runs in time order: (start, end, regime, critical) intervals."""
+        return [self._run(j) for j in range(len(self.run_starts))]
+
+    def run_at(self, t: int) -> RegimeRun:
+        """The run containing row t (O(log runs))."""
+        if t < 0:
+            t += len(self.codes)
+        if not 0 <= t < len(self.codes):
+            raise IndexError("RegimeTimeline index out of range")
+        return self._run(bisect_right(self.run_starts, t) - 1)
+
+
+def classify_regime_timeline(
+    columns: Mapping[str, Sequence[float]],
+    *,
+    stable_omega_max: float = 0.038,
+    stable_F_min: float = 0.90,
+    stable_S_max: float = 0.15,
+    stable_C_max: float = 0.14,
+    collapse_omega_min: float = 0.30,
+    critical_I_min: float = 0.30,
+) -> RegimeTimeline:
+    """
+    Column-wise regime classification (same gates as `classify_regime`) into a RegimeTimeline.
+
+    Element t of the timeline equals classify_regime(row t).
+    """
+    return RegimeTimeline(
+        _regime_codes(
+            columns, stable_omega_max=stable_omega_max, stable_F_min=stable_F_min, stable_S_max=stable_S_max,
+            stable_C_max=stable_C_max, collapse_omega_min=collapse_omega_min, critical_I_min=critical_I_min,
+        )
+    )
+
+
+REGIMES = ("Stable", "Watch", "Collapse")
+REGIME_CATEGORIES = REGIMES + ("Critical",)
+
+
+def _in_category(code: int, category: int) -> bool:
+    return bool(code & 1) if category == 3 else code >> 1 == category
+
+
+class RegimeIndex:
+    """
+    Time-window queries over regime labels without rescanning rows.
+
+    Built from `classify_regime` output (any iterable of RegimeResult, or a RegimeTimeline). Keeps,
+    per run of identical labels, the prefix count of rows in each category (Stable, Watch, Collapse,
+    Critical) before the run, the start offsets of runs in each category, and one sorted table of
+    transition times per (from, to) regime pair. Occupancy, counts and next/previous lookups bisect
+    these tables (O(log T)); `append` / `extend` add rows in O(1) amortized.
+
+    A transition at time t means row t − 1 and row t have different regimes (the Critical overlay
+    alone does not make a transition).
+    """
+
+    __slots__ = ("_T", "_starts", "_codes", "_prefix", "_category_starts", "_transitions")
+
+    def __init__(self, regimes: Iterable[RegimeResult] = ()) -> None:
+        self._T = 0
+        self._starts = array("q")
+        self._codes = bytearray()
+        self._prefix = [array("q") for _ in REGIME_CATEGORIES]
+        self._category_starts = [array("q") for _ in REGIME_CATEGORIES]
+        self._transitions: Dict[Tuple[str, str], Any] = {
+            (a, b): array("q") for a in REGIMES for b in REGIMES if a != b
+        }
+        if isinstance(regimes, RegimeTimeline):
+            codes = regimes.codes
+            starts = regimes.run_starts
+            for j, start in enumerate(starts):
+                end = starts[j + 1] if j + 1 < len(starts) else len(codes)
+                self._push_run(codes[start], end - start)
+        else:
+            self.extend(regimes)
+
+    def __len__(self) -> int:
+        return self._T
+
+    def __repr__(self) -> str:
+        return f"RegimeIndex(T={self._T}, runs={len(self._starts)})"
+
+    def _push_run(self, code: int, length: int) -> None:
+        start = self._T
+        j = len(self._starts)
+        if j:
+            prev = self._codes[-1]
+            prev_len = start - self._starts[-1]
+            for c, pre in enumerate(self._prefix):
+                pre.append(pre[-1] + (prev_len if _in_category(prev, c) else 0))
+            if prev >> 1 != code >> 1:
+                self._transitions[(REGIMES[prev >> 1], REGIMES[code >> 1])].append(start)
+        else:
+            for pre in self._prefix:
+                pre.append(0)
+        for c, cs in enumerate(self._category_starts):
+            if _in_category(code, c):
+                cs.append(start)
+        self._starts.append(start)
+        self._codes.append(code)
+        self._T += length
+
+    def append(self, result: RegimeResult) -> None:
+        code = _CODE_OF[result]
+        if self._codes and self._codes[-1] == code:
+            self._T += 1
+        else:
+            self._push_run(code, 1)
+
+    def extend(self, results: Iterable[RegimeResult]) -> None:
+        for r in results:
+            self.append(r)
+
+    def _category(self, category: str) -> int:
+        try:
+            return REGIME_CATEGORIES.index(category)
+        except ValueError:
+            raise ValueError(f"unknown regime category {category!r}; expected one of {REGIME_CATEGORIES}") from None
+
+    def _window(self, start: int, stop: Optional[int]) -> Tuple[int, int]:
+        stop = self._T if stop is None else min(int(stop), self._T)
+        return max(0, int(start)), stop
+
+    def _count_before(self, c: int, t: int) -> int:
+        if t <= 0:
+            return 0
+        j = bisect_right(self._starts, t - 1) - 1
+        n = self._prefix[c][j]
+        if _in_category(self._codes[j], c):
+            n += t - self._starts[j]
+        return n
+
+    def occupancy(self, category: str, start: int = 0, stop: Optional[int] = None) -> int:
+        """Number of rows in [start, stop) labelled `category` (multiply by dt for a duration)."""
+        c = self._category(category)
+        a, b = self._window(start, stop)
+        if b <= a:
+            return 0
+        return self._count_before(c, b) - self._count_before(c, a)
+
+    def next_entry(self, category: str, t: int = 0) -> Optional[int]:
+        """First row u ≥ t labelled `category`, or None."""
+        c = self._category(category)
+        if t >= self._T:
+            return None
+        t = max(0, int(t))
+        j = bisect_right(self._starts, t) - 1
+        if _in_category(self._codes[j], c):
+            return t
+        cs = self._category_starts[c]
+        k = bisect_right(cs, t)
+        return cs[k] if k < len(cs) else None
+
+    def _transition_tables(self, from_regime: Optional[str], to_regime: Optional[str]) -> List[Any]:
+        for r in (from_regime, to_regime):
+            if r is not None and r not in REGIMES:
+                raise ValueError(f"unknown regime {r!r}; expected one of {REGIMES}")
+        return [
+            times
+            for (a, b), times in self._transitions.items()
+            if (from_regime is None or a == from_regime) and (to_regime is None or b == to_regime)
+        ]
+
+    def count_transitions(
+        self,
+        from_regime: Optional[str] = None,
+        to_regime: Optional[str] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> int:
+        """Number of from→to regime transitions at times in [start, stop) (None matches any regime)."""
+        tables = self._transition_tables(from_regime, to_regime)
+        a, b = self._window(start, stop)
+        if b <= a:
+            return 0
+        return sum(bisect_left(times, b) - bisect_left(times, a) for times in tables)
+
+    def transitions(
+        self,
+        from_regime: Optional[str] = None,
+        to_regime: Optional[str] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> List[Tuple[int, str, str]]:
+        """(time, from, to) for every matching transition in [start, stop), in time order."""
+        self._transition_tables(from_regime, to_regime)
+        a, b = self._window(start, stop)
+        out: List[Tuple[int, str, str]] = []
+        for (fr, to), times in self._transitions.items():
+            if (from_regime is None or fr == from_regime) and (to_regime is None or to == to_regime):
+                out.extend((t, fr, to) for t in times[bisect_left(times, a):bisect_left(times, b)])
+        out.sort()
+        return out
+
+    def next_transition(
+        self, t: int, from_regime: Optional[str] = None, to_regime: Optional[str] = None
+    ) -> Optional[int]:
+        """First matching transition time strictly after t, or None."""
+        best: Optional[int] = None
+        for times in self._transition_tables(from_regime, to_regime):
+            k = bisect_right(times, t)
+            if k < len(times) and (best is None or times[k] < best):
+                best = times[k]
+        return best
+
+    def previous_transition(
+        self, t: int, from_regime: Optional[str] = None, to_regime: Optional[str] = None
+    ) -> Optional[int]:
+        """Last matching transition time at or before t, or None."""
+        best: Optional[int] = None
+        for times in self._transition_tables(from_regime, to_regime):
+            k = bisect_right(times, t)
+            if k and (best is None or times[k - 1] > best):
+                best = times[k - 1]
+        return best
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Deque, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple
+
+import hashlib
+import heapq
+import math
+
+from umcp.backend import np
+from umcp.norms import L2Norm, LinfNorm, NormLike, resolve_norm
+from umcp.tier0 import l2_norm
+
+# Norms with a coordinate-wise bound |x_i - y_i| ≤ ‖x - y‖, which is what makes the grid exact.
+_INDEXABLE_NORMS = (L2Norm, LinfNorm)
+
+# Relative widening of the grid cell and pruning bounds; absorbs float rounding in x/w and Σc_i.
+_GUARD = 1e-6
+
+
+def max_return_lag(dt: float, h_rec: float) -> int:
+    """Number of earlier samples inside the return horizon: max(1, floor(Hrec/dt))."""
+    max_lag = int(math.floor(h_rec / dt)) if dt > 0 else 0
+    return max(1, max_lag)
+
+
+class ReturnDomain(Protocol):
+    """
+    Return-domain generator Dθ(t) ⊆ {t − max_lag, …, t − 1} for the τR search (KERNEL.md).
+
+    A generator is part of the τR disclosure: `domain_id` (name + parameters) is exported on every
+    Tier-1 row and `params()` gives the parameters as a dict for manifests. Indices are absolute
+    positions in the trace.
+    """
+
+    domain_id: str
+
+    def params(self) -> Dict[str, Any]: ...
+
+    def lags(self, t: int, limit: int) -> Iterator[int]:
+        """Candidate lags in increasing order, 1 ≤ lag ≤ limit, for which t − lag ∈ Dθ(t)."""
+        ...
+
+    def contains(self, t: int, u: int) -> bool: ...
+
+    def candidate_lags(self, limit: int) -> Sequence[int]:
+        """Increasing superset of the lags any t can use (vectorized path)."""
+        ...
+
+    def lag_mask(self, t: Any, lag: int) -> Any:
+        """For an int array of absolute indices t: mask of rows where t − lag ∈ Dθ(t), or None for all."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class FullHorizon:
+    """Dθ(t) = every earlier sample within Hrec (canon default)."""
+
+    @property
+    def domain_id(self) -> str:
+        return "full"
+
+    def params(self) -> Dict[str, Any]:
+        return {"generator": "full"}
+
+    def lags(self, t: int, limit: int) -> Iterator[int]:
+        return iter(range(1, limit + 1))
+
+    def contains(self, t: int, u: int) -> bool:
+        return True
+
+    def candidate_lags(self, limit: int) -> Sequence[int]:
+        return range(1, limit + 1)
+
+    def lag_mask(self, t: Any, lag: int) -> Any:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class StridedDomain:
+    """Dθ(t) = earlier samples on a fixed decimation grid: u ≡ offset (mod stride)."""
+
+    stride: int
+    offset: int = 0
+
+    def __post_init__(self) -> None:
+        if self.stride < 1:
+            raise ValueError("stride must be >= 1")
+        object.__setattr__(self, "offset", int(self.offset) % int(self.stride))
+
+    @property
+    def domain_id(self) -> str:
+        return f"strided(stride={self.stride},offset={self.offset})"
+
+    def params(self) -> Dict[str, Any]:
+        return {"generator": "strided", "stride": self.stride, "offset": self.offset}
+
+    def lags(self, t: int, limit: int) -> Iterator[int]:
+        first = (t - self.offset) % self.stride or self.stride
+        return iter(range(first, limit + 1, self.stride))
+
+    def contains(self, t: int, u: int) -> bool:
+        return u % self.stride == self.offset
+
+    def candidate_lags(self, limit: int) -> Sequence[int]:
+        return range(1, limit + 1)
+
+    def lag_mask(self, t: Any, lag: int) -> Any:
+        return (t - lag) % self.stride == self.offset
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseLockedDomain:
+    """Dθ(t) = earlier samples at the same phase of a known period: lag = m·period ± tolerance, m ≥ 1."""
+
+    period: int
+    tolerance: int = 0
+
+    def __post_init__(self) -> None:
+        if self.period < 1 or self.tolerance < 0:
+            raise ValueError("period must be >= 1 and tolerance >= 0")
+
+    @property
+    def domain_id(self) -> str:
+        return f"phase_locked(period={self.period},tolerance={self.tolerance})"
+
+    def params(self) -> Dict[str, Any]:
+        return {"generator": "phase_locked", "period": self.period, "tolerance": self.tolerance}
+
+    def _phase_ok(self, lag: int) -> bool:
+        r = lag % self.period
+        return lag >= self.period - self.tolerance and min(r, self.period - r) <= self.tolerance
+
+    def lags(self, t: int, limit: int) -> Iterator[int]:
+        return iter(self.candidate_lags(limit))
+
+    def contains(self, t: int, u: int) -> bool:
+        return t > u and self._phase_ok(t - u)
+
+    def candidate_lags(self, limit: int) -> Sequence[int]:
+        if self.tolerance == 0:
+            return range(self.period, limit + 1, self.period)
+        return [lag for lag in range(1, limit + 1) if self._phase_ok(lag)]
+
+    def lag_mask(self, t: Any, lag: int) -> Any:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class KeyframeDomain:
+    """Dθ(t) = earlier keyframes only (declared sorted sample indices)."""
+
+    keyframes: Tuple[int, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "keyframes", tuple(sorted({int(k) for k in self.keyframes})))
+
+    @property
+    def domain_id(self) -> str:
+        digest = hashlib.sha256(",".join(map(str, self.keyframes)).encode("ascii")).hexdigest()[:16]
+        return f"keyframes(count={len(self.keyframes)},sha256={digest})"
+
+    def params(self) -> Dict[str, Any]:
+        return {"generator": "keyframes", "keyframes": list(self.keyframes)}
+
+    def lags(self, t: int, limit: int) -> Iterator[int]:
+        keys = self.keyframes
+        i = bisect_left(keys, t) - 1
+        while i >= 0 and t - keys[i] <= limit:
+            yield t - keys[i]
+            i -= 1
+
+    def contains(self, t: int, u: int) -> bool:
+        i = bisect_left(self.keyframes, u)
+        return i < len(self.keyframes) and self.keyframes[i] == u
+
+    def candidate_lags(self, limit: int) -> Sequence[int]:
+        return range(1, limit + 1)
+
+    def lag_mask(self, t: Any, lag: int) -> Any:
+        return np.isin(t - lag, np.asarray(self.keyframes, dtype=np.int64))
+
+
+FULL_HORIZON = FullHorizon()
+
+
+def domain_from_spec(spec: str) -> ReturnDomain:
+    """
+    Parse a compact CLI domain spec: "full", "strided:STRIDE[:OFFSET]" or "phase_locked:PERIOD[:TOL]".
+
+    Keyframe domains carry an index list and are constructed directly (KeyframeDomain).
+    """
+    name, *args = spec.split(":")
+    try:
+        if name == "full" and not args:
+            return FULL_HORIZON
+        if name == "strided" and 1 <= len(args) <= 2:
+            return StridedDomain(*(int(a) for a in args))
+        if name == "phase_locked" and 1 <= len(args) <= 2:
+            return PhaseLockedDomain(*(int(a) for a in args))
+    except ValueError as e:
+        raise ValueError(f"invalid return-domain spec {spec!r}: {e}") from None
+    raise ValueError(f"invalid return-domain spec {spec!r}; expected full, strided:K[:R] or phase_locked:P[:TOL]")
+
+
+class ReturnIndex:
+    """
+    Sliding-window grid index over the last `max_lag` states of Ψ for exact τR queries.
+
+    States are bucketed by floor(c_i / w) on `key_dims` leading channels, with cell width w ≥ η.
+    Any u with ‖Ψ(t) − Ψ(u)‖ < η (L2 or L∞) differs by less than η in every channel, so it lies
+    in one of the 3^k neighbouring cells. Candidates are visited from the most recent backwards,
+    optionally pruned by the projection bound on Σ c_i, and confirmed with the declared norm;
+    the first confirmed candidate is therefore the same smallest lag the linear scan returns.
+
+    An optional ReturnDomain restricts candidates to Dθ(t). Usage per sample:
+    `lag = idx.query(t, psi)` then `idx.insert(t, psi)`.
+    """
+
+    def __init__(
+        self,
+        *,
+        eta: float,
+        max_lag: int,
+        norm: NormLike = l2_norm,
+        key_dims: int = 3,
+        prune: bool = True,
+        domain: Optional[ReturnDomain] = None,
+    ) -> None:
+        nm = resolve_norm(norm)
+        if not isinstance(nm, _INDEXABLE_NORMS):
+            raise ValueError(f"ReturnIndex supports the L2 and Linf norms only, not {nm.norm_id!r}")
+        self.eta = float(eta)
+        self.max_lag = int(max_lag)
+        self.norm = nm
+        self.norm_id = nm.norm_id
+        self.prune = bool(prune)
+        self.domain = domain if domain is not None and not isinstance(domain, FullHorizon) else None
+        # Below ~1e-9 the cell coordinate c/w loses the resolution the exactness argument needs.
+        self._key_dims = int(key_dims) if self.eta >= 1e-9 else 0
+        self._width = self.eta * (1.0 + _GUARD)
+        self._cells: Dict[Tuple[int, ...], Deque[int]] = {}
+        self._window: Deque[Tuple[int, Tuple[int, ...]]] = deque()
+        self._states: Dict[int, Tuple[Sequence[float], float]] = {}
+        self._offsets: List[Tuple[int, ...]] = []
+        self._n: Optional[int] = None
+        self._sum_bound = 0.0
+
+    def _setup(self, n: int) -> None:
+        self._n = n
+        self._key_dims = min(self._key_dims, n)
+        self._offsets = list(product((-1, 0, 1), repeat=self._key_dims))
+        # |Σ(x_i − y_i)| ≤ √n‖x−y‖₂ and ≤ n‖x−y‖∞
+        factor = math.sqrt(n) if self.norm_id == "L2" else float(n)
+        self._sum_bound = factor * self.eta * (1.0 + _GUARD)
+
+    def _key(self, psi: Sequence[float]) -> Tuple[int, ...]:
+        w = self._width
+        try:
+            return tuple(math.floor(float(psi[i]) / w) for i in range(self._key_dims))
+        except (OverflowError, ValueError) as e:
+            raise ValueError("ReturnIndex requires finite Ψ values") from e
+
+    def _evict(self, t: int) -> None:
+        oldest = t - self.max_lag
+        while self._window and self._window[0][0] < oldest:
+            u, key = self._window.popleft()
+            cell = self._cells[key]
+            cell.popleft()
+            if not cell:
+                del self._cells[key]
+            del self._states[u]
+
+    def query(self, t: int, psi: Sequence[float]) -> Optional[int]:
+        """Smallest lag in 1..max_lag with ‖Ψ(t) − Ψ(t−lag)‖ < η among inserted states, else None."""
+        self._evict(t)
+        if not self._window or self.eta <= 0.0:
+            return None
+        if self._n is None:
+            self._setup(len(psi))
+        key = self._key(psi)
+        cells = [self._cells.get(tuple(k + o for k, o in zip(key, off))) for off in self._offsets]
+        runs = [reversed(c) for c in cells if c]
+        s_t = math.fsum(float(x) for x in psi) if self.prune else 0.0
+        for u in heapq.merge(*runs, reverse=True):
+            if self.domain is not None and not self.domain.contains(t, u):
+                continue
+            psi_u, s_u = self._states[u]
+            if self.prune and abs(s_t - s_u) > self._sum_bound + 1e-12 * (1.0 + abs(s_t) + abs(s_u)):
+                continue
+            if self.norm.within(psi, psi_u, self.eta):
+                return t - u
+        return None
+
+    def insert(self, t: int, psi: Sequence[float]) -> None:
+        """Add Ψ(t) to the window; t must exceed every previously inserted index."""
+        if self._n is None:
+            self._setup(len(psi))
+        key = self._key(psi)
+        self._cells.setdefault(key, deque()).append(t)
+        self._window.append((t, key))
+        s = math.fsum(float(x) for x in psi) if self.prune else 0.0
+        self._states[t] = (psi, s)
+
+
+def tau_R_series(
+    psi_series: Sequence[Sequence[float]],
+    *,
+    dt: float,
+    eta: float,
+    h_rec: float,
+    norm: NormLike = l2_norm,
+    key_dims: int = 3,
+    prune: bool = True,
+    domain: Optional[ReturnDomain] = None,
+    t0: int = 0,
+) -> List[float]:
+    """
+    τR for every index of an admitted trace using ReturnIndex.
+
+    Returns exactly the values of the reference lag scan (`kernel._tau_R_for_index`), with ∞ for
+    no return, at a cost proportional to the number of near neighbours rather than to Hrec/dt.
+    `t0` is the absolute index of psi_series[0], used by domains that depend on absolute position.
+    """
+    index = ReturnIndex(
+        eta=eta, max_lag=max_return_lag(dt, h_rec), norm=norm, key_dims=key_dims, prune=prune, domain=domain
+    )
+    out: List[float] = []
+    for t, psi in enumerate(psi_series, start=t0):
+        lag = index.query(t, psi)
+        out.append(math.inf if lag is None else lag * dt)
+        index.insert(t, psi)
+    return out
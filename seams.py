@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+import math
+
+from umcp.closures import GammaClosure, gamma_batch
+from umcp.kernel import Tier1Row
+from umcp.weld import WeldBatch, _trace_column, evaluate_weld_batch
+
+# Relative slack added to tol_seam when pruning, covering the rounding difference between the
+# regrouped bound X_b − Y_a and the ledger's own evaluation order for s.
+_GUARD = 1e-9
+
+
+def _candidate_seams(
+    X: Sequence[float],
+    Y: Sequence[float],
+    posts: Sequence[int],
+    *,
+    band: float,
+    min_span: int,
+    max_span: int,
+) -> Tuple[List[int], List[int]]:
+    """
+    All (a, b) with b in `posts`, min_span ≤ b − a ≤ max_span and |X[b] − Y[a]| ≤ band.
+
+    Positions are split into blocks of ~sqrt(max_span) rows, each holding its Y values sorted, so a
+    query costs O(sqrt(max_span) · log) plus the number of candidates returned.
+    """
+    T = len(Y)
+    size = max(16, math.isqrt(max_span))
+    blocks: List[Tuple[List[float], List[int]]] = []
+    for s in range(0, T, size):
+        pairs = sorted((y, a) for a, y in enumerate(Y[s:s + size], start=s) if not math.isnan(y))
+        blocks.append(([p[0] for p in pairs], [p[1] for p in pairs]))
+
+    pre: List[int] = []
+    post: List[int] = []
+    for b in posts:
+        lo, hi = max(0, b - max_span), b - min_span
+        if hi < lo:
+            continue
+        x = X[b]
+        y_lo, y_hi = x - band, x + band
+        found: List[int] = []
+        a = lo
+        while a <= hi:
+            j = a // size
+            if a % size == 0 and a + size - 1 <= hi:
+                ys, idx = blocks[j]
+                found.extend(idx[bisect_left(ys, y_lo):bisect_right(ys, y_hi)])
+                a += size
+            else:
+                if y_lo <= Y[a] <= y_hi:
+                    found.append(a)
+                a += 1
+        found.sort()
+        pre.extend(found)
+        post.extend([b] * len(found))
+    return pre, post
+
+
+def search_seams(
+    tier1: Sequence[Tier1Row],
+    *,
+    R: float,
+    max_span: int,
+    min_span: int = 1,
+    tau_r: Optional[float] = None,
+    gamma: GammaClosure,
+    alpha: float,
+    tol_seam: float,
+    tol_id: float,
+    theta: str = "θ",
+    weld_id: str = "WELD",
+    pre_id: str = "PRE",
+    post_id: str = "POST",
+    backend: str = "python",
+) -> WeldBatch:
+    """
+    Every PASSing seam (t0, t1) with min_span ≤ t1 − t0 ≤ max_span, under a declared return rate R.
+
+    τR per seam is `tau_r`, or each POST row's own τR when None. With R fixed the residual splits as
+    s = X(t1) − Y(t0), with X = R·τR − κ and Y = Dω + DC − κ, so a seam can only pass when Y(t0)
+    lies within tol_seam of X(t1). POST rows without a finite τR are skipped (return_ok is False),
+    the remaining (t0, t1) are pruned with that bound over block-sorted Y, and the survivors are
+    evaluated exactly by `evaluate_weld_batch`. The result holds only the passing seams, ordered by
+    (t1, t0), with the same values as brute-force welds over all pairs.
+    """
+    if int(max_span) < int(min_span) or int(min_span) < 1:
+        raise ValueError("need 1 <= min_span <= max_span")
+    T = len(tier1)
+    R_f = float(R)
+    alpha_f = float(alpha)
+    kappa = _trace_column(tier1, "kappa")
+    omega = _trace_column(tier1, "omega")
+    C = _trace_column(tier1, "C")
+    tau = [float(tau_r)] * T if tau_r is not None else [float(x) for x in _trace_column(tier1, "tau_R")]
+
+    D_omega = gamma_batch(gamma, omega)
+    Y = [float(D_omega[a]) + alpha_f * float(C[a]) - float(kappa[a]) for a in range(T)]
+    X = [R_f * tau[b] - float(kappa[b]) for b in range(T)]
+    posts = [b for b in range(T) if math.isfinite(tau[b]) and math.isfinite(X[b])]
+    scale = max([abs(v) for v in Y if math.isfinite(v)] + [abs(X[b]) for b in posts] + [0.0])
+    band = float(tol_seam) * (1.0 + _GUARD) + _GUARD * scale
+
+    pre, post = _candidate_seams(X, Y, posts, band=band, min_span=int(min_span), max_span=int(max_span))
+    batch = evaluate_weld_batch(
+        tier1,
+        pre_index=pre,
+        post_index=post,
+        tau_r=tau_r,
+        gamma=gamma,
+        alpha=alpha_f,
+        tol_seam=tol_seam,
+        tol_id=tol_id,
+        R=R_f,
+        theta=theta,
+        weld_id=weld_id,
+        pre_id=pre_id,
+        post_id=post_id,
+        backend=backend,
+    )
+    return batch.take([k for k, ok in enumerate(batch.column("pass_ok")) if ok])
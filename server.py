@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import io
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from umcp.closures import GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.kernel import Tier1Row, compute_tier1_frame
+from umcp.manifest import sha256_canonical
+from umcp.ndjson import NDJSONWriter
+from umcp.norms import NORMS
+from umcp.pipeline import UMCPSession
+from umcp.returns import domain_from_spec
+from umcp.weld import evaluate_weld
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_SESSIONS = 64
+# Request bodies above this size are refused (413) before being read.
+MAX_BODY_BYTES = 256 << 20
+
+_FREEZE_KEYS = ("weights", "dt", "h_rec", "eta", "norm", "domain", "alpha", "tol_seam", "tol_id")
+
+# Operations served under /v1/<op>; anything else is 404.
+OPS = ("health", "stats", "kernel", "weld", "compute", "welds")
+
+_REQUIRED = object()
+
+
+class RequestError(ValueError):
+    """Invalid request input (missing or malformed field); the daemon answers 400."""
+
+
+def _field(payload: Dict[str, Any], key: str, default: Any = _REQUIRED) -> Any:
+    if key in payload:
+        return payload[key]
+    if default is _REQUIRED:
+        raise RequestError(f"missing field {key!r}")
+    return default
+
+
+def _float(payload: Dict[str, Any], key: str, default: Any = _REQUIRED) -> Optional[float]:
+    value = _field(payload, key, default)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise RequestError(f"field {key!r} must be a number") from None
+
+
+def _object(payload: Dict[str, Any], key: str) -> Dict[str, Any]:
+    value = _field(payload, key)
+    if not isinstance(value, dict):
+        raise RequestError(f"field {key!r} must be a JSON object")
+    return value
+
+
+def _rows(payload: Dict[str, Any], key: str) -> List[List[Any]]:
+    value = _field(payload, key)
+    if not isinstance(value, list) or not all(isinstance(row, list) for row in value):
+        raise RequestError(f"field {key!r} must be a list of rows")
+    return value
+
+
+def _tier1_row(payload: Dict[str, Any], key: str) -> Tier1Row:
+    d = _object(payload, key)
+    try:
+        return Tier1Row.from_dict(d)
+    except KeyError as e:
+        raise RequestError(f"field {key!r}: Tier-1 row has no {e.args[0]!r}") from None
+    except (TypeError, ValueError) as e:
+        raise RequestError(f"field {key!r}: invalid Tier-1 row ({e})") from None
+
+
+def _norm(payload: Dict[str, Any]) -> str:
+    value = _field(payload, "norm", "L2")
+    if value not in NORMS:
+        raise RequestError(f"unknown norm {value!r}; registered: {sorted(NORMS)}")
+    return value
+
+
+class _Warm:
+    """A pooled session plus the digest of the trace its stored /compute result belongs to."""
+
+    __slots__ = ("session", "digest")
+
+    def __init__(self, session: UMCPSession) -> None:
+        self.session = session
+        self.digest: Optional[str] = None
+
+    def compute(self, x_series: Sequence[Sequence[float]]) -> Any:
+        from umcp.cache import trace_digest
+
+        digest = trace_digest(x_series)
+        if digest != self.digest or self.session._compute is None:
+            self.session.compute(x_series=x_series)
+            self.digest = digest
+        return self.session._compute
+
+
+class SessionPool:
+    """
+    Warm UMCPSessions keyed by their /ingest bounds and /freeze parameters.
+
+    `checkout` lends a session exclusively to one request and returns it to the pool afterwards, so
+    sessions are never shared between threads. Up to `per_key` idle sessions are kept per key and at
+    most `max_keys` keys (least recently used keys are dropped).
+    """
+
+    def __init__(self, *, max_keys: int = DEFAULT_MAX_SESSIONS, per_key: int = DEFAULT_WORKERS) -> None:
+        self.max_keys = int(max_keys)
+        self.per_key = int(per_key)
+        self.hits = 0
+        self.misses = 0
+        self._idle: "OrderedDict[str, List[_Warm]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(ingest: Dict[str, Any], freeze: Dict[str, Any]) -> str:
+        return sha256_canonical(dict(ingest=ingest, freeze=freeze))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._idle.values())
+
+    @contextmanager
+    def checkout(self, ingest: Dict[str, Any], freeze: Dict[str, Any]) -> Iterator[_Warm]:
+        key = self.key(ingest, freeze)
+        with self._lock:
+            idle = self._idle.get(key)
+            warm = idle.pop() if idle else None
+            if warm is not None:
+                self.hits += 1
+                self._idle.move_to_end(key)
+            else:
+                self.misses += 1
+        if warm is None:
+            warm = _Warm(_new_session(ingest, freeze))
+        yield warm
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if len(idle) < self.per_key:
+                idle.append(warm)
+            while len(self._idle) > self.max_keys:
+                self._idle.popitem(last=False)
+
+
+def _new_session(ingest: Dict[str, Any], freeze: Dict[str, Any]) -> UMCPSession:
+    unknown = set(freeze) - set(_FREEZE_KEYS)
+    if unknown:
+        raise ValueError(f"unknown freeze parameters: {sorted(unknown)}")
+    args = {k: v for k, v in freeze.items() if v is not None}
+    if "domain" in args:
+        args["domain"] = domain_from_spec(args["domain"])
+    if "norm" in args:
+        args["norm"] = _norm(args)
+    return UMCPSession().ingest(lows=_field(ingest, "lows"), highs=_field(ingest, "highs")).freeze(**args)
+
+
+def _ndjson_text(write: Callable[[NDJSONWriter], Any], contract: FrozenContract) -> str:
+    buf = io.StringIO()
+    with NDJSONWriter(buf, contract=contract) as writer:
+        write(writer)
+    return buf.getvalue()
+
+
+class UMCPService:
+    """
+    Request handlers behind the daemon, independent of HTTP (each takes and returns plain data).
+
+    - kernel: Tier-1 rows for an admitted Ψ trace; the body `umcp kernel` would print.
+    - weld: one SS1m receipt from PRE/POST rows; the body `umcp weld` would print.
+    - compute: /ingest + /freeze + /compute on a pooled session, exported as NDJSON.
+    - welds: bulk welds over a pooled session's computed trace, as NDJSON receipts.
+    """
+
+    def __init__(self, *, max_sessions: int = DEFAULT_MAX_SESSIONS, per_key: int = DEFAULT_WORKERS) -> None:
+        self.contract = FrozenContract.canon_default()
+        self.gamma = GammaOmegaPower(p=self.contract.p)
+        self.pool = SessionPool(max_keys=max_sessions, per_key=per_key)
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def dispatch(self, op: str, payload: Dict[str, Any]) -> Tuple[str, str]:
+        """Run `op`; returns (content type, body)."""
+        if op not in OPS:
+            raise LookupError(f"unknown operation {op!r}")
+        with self._lock:
+            self.requests += 1
+        return getattr(self, f"op_{op}")(payload)
+
+    def op_health(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        return "application/json", json.dumps(dict(status="ok"))
+
+    def op_stats(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        return "application/json", json.dumps(
+            dict(
+                uptime=time.time() - self.started, requests=self.requests, pooled_sessions=len(self.pool),
+                pool_hits=self.pool.hits, pool_misses=self.pool.misses,
+            )
+        )
+
+    def op_kernel(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        frame = compute_tier1_frame(
+            _rows(payload, "psi"),
+            contract=self.contract,
+            weights=payload.get("weights"),
+            dt=_float(payload, "dt"),
+            h_rec=_float(payload, "h_rec"),
+            eta=_float(payload, "eta"),
+            norm=_norm(payload),
+            domain=domain_from_spec(payload.get("domain", "full")),
+        )
+        if payload.get("ndjson"):
+            return "application/x-ndjson", _ndjson_text(lambda w: w.write_rows(frame), self.contract)
+        return "application/json", json.dumps([r.to_dict() for r in frame.to_rows()], indent=2) + "\n"
+
+    def op_weld(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        c = self.contract
+        res = evaluate_weld(
+            pre=_tier1_row(payload, "pre"),
+            post=_tier1_row(payload, "post"),
+            tau_r=_float(payload, "tauR"),
+            gamma=self.gamma,
+            alpha=c.alpha,
+            tol_seam=c.tol_seam,
+            tol_id=c.tol_id,
+            infer_R=bool(payload.get("infer_R", False)),
+            R=_float(payload, "R", None),
+            theta=payload.get("theta", "θ"),
+            weld_id=payload.get("weld_id", c.weld_id),
+            pre_id=payload.get("pre_id", c.pre_doi),
+            post_id=payload.get("post_id", c.post_doi),
+        )
+        return "application/json", json.dumps(res.ss1m.to_dict(), indent=2) + "\n"
+
+    def op_compute(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        with self.pool.checkout(_object(payload, "ingest"), _object(payload, "freeze")) as warm:
+            warm.compute(_rows(payload, "x_series"))
+            buf = io.StringIO()
+            warm.session.export_ndjson(buf)
+        return "application/x-ndjson", buf.getvalue()
+
+    def op_welds(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        with self.pool.checkout(_object(payload, "ingest"), _object(payload, "freeze")) as warm:
+            warm.compute(_rows(payload, "x_series"))
+            try:
+                batch = warm.session.weld_batch(
+                    pre_index=payload.get("pre_index"),
+                    post_index=payload.get("post_index"),
+                    lag=payload.get("lag"),
+                    tau_r=payload.get("tau_r"),
+                    infer_R=payload.get("R") is None,
+                    R=payload.get("R"),
+                )
+            except IndexError as e:
+                raise RequestError(str(e)) from None
+        positions = batch.failures() if payload.get("failures_only") else range(len(batch))
+        lines = [json.dumps(r.to_dict(), ensure_ascii=False) + "\n" for r in batch.receipts(positions)]
+        return "application/x-ndjson", "".join(lines)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_PooledHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, content_type: str, body: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _run(self, payload: Dict[str, Any]) -> None:
+        op = self.path.rstrip("/").rsplit("/", 1)[-1]
+        if not self.path.startswith("/v1/") or op not in OPS:
+            self._send(404, "application/json", json.dumps(dict(error=f"unknown path {self.path}")))
+            return
+        try:
+            content_type, body = self.server.service.dispatch(op, payload)
+        except RequestError as e:
+            self._send(400, "application/json", json.dumps(dict(error=str(e))))
+        except ValueError as e:
+            # The kernel's own input checks (empty trace, ragged rows, bad weights, ...).
+            self._send(400, "application/json", json.dumps(dict(error=f"{type(e).__name__}: {e}")))
+        except Exception as e:
+            # A fault in the daemon, not in the request: log the traceback and still answer.
+            self.server.handle_error(self.request, self.client_address)
+            self._send(500, "application/json", json.dumps(dict(error=f"internal error: {type(e).__name__}: {e}")))
+        else:
+            self._send(200, content_type, body)
+
+    def do_GET(self) -> None:
+        self._run({})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self._send(413, "application/json", json.dumps(dict(error="request body too large")))
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._send(400, "application/json", json.dumps(dict(error=f"invalid JSON: {e}")))
+            return
+        if not isinstance(payload, dict):
+            self._send(400, "application/json", json.dumps(dict(error="request body must be a JSON object")))
+            return
+        self._run(payload)
+
+
+class _PooledHTTPServer(HTTPServer):
+    """
+    HTTPServer that hands each connection to a bounded thread pool instead of one thread per request.
+
+    A slot (one of `workers`) is taken before a connection is handed over, so when every worker is
+    busy the accept loop stops and further connections wait in the listen backlog rather than in an
+    unbounded executor queue.
+    """
+
+    def __init__(self, address: Tuple[str, int], service: UMCPService, *, workers: int, verbose: bool) -> None:
+        super().__init__(address, _Handler)
+        self.service = service
+        self.verbose = verbose
+        self._slots = threading.BoundedSemaphore(workers)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="umcp-worker")
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._slots.acquire()
+        try:
+            self._executor.submit(self._work, request, client_address)
+        except BaseException:
+            self._slots.release()
+            self.shutdown_request(request)
+            raise
+
+    def _work(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+
+class UMCPServer:
+    """
+    Long-lived local UMCP daemon over HTTP (loopback by default).
+
+    POST /v1/<op> with a JSON body runs `UMCPService.op_<op>`; GET /v1/health and /v1/stats report
+    liveness and pool counters. Unknown paths answer 404, invalid input 400 and daemon faults 500,
+    each with a JSON {"error": ...} body. At most `workers` requests run at once; further connections wait in
+    the listen backlog. `port=0` picks a free port (see `url`).
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        verbose: bool = False,
+    ) -> None:
+        if int(workers) < 1:
+            raise ValueError("workers must be >= 1")
+        self.service = UMCPService(max_sessions=max_sessions, per_key=workers)
+        self.httpd = _PooledHTTPServer((host, int(port)), self.service, workers=int(workers), verbose=verbose)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+
+    def start(self) -> "UMCPServer":
+        """Serve from a background thread (returns immediately)."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="umcp-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        self.httpd.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "UMCPServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+
+
+class UMCPClient:
+    """
+    Thin client for a running `UMCPServer`; `request` returns the response body text.
+
+    Error responses and connection failures (server not running, timeout) raise RuntimeError.
+    """
+
+    def __init__(self, url: str, *, timeout: float = 300.0) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = float(timeout)
+
+    def request(self, op: str, payload: Optional[Dict[str, Any]] = None) -> str:
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        req = urllib.request.Request(
+            f"{self.url}/v1/{op}", data=data, headers={"Content-Type": "application/json"},
+            method="GET" if data is None else "POST",
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                return resp.read().decode("utf-8")
+        except urllib.error.HTTPError as e:
+            try:
+                msg = json.loads(e.read().decode("utf-8"))["error"]
+            except (ValueError, KeyError):
+                msg = e.reason
+            raise RuntimeError(f"umcp server {self.url}: {e.code} {msg}") from None
+        except urllib.error.URLError as e:
+            raise RuntimeError(f"umcp server {self.url} is unreachable: {e.reason}") from None
+        except OSError as e:
+            raise RuntimeError(f"umcp server {self.url}: {e}") from None
+
+    def kernel(self, **payload: Any) -> str:
+        return self.request("kernel", payload)
+
+    def weld(self, **payload: Any) -> str:
+        return self.request("weld", payload)
+
+    def compute(self, **payload: Any) -> str:
+        return self.request("compute", payload)
+
+    def welds(self, **payload: Any) -> str:
+        return self.request("welds", payload)
+
+    def stats(self) -> Dict[str, Any]:
+        return json.loads(self.request("stats"))
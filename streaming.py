@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+import asyncio
+import time
+
+from umcp.contract import FrozenContract
+from umcp.kernel import IncrementalKernel, Tier1Row
+from umcp.norms import NormLike
+from umcp.regime import RegimeResult, classify_regime
+from umcp.returns import ReturnDomain
+from umcp.tier0 import ClipFlag, l2_norm, normalize_to_admitted_trace_compact
+
+STAGES = ("tier0", "tier1", "regime")
+EMIT_MODES = ("rows", "changes", "both")
+
+
+@dataclass(frozen=True, slots=True)
+class StreamRow:
+    """One admitted sample leaving the pipeline: its Tier-1 row, regime label and Tier-0 clip flags."""
+
+    row: Tier1Row
+    regime: RegimeResult
+    clip_flags: Tuple[ClipFlag, ...]
+
+    @property
+    def t(self) -> int:
+        return self.row.t
+
+
+@dataclass(frozen=True, slots=True)
+class RegimeChange:
+    """Emitted at the first row t whose (regime, Critical) label differs from row t − 1."""
+
+    t: int
+    previous: Optional[RegimeResult]
+    current: RegimeResult
+
+
+StreamEvent = StreamRow | RegimeChange
+
+
+@dataclass(slots=True)
+class StageStats:
+    """
+    Per-stage counters: items processed, time spent working, and latency from a sample's arrival
+    at the pipeline to the end of this stage (end-to-end latency up to and including the stage).
+    """
+
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items per second of stage work time."""
+        return self.items / self.busy_seconds if self.busy_seconds > 0.0 else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.latency_total / self.items if self.items else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(
+            name=self.name, items=self.items, busy_seconds=self.busy_seconds, throughput=self.throughput,
+            mean_latency=self.mean_latency, max_latency=self.latency_max,
+        )
+
+
+class _End:
+    """Queue sentinel: the source is exhausted."""
+
+
+class _Failure:
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+_END = _End()
+
+# Items between stages are (arrival time, payload) tuples.
+_Item = Tuple[float, Any]
+
+
+class StreamingPipeline:
+    """
+    Asyncio ingest → compute → regime → export pipeline over an async stream of raw samples x(t).
+
+    Tier-0 normalization, the Tier-1 kernel (`IncrementalKernel`) and regime labelling run as
+    separate tasks joined by bounded queues (`queue_size`), so a slow consumer applies
+    backpressure all the way to the source. Each stage drains up to `batch_size` queued samples
+    per step; with an `executor` (a thread pool: stages are stateful and run one batch at a time)
+    that step runs off the event loop. Emitted rows equal `UMCPSession.compute` on the same trace.
+
+    `run(source)` yields StreamRow and/or RegimeChange events (`emit`); `stats` holds per-stage
+    throughput and latency.
+    """
+
+    def __init__(
+        self,
+        *,
+        lows: Sequence[float],
+        highs: Sequence[float],
+        contract: Optional[FrozenContract] = None,
+        weights: Optional[Sequence[float]] = None,
+        dt: float,
+        h_rec: float,
+        eta: Optional[float] = None,
+        norm: NormLike = l2_norm,
+        domain: Optional[ReturnDomain] = None,
+        return_search: str = "scan",
+        queue_size: int = 1024,
+        batch_size: int = 64,
+        executor: Optional[Executor] = None,
+        emit: str = "rows",
+    ) -> None:
+        if emit not in EMIT_MODES:
+            raise ValueError(f"emit must be one of {EMIT_MODES}")
+        if int(queue_size) < 1 or int(batch_size) < 1:
+            raise ValueError("queue_size and batch_size must be >= 1")
+        self.lows = list(lows)
+        self.highs = list(highs)
+        self.kernel_args = dict(
+            contract=contract or FrozenContract.canon_default(), weights=weights, dt=dt, h_rec=h_rec, eta=eta,
+            norm=norm, domain=domain, return_search=return_search,
+        )
+        self.queue_size = int(queue_size)
+        self.batch_size = int(batch_size)
+        self.executor = executor
+        self.emit = emit
+        self.stats: Dict[str, StageStats] = {name: StageStats(name) for name in STAGES}
+
+    @classmethod
+    def from_session(cls, session: Any, **options: Any) -> "StreamingPipeline":
+        """Pipeline using a session's declared /ingest bounds and /freeze settings."""
+        if session._ingest is None or session._freeze is None:
+            raise RuntimeError("Nonconformant: /ingest and /freeze must be declared before streaming")
+        fz = session._freeze
+        return cls(
+            lows=session._ingest.lows, highs=session._ingest.highs, contract=fz.contract, weights=fz.weights,
+            dt=fz.dt, h_rec=fz.h_rec, eta=fz.eta, norm=fz.norm, domain=fz.domain, **options,
+        )
+
+    def report(self) -> List[Dict[str, Any]]:
+        return [self.stats[name].to_dict() for name in STAGES]
+
+    async def run(self, source: AsyncIterable[Sequence[float]]) -> AsyncIterator[StreamEvent]:
+        """Stream events for every sample of `source`, in order."""
+        self.stats = {name: StageStats(name) for name in STAGES}
+        kernel = IncrementalKernel(**self.kernel_args)
+        previous: List[Optional[RegimeResult]] = [None]
+
+        def tier0(batch: List[_Item]) -> List[_Item]:
+            psi, mask = normalize_to_admitted_trace_compact([x for _, x in batch], lows=self.lows, highs=self.highs)
+            flags = mask.to_flags()
+            return [(arrival, (c, tuple(f))) for (arrival, _), c, f in zip(batch, psi, flags)]
+
+        def tier1(batch: List[_Item]) -> List[_Item]:
+            return [(arrival, (kernel.push(c), flags)) for arrival, (c, flags) in batch]
+
+        def regime(batch: List[_Item]) -> List[_Item]:
+            out: List[_Item] = []
+            for arrival, (row, flags) in batch:
+                label = classify_regime(row)
+                prev = previous[0]
+                if self.emit != "rows" and (prev is None or prev != label):
+                    out.append((arrival, RegimeChange(t=row.t, previous=prev, current=label)))
+                if self.emit != "changes":
+                    out.append((arrival, StreamRow(row=row, regime=label, clip_flags=flags)))
+                previous[0] = label
+            return out
+
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(len(STAGES) + 1)]
+        tasks = [asyncio.ensure_future(self._read(source, queues[0]))]
+        for k, (name, fn) in enumerate(zip(STAGES, (tier0, tier1, regime))):
+            tasks.append(asyncio.ensure_future(self._stage(name, fn, queues[k], queues[k + 1])))
+        out = queues[-1]
+        try:
+            while True:
+                item = await out.get()
+                if item is _END:
+                    break
+                if isinstance(item, _Failure):
+                    raise item.exc
+                yield item[1]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _read(self, source: AsyncIterable[Sequence[float]], outq: asyncio.Queue) -> None:
+        try:
+            async for x in source:
+                await outq.put((time.perf_counter(), x))
+        except Exception as exc:
+            await outq.put(_Failure(exc))
+            return
+        await outq.put(_END)
+
+    async def _stage(
+        self,
+        name: str,
+        fn: Callable[[List[_Item]], List[_Item]],
+        inq: asyncio.Queue,
+        outq: asyncio.Queue,
+    ) -> None:
+        stats = self.stats[name]
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[_Item] = []
+            tail: Any = None
+            item = await inq.get()
+            while True:
+                if item is _END or isinstance(item, _Failure):
+                    tail = item
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size or inq.empty():
+                    break
+                item = inq.get_nowait()
+            if batch:
+                start = time.perf_counter()
+                try:
+                    if self.executor is None:
+                        results = fn(batch)
+                    else:
+                        results = await loop.run_in_executor(self.executor, fn, batch)
+                except Exception as exc:
+                    await outq.put(_Failure(exc))
+                    return
+                done = time.perf_counter()
+                stats.busy_seconds += done - start
+                stats.items += len(batch)
+                for arrival, _ in batch:
+                    lat = done - arrival
+                    stats.latency_total += lat
+                    if lat > stats.latency_max:
+                        stats.latency_max = lat
+                for r in results:
+                    await outq.put(r)
+            if tail is not None:
+                await outq.put(tail)
+                return
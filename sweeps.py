@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import math
+
+from umcp.backend import require_numpy, resolve_backend
+from umcp.closures import GammaClosure, gamma_batch
+from umcp.kernel import Tier1Row
+from umcp.weld import WeldBatch, _trace_column, _weld_pairs, evaluate_weld_batch
+
+
+def _gamma_id(gamma: GammaClosure) -> str:
+    return getattr(gamma, "closure_id", gamma.__class__.__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ClosureConfig:
+    """One grid point of a closure sweep: Γ(ω), α and the seam / identity tolerances."""
+
+    gamma: GammaClosure
+    alpha: float
+    tol_seam: float
+    tol_id: float
+
+    @property
+    def config_id(self) -> str:
+        return f"{_gamma_id(self.gamma)};alpha={self.alpha:g};tol_seam={self.tol_seam:g};tol_id={self.tol_id:g}"
+
+
+def closure_grid(
+    *,
+    gammas: Iterable[GammaClosure],
+    alphas: Iterable[float],
+    tol_seams: Iterable[float],
+    tol_ids: Iterable[float],
+) -> List[ClosureConfig]:
+    """Cartesian product of closures, α values and tolerances (Γ outermost, tol_id innermost)."""
+    alphas, tol_seams, tol_ids = list(alphas), list(tol_seams), list(tol_ids)
+    return [
+        ClosureConfig(gamma=g, alpha=float(a), tol_seam=float(ts), tol_id=float(ti))
+        for g in gammas
+        for a in alphas
+        for ts in tol_seams
+        for ti in tol_ids
+    ]
+
+
+class ClosureSweep:
+    """
+    PASS flags for one seam set under every configuration of a closure grid.
+
+    `pass_ok[k][j]` is the weld outcome of pair j under `configs[k]`. Receipts for one configuration
+    are re-evaluated on demand with `welds(k)`.
+    """
+
+    __slots__ = ("configs", "pre_index", "post_index", "pass_ok", "_weld_args")
+
+    def __init__(
+        self,
+        *,
+        configs: Sequence[ClosureConfig],
+        pre_index: Sequence[int],
+        post_index: Sequence[int],
+        pass_ok: Sequence[Sequence[bool]],
+        weld_args: Dict[str, Any],
+    ) -> None:
+        self.configs = list(configs)
+        self.pre_index = pre_index
+        self.post_index = post_index
+        self.pass_ok = pass_ok
+        self._weld_args = weld_args
+
+    def __len__(self) -> int:
+        return len(self.configs)
+
+    def pass_counts(self) -> List[int]:
+        return [int(sum(bool(x) for x in row)) for row in self.pass_ok]
+
+    def passing(self, k: int) -> List[int]:
+        """Pair positions that PASS under configs[k]."""
+        return [j for j, ok in enumerate(self.pass_ok[k]) if ok]
+
+    def table(self) -> List[Dict[str, Any]]:
+        """One summary record per configuration (the PASS-region map)."""
+        total = len(self.post_index)
+        return [
+            dict(
+                config_id=cfg.config_id, gamma_id=_gamma_id(cfg.gamma), alpha=cfg.alpha, tol_seam=cfg.tol_seam,
+                tol_id=cfg.tol_id, passed=passed, total=total,
+            )
+            for cfg, passed in zip(self.configs, self.pass_counts())
+        ]
+
+    def welds(self, k: int) -> WeldBatch:
+        """Full weld columns and receipts for configs[k] (same pairs, evaluated with `evaluate_weld_batch`)."""
+        cfg = self.configs[k]
+        return evaluate_weld_batch(
+            pre_index=self.pre_index, post_index=self.post_index, gamma=cfg.gamma, alpha=cfg.alpha,
+            tol_seam=cfg.tol_seam, tol_id=cfg.tol_id, **self._weld_args,
+        )
+
+
+def sweep_closures(
+    tier1: Sequence[Tier1Row],
+    *,
+    pre_index: int | Sequence[int],
+    post_index: Sequence[int],
+    configs: Sequence[ClosureConfig],
+    tau_r: Optional[float | Sequence[float]] = None,
+    infer_R: bool = False,
+    R: Optional[float] = None,
+    backend: str = "python",
+) -> ClosureSweep:
+    """
+    Weld one seam set under every closure configuration in a single pass.
+
+    Pair inputs (Δκ, ir and the identity error, τR, C) are computed once; Γ is evaluated once per
+    distinct closure over the distinct PRE rows (`gamma_batch`); the residual s once per (Γ, α); and
+    each tolerance setting is then a comparison. PASS flags equal `evaluate_weld` for every pair and
+    configuration, with either engine.
+    """
+    if R is None and not infer_R:
+        raise ValueError("R must be provided unless infer_R=True")
+    pre_idx, post_idx, tau = _weld_pairs(tier1, pre_index, post_index, tau_r)
+    kappa = _trace_column(tier1, "kappa")
+    I = _trace_column(tier1, "I")
+    omega = _trace_column(tier1, "omega")
+    C = _trace_column(tier1, "C")
+    distinct = sorted(set(pre_idx))
+    slot = {i: k for k, i in enumerate(distinct)}
+    pre_slot = [slot[i] for i in pre_idx]
+    omega_pre = [float(omega[i]) for i in distinct]
+
+    gammas: Dict[int, Tuple[GammaClosure, List[float]]] = {}
+    for cfg in configs:
+        if id(cfg.gamma) not in gammas:
+            gammas[id(cfg.gamma)] = (cfg.gamma, [float(x) for x in gamma_batch(cfg.gamma, omega_pre)])
+    weld_args = dict(tier1=tier1, tau_r=tau_r, infer_R=infer_R, R=R, backend=backend)
+
+    if resolve_backend(backend) == "numpy":
+        np = require_numpy("sweep_closures")
+        pre_a = np.asarray(pre_idx, dtype=np.intp)
+        post_a = np.asarray(post_idx, dtype=np.intp)
+        slot_a = np.asarray(pre_slot, dtype=np.intp)
+        K = np.asarray(kappa, dtype=np.float64)
+        Iv = np.asarray(I, dtype=np.float64)
+        C_pre = np.asarray(C, dtype=np.float64)[pre_a]
+        tau_a = np.asarray(tau, dtype=np.float64)
+        dk = K[post_a] - K[pre_a]
+        I_pre = Iv[pre_a]
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            ratio = np.where(I_pre != 0.0, Iv[post_a] / np.where(I_pre != 0.0, I_pre, 1.0), math.inf)
+            ir = np.fromiter(map(math.exp, dk.tolist()), dtype=np.float64, count=dk.size)
+            id_err = np.abs(ratio - ir)
+        return_ok = np.isfinite(tau_a)
+        live = return_ok & (tau_a != 0.0)
+        abs_s: Dict[Tuple[int, float], Any] = {}
+        rows = []
+        for cfg in configs:
+            key = (id(cfg.gamma), cfg.alpha)
+            if key not in abs_s:
+                D_omega = np.asarray(gammas[id(cfg.gamma)][1], dtype=np.float64)[slot_a]
+                with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                    debit = dk + D_omega + cfg.alpha * C_pre
+                    if R is None:
+                        R_a = np.where(live, debit / np.where(live, tau_a, 1.0), 0.0)
+                    else:
+                        R_a = np.full(dk.size, float(R))
+                    return_term = np.where(return_ok, R_a * np.where(return_ok, tau_a, 0.0), 0.0)
+                    abs_s[key] = np.abs(return_term - debit)
+            rows.append((abs_s[key] <= cfg.tol_seam) & return_ok & (id_err <= cfg.tol_id))
+        pass_ok: Any = np.vstack(rows) if rows else np.zeros((0, len(post_idx)), dtype=bool)
+        return ClosureSweep(configs=configs, pre_index=pre_idx, post_index=post_idx, pass_ok=pass_ok, weld_args=weld_args)
+
+    base = []
+    for a, b, tau_r_val in zip(pre_idx, post_idx, tau):
+        delta_kappa = float(kappa[b] - kappa[a])
+        ir_ratio = float(I[b] / I[a]) if I[a] != 0.0 else math.inf
+        id_err = abs(ir_ratio - float(math.exp(delta_kappa)))
+        base.append((delta_kappa, id_err, float(C[a]), tau_r_val, math.isfinite(tau_r_val)))
+    abs_s_py: Dict[Tuple[int, float], List[float]] = {}
+    flags: List[Sequence[bool]] = []
+    for cfg in configs:
+        key = (id(cfg.gamma), cfg.alpha)
+        if key not in abs_s_py:
+            d_omega = gammas[id(cfg.gamma)][1]
+            out = []
+            for (delta_kappa, _, c_pre, tau_r_val, return_ok), k in zip(base, pre_slot):
+                D_omega = d_omega[k]
+                D_C = cfg.alpha * c_pre
+                if R is None:
+                    R_val = 0.0 if not return_ok or tau_r_val == 0.0 else float((delta_kappa + D_omega + D_C) / tau_r_val)
+                else:
+                    R_val = float(R)
+                return_term = float(R_val * tau_r_val) if return_ok else 0.0
+                out.append(abs(float(return_term - (delta_kappa + D_omega + D_C))) if return_ok else math.inf)
+            abs_s_py[key] = out
+        tol_seam, tol_id = cfg.tol_seam, cfg.tol_id
+        flags.append(
+            array(
+                "b",
+                (
+                    (s <= tol_seam) and ok and (e <= tol_id)
+                    for s, (_, e, _, _, ok) in zip(abs_s_py[key], base)
+                ),
+            )
+        )
+    return ClosureSweep(configs=configs, pre_index=pre_idx, post_index=post_idx, pass_ok=flags, weld_args=weld_args)
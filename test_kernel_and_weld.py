@@ -1,9 +1,29 @@
+import asyncio
+import io
+import json
 import math
+import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from umcp.closures import GammaOmegaPower
+import pytest
+
+from umcp.closures import GammaNegLogOneMinusOmega, GammaOmegaPower, gamma_batch
 from umcp.contract import FrozenContract
-from umcp.kernel import compute_tier1_series
-from umcp.weld import evaluate_weld
+from umcp.cli import main as cli_main
+from umcp.kernel import Tier1Frame, compute_tier1_series
+from umcp.ndjson import read_ndjson
+from umcp.backend import have_numpy
+from umcp.archive import Tier1Archive
+from umcp.cache import ComputeCache
+from umcp.norms import CallableNorm, WeightedL2Norm
+from umcp.pipeline import UMCPSession
+from umcp.regime import RegimeIndex
+from umcp.server import UMCPClient, UMCPServer
+from umcp.streaming import RegimeChange, StreamingPipeline, StreamRow
+from umcp.sweeps import closure_grid, sweep_closures
+from umcp.tier0 import l2_norm
+from umcp.weld import evaluate_weld, evaluate_weld_batch
 
 
 def test_identity_I_equals_exp_kappa():
@@ -50,3 +70,389 @@ def test_weld_passes_when_constructed_to_close_budget():
     assert weld.ss1m.return_ok
     assert weld.ss1m.identity_ok
     assert abs(weld.ss1m.s) <= contract.tol_seam
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_weld_batch_matches_single_welds(backend):
+    if backend == "numpy" and not have_numpy():
+        pytest.skip("numpy not installed")
+    rng = random.Random(3)
+    xs = [[0.9 + rng.uniform(-0.01, 0.01) for _ in range(4)] for _ in range(40)]
+    sess = UMCPSession().ingest(lows=[0.0] * 4, highs=[1.0] * 4).freeze(dt=1.0, h_rec=10.0, eta=0.02)
+    sess.compute(x_series=xs)
+
+    batch = sess.weld_batch(lag=3, backend=backend)
+    assert len(batch) == 37
+    for k in range(len(batch)):
+        ref = sess.weld(pre_index=k, post_index=k + 3, tau_r=sess._compute.tier1[k + 3].tau_R).ss1m
+        assert batch.receipt(k) == ref
+    assert [r.pass_ok for r in batch.receipts()] == [False] * (len(batch) - batch.pass_count)
+
+    anchored = sess.weld_batch(pre_index=0, post_index=[5, 9, -1], tau_r=0.8, R=0.01, infer_R=False, backend=backend)
+    for k, post in enumerate([5, 9, -1]):
+        ref = sess.weld(pre_index=0, post_index=post, tau_r=0.8, R=0.01, infer_R=False).ss1m
+        assert anchored.receipt(k) == ref
+
+
+@pytest.mark.parametrize("R", [0.0, 0.01, 0.05])
+def test_seam_search_matches_brute_force(R):
+    rng = random.Random(5)
+    x, xs = [0.9] * 4, []
+    for _ in range(200):
+        x = [min(1.0, max(0.0, v + rng.uniform(-0.01, 0.01))) for v in x]
+        xs.append(x)
+    sess = UMCPSession().ingest(lows=[0.0] * 4, highs=[1.0] * 4)
+    sess.freeze(dt=1.0, h_rec=20.0, eta=0.03, tol_seam=0.01).compute(x_series=xs)
+
+    pairs = [(a, b) for b in range(len(xs)) for a in range(max(0, b - 40), b)]
+    brute = sess.weld_batch(pre_index=[p[0] for p in pairs], post_index=[p[1] for p in pairs], R=R, infer_R=False)
+    expected = [brute.receipt(k) for k in range(len(brute)) if brute.column("pass_ok")[k]]
+
+    found = sess.seam_search(R=R, max_span=40)
+    assert expected and found.receipts(range(len(found))) == expected
+
+
+def test_gamma_batch_matches_scalar_closures():
+    omegas = [i / 50.0 - 0.5 for i in range(101)]
+    for gamma in (GammaOmegaPower(p=2), GammaOmegaPower(p=3), GammaNegLogOneMinusOmega()):
+        assert gamma_batch(gamma, omegas) == [gamma(o) for o in omegas]
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_closure_sweep_matches_per_config_welds(backend):
+    if backend == "numpy" and not have_numpy():
+        pytest.skip("numpy not installed")
+    rng = random.Random(8)
+    xs = [[0.9 + rng.uniform(-0.02, 0.02) for _ in range(4)] for _ in range(60)]
+    sess = UMCPSession().ingest(lows=[0.0] * 4, highs=[1.0] * 4).freeze(dt=1.0, h_rec=10.0, eta=0.05)
+    tier1 = sess.compute(x_series=xs).tier1
+    configs = closure_grid(
+        gammas=[GammaOmegaPower(p=2), GammaOmegaPower(p=3), GammaNegLogOneMinusOmega()],
+        alphas=[0.0, 1.0],
+        tol_seams=[0.005, 0.05],
+        tol_ids=[1e-9],
+    )
+    pre, post = list(range(0, 50)), list(range(10, 60))
+    sweep = sweep_closures(tier1, pre_index=pre, post_index=post, configs=configs, R=0.01, backend=backend)
+    counts = sweep.pass_counts()
+    assert len(set(counts)) > 1
+    for k, cfg in enumerate(configs):
+        ref = evaluate_weld_batch(
+            tier1, pre_index=pre, post_index=post, gamma=cfg.gamma, alpha=cfg.alpha, tol_seam=cfg.tol_seam,
+            tol_id=cfg.tol_id, R=0.01,
+        )
+        assert [bool(x) for x in sweep.pass_ok[k]] == [bool(x) for x in ref.column("pass_ok")]
+        assert sweep.welds(k).receipts(range(len(post))) == ref.receipts(range(len(post)))
+    assert [row["passed"] for row in sweep.table()] == counts
+
+    # A seam that never returns fails even when the seam tolerance accepts any residual.
+    lax = closure_grid(gammas=[GammaOmegaPower(p=3)], alphas=[1.0], tol_seams=[math.inf], tol_ids=[math.inf])
+    inf_tau = [math.inf] * len(post)
+    sweep = sweep_closures(tier1, pre_index=pre, post_index=post, configs=lax, tau_r=inf_tau, R=0.01, backend=backend)
+    ref = evaluate_weld_batch(
+        tier1, pre_index=pre, post_index=post, tau_r=inf_tau, gamma=lax[0].gamma, alpha=1.0, tol_seam=math.inf,
+        tol_id=math.inf, R=0.01,
+    )
+    assert [bool(x) for x in sweep.pass_ok[0]] == [bool(x) for x in ref.column("pass_ok")] == [False] * len(post)
+
+
+def test_compute_cache_round_trip_and_eviction(tmp_path):
+    rng = random.Random(17)
+    xs = [[rng.uniform(-1.0, 11.0) for _ in range(3)] for _ in range(80)]
+
+    def session(eta):
+        return UMCPSession().ingest(lows=[0.0] * 3, highs=[10.0] * 3).freeze(dt=1.0, h_rec=10.0, eta=eta)
+
+    cache = ComputeCache(tmp_path, max_entries=2)
+    fresh = session(0.2).compute(x_series=xs, cache=cache)
+    cached = session(0.2).compute(x_series=xs, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached.tier1 == fresh.tier1 and cached.psi == fresh.psi
+    assert cached.regimes == fresh.regimes and cached.clip_flags == fresh.clip_flags
+
+    session(0.3).compute(x_series=xs, cache=cache)
+    session(0.2).compute(x_series=xs[:-1], cache=cache)
+    assert cache.misses == 3 and len(cache.entries()) == 2
+
+    for p, _, _ in cache.entries():
+        p.write_bytes(p.read_bytes()[:-5])
+    session(0.3).compute(x_series=xs, cache=str(tmp_path))
+    assert len(ComputeCache(tmp_path).entries()) == 2
+
+
+def test_compute_cache_keys_norms_at_full_precision(tmp_path):
+    rng = random.Random(21)
+    xs = [[rng.uniform(0.0, 10.0) for _ in range(2)] for _ in range(60)]
+
+    def session(norm):
+        return UMCPSession().ingest(lows=[0.0] * 2, highs=[10.0] * 2).freeze(dt=1.0, h_rec=20.0, eta=0.05, norm=norm)
+
+    cache = ComputeCache(tmp_path)
+    # Same norm_id, different distances: callable norms are never served from the cache.
+    near = CallableNorm(lambda a, b: l2_norm(a, b), norm_id="custom")
+    far = CallableNorm(lambda a, b: 100.0 * l2_norm(a, b), norm_id="custom")
+    assert session(near).compute(x_series=xs, cache=cache).tier1 != session(far).compute(x_series=xs, cache=cache).tier1
+    assert (cache.hits, cache.misses, len(cache.entries())) == (0, 0, 0)
+
+    # Weights that print the same under %g are still different keys.
+    a, b = WeightedL2Norm((1.0, 1.0)), WeightedL2Norm((1.0, 1.0000001))
+    assert a.norm_id == b.norm_id
+    session(a).compute(x_series=xs, cache=cache)
+    session(b).compute(x_series=xs, cache=cache)
+    session(a).compute(x_series=xs, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_session_append_matches_full_recompute():
+    rng = random.Random(18)
+    xs = [[rng.uniform(-1.0, 11.0) for _ in range(3)] for _ in range(120)]
+
+    def session():
+        return UMCPSession().ingest(lows=[0.0] * 3, highs=[10.0] * 3).freeze(dt=0.5, h_rec=6.0, eta=0.45)
+
+    full = session().compute(x_series=xs)
+    sess = session()
+    frame = sess.compute(x_series=xs[:37]).tier1
+    index = sess.regime_index()
+    for a, b in ((37, 38), (38, 50), (50, 120)):
+        grown = sess.append(x_new=xs[a:b])
+    assert sess.regime_index() is index and len(index) == len(xs)
+    assert index.transitions() == RegimeIndex(full.regimes).transitions()
+    assert sess.compute(x_series=xs).regimes == full.regimes and sess.regime_index() is not index
+    assert isinstance(full.tier1, Tier1Frame) and grown.tier1 is frame and grown.tier1.psi is grown.psi
+    assert grown.psi == full.psi and grown.tier1 == full.tier1
+    assert grown.regimes == full.regimes and grown.regimes.run_starts == full.regimes.run_starts
+    assert grown.clip_flags == full.clip_flags
+    assert grown.clip_mask.below_counts == full.clip_mask.below_counts
+
+
+def test_streaming_pipeline_matches_compute():
+    rng = random.Random(19)
+    xs = [[rng.uniform(-1.0, 11.0) for _ in range(3)] for _ in range(150)]
+    sess = UMCPSession().ingest(lows=[0.0] * 3, highs=[10.0] * 3).freeze(dt=0.5, h_rec=6.0, eta=0.45)
+    full = sess.compute(x_series=xs)
+
+    async def source():
+        for x in xs:
+            yield x
+
+    async def collect(pipe):
+        return [ev async for ev in pipe.run(source())]
+
+    for opts in (dict(), dict(queue_size=1, batch_size=7, executor=ThreadPoolExecutor(max_workers=1))):
+        pipe = StreamingPipeline.from_session(sess, emit="both", **opts)
+        events = asyncio.run(collect(pipe))
+        rows = [ev for ev in events if isinstance(ev, StreamRow)]
+        changes = [ev for ev in events if isinstance(ev, RegimeChange)]
+        assert [r.row for r in rows] == full.tier1
+        assert [r.regime for r in rows] == list(full.regimes)
+        assert [list(r.clip_flags) for r in rows] == full.clip_flags
+        assert [c.t for c in changes] == [run.start for run in full.regimes.runs()]
+        assert all(s["items"] == len(xs) for s in pipe.report())
+
+    async def broken():
+        yield xs[0]
+        raise OSError("sensor lost")
+
+    async def drain():
+        return [ev async for ev in StreamingPipeline.from_session(sess).run(broken())]
+
+    with pytest.raises(OSError, match="sensor lost"):
+        asyncio.run(drain())
+
+
+def test_ndjson_export_round_trips_and_matches_kernel_cli(tmp_path, capsys):
+    rng = random.Random(20)
+    xs = [[rng.uniform(0.0, 10.0) for _ in range(3)] for _ in range(60)]
+    sess = UMCPSession().ingest(lows=[0.0] * 3, highs=[10.0] * 3).freeze(dt=0.5, h_rec=6.0, eta=0.45)
+    res = sess.compute(x_series=xs)
+    buf = io.StringIO()
+    assert sess.export_ndjson(buf, buffer_rows=7) == len(xs)
+    lines = buf.getvalue().splitlines()
+    assert len(lines) == len(xs) + 1 and "weights" not in json.loads(lines[1])
+    header, records = read_ndjson(lines)
+    assert header["contract"] == FrozenContract.canon_default().snapshot_dict()
+    rows, regimes = zip(*records)
+    assert list(rows) == res.tier1 and list(regimes) == list(res.regimes)
+
+    csv = tmp_path / "psi.csv"
+    csv.write_text("\n".join(",".join(repr(c) for c in p) for p in res.psi), encoding="utf-8")
+    argv = ["kernel", "--csv", str(csv), "--dt", "0.5", "--hrec", "6.0", "--eta", "0.45", "--window", "16"]
+    assert cli_main(argv + ["--ndjson"]) == 0
+    _, records = read_ndjson(capsys.readouterr().out.splitlines())
+    assert [row for row, _ in records] == res.tier1
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_archive_round_trips_and_reads_windows(tmp_path, codec):
+    rng = random.Random(21)
+    xs = [[rng.uniform(-1.0, 11.0) for _ in range(3)] for _ in range(100)]
+    sess = UMCPSession().ingest(lows=[0.0] * 3, highs=[10.0] * 3).freeze(dt=0.5, h_rec=6.0, eta=0.45)
+    res = sess.compute(x_series=xs)
+    path = sess.export_archive(tmp_path / "run.umcpa", block_rows=16, codec=codec)
+    with Tier1Archive(path) as arc:
+        assert arc.contract == FrozenContract.canon_default().snapshot_dict()
+        assert arc.rows(30, 47) == res.tier1[30:47]
+        assert arc.column("kappa", 15, 17) == [r.kappa for r in res.tier1[15:17]]
+        assert arc.regimes(90, 200) == list(res.regimes)[90:]
+        assert arc.rows(50, 50) == []
+        back = arc.load()
+    assert isinstance(back.tier1, Tier1Frame) and back.tier1.column("kappa") == res.tier1.column("kappa")
+    assert back.psi == res.psi and back.tier1 == res.tier1 and back.regimes == res.regimes
+    assert back.clip_flags == res.clip_flags
+
+
+def test_daemon_matches_local_cli_and_pools_sessions(tmp_path, capsys):
+    rng = random.Random(22)
+    xs = [[rng.uniform(0.0, 10.0) for _ in range(3)] for _ in range(40)]
+    ingest, freeze = dict(lows=[0.0] * 3, highs=[10.0] * 3), dict(dt=0.5, h_rec=6.0, eta=0.45)
+    sess = UMCPSession().ingest(**ingest).freeze(**freeze)
+    res = sess.compute(x_series=xs)
+    local = io.StringIO()
+    sess.export_ndjson(local)
+    csv = tmp_path / "psi.csv"
+    csv.write_text("\n".join(",".join(repr(c) for c in p) for p in res.psi), encoding="utf-8")
+    (tmp_path / "pre.json").write_text(json.dumps(res.tier1[3].to_dict()), encoding="utf-8")
+    (tmp_path / "post.json").write_text(json.dumps(res.tier1[9].to_dict()), encoding="utf-8")
+    kernel = ["kernel", "--csv", str(csv), "--dt", "0.5", "--hrec", "6.0", "--eta", "0.45"]
+    weld = ["weld", "--pre", str(tmp_path / "pre.json"), "--post", str(tmp_path / "post.json"), "--tauR", "3.0", "--infer-R"]
+
+    with UMCPServer(port=0, workers=2) as server:
+        client = UMCPClient(server.url)
+        for argv in (kernel, kernel + ["--ndjson"], weld):
+            assert cli_main(argv) == 0
+            expected = capsys.readouterr().out
+            assert cli_main(["--server", server.url] + argv) == 0
+            assert capsys.readouterr().out == expected
+        for _ in range(3):
+            assert client.compute(ingest=ingest, freeze=freeze, x_series=xs) == local.getvalue()
+        receipts = client.welds(ingest=ingest, freeze=freeze, x_series=xs, lag=5).splitlines()
+        assert len(receipts) == len(xs) - 5
+        stats = client.stats()
+        assert stats["pool_misses"] == 1 and stats["pool_hits"] == 3
+        with pytest.raises(RuntimeError, match="400"):
+            client.compute(ingest=ingest, freeze=dict(freeze, bogus=1), x_series=xs)
+        with pytest.raises(RuntimeError, match="400 missing field 'x_series'"):
+            client.compute(ingest=ingest, freeze=freeze)
+        with pytest.raises(RuntimeError, match="400 weld index out of range"):
+            client.welds(ingest=ingest, freeze=freeze, x_series=xs, pre_index=[0], post_index=[len(xs)])
+        with pytest.raises(RuntimeError, match="404"):
+            client.request("__init__", {})
+        url = server.url
+    with pytest.raises(SystemExit, match="unreachable"):
+        cli_main(["--server", url] + weld)
+
+
+def test_kernel_stream_reads_stdin_and_emits_labelled_rows(monkeypatch, capsys):
+    monkeypatch.delenv("UMCP_SERVER", raising=False)
+    rng = random.Random(23)
+    xs = [[rng.uniform(0.0, 10.0) for _ in range(3)] for _ in range(50)]
+    res = UMCPSession().ingest(lows=[0.0] * 3, highs=[10.0] * 3).freeze(dt=0.5, h_rec=6.0, eta=0.45).compute(x_series=xs)
+    feed = "\n".join(",".join(repr(c) for c in p) for p in res.psi) + "\n\n"
+    monkeypatch.setattr("sys.stdin", io.StringIO(feed))
+    argv = ["kernel", "--csv", "-", "--stream", "--dt", "0.5", "--hrec", "6.0", "--eta", "0.45"]
+    assert cli_main(argv) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(xs) + 1
+    _, records = read_ndjson(lines)
+    rows, regimes = zip(*records)
+    assert list(rows) == res.tier1 and list(regimes) == list(res.regimes)
+
+    # --stream never forwards to a daemon or switches engine; both are rejected rather than ignored.
+    with pytest.raises(SystemExit, match="--server"):
+        cli_main(["--server", "http://127.0.0.1:9", *argv])
+    monkeypatch.setenv("UMCP_SERVER", "http://127.0.0.1:9")
+    with pytest.raises(SystemExit, match="UMCP_SERVER"):
+        cli_main(argv)
+    monkeypatch.delenv("UMCP_SERVER")
+    with pytest.raises(SystemExit, match="--backend"):
+        cli_main([*argv, "--backend", "numpy"])
+
+
+def test_batch_cli_runs_in_parallel_and_skips_done_inputs(tmp_path, capsys):
+    rng = random.Random(24)
+    data = tmp_path / "in"
+    data.mkdir()
+    traces = {}
+    for k in range(3):
+        psi = [[rng.uniform(0.05, 0.95) for _ in range(3)] for _ in range(30 + 10 * k)]
+        traces[f"asset{k}"] = compute_tier1_series(psi, contract=FrozenContract.canon_default(), dt=0.5, h_rec=6.0, eta=0.3)
+        (data / f"asset{k}.csv").write_text("\n".join(",".join(repr(c) for c in p) for p in psi), encoding="utf-8")
+    argv = ["batch", str(data), "--out", str(tmp_path / "out"), "--jobs", "2", "--window", "16", "--weld-lag", "4",
+            "--dt", "0.5", "--hrec", "6.0", "--eta", "0.3"]
+
+    assert cli_main(argv) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["processed"], summary["skipped"], summary["rows"]) == (3, 0, 30 + 40 + 50)
+    index = json.loads((tmp_path / "out" / "index.json").read_text(encoding="utf-8"))
+    for key, entry in index["entries"].items():
+        assert entry["output"] == f"{Path(entry['input']).stem}-{key[:16]}.ndjson"
+        with open(tmp_path / "out" / entry["output"], encoding="utf-8") as f:
+            header, records = read_ndjson(f)
+            assert header["key"] == key
+            assert [row for row, _ in records] == traces[Path(entry["input"]).stem]
+        assert entry["weld_total"] == entry["rows"] - 4
+        welds = (tmp_path / "out" / entry["weld_output"]).read_text(encoding="utf-8").splitlines()
+        assert len(welds) == entry["weld_total"] - entry["weld_pass"]
+
+    assert cli_main(argv + ["--skip-done"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["processed"], summary["skipped"]) == (0, 3)
+
+    # An output overwritten by another run no longer counts as done.
+    first = next(iter(index["entries"].values()))
+    (tmp_path / "out" / first["output"]).write_text('{"format": "umcp-ndjson/1", "key": "other"}\n', encoding="utf-8")
+    assert cli_main(argv + ["--skip-done"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["processed"], summary["skipped"]) == (1, 2)
+    if have_numpy():
+        assert cli_main(argv + ["--skip-done", "--backend", "numpy"]) == 0
+        assert json.loads(capsys.readouterr().out)["processed"] == 3
+
+
+def test_weld_batch_cli_matches_single_welds(tmp_path, monkeypatch, capsys):
+    rng = random.Random(25)
+    xs = [[rng.uniform(0.0, 10.0) for _ in range(3)] for _ in range(60)]
+    sess = UMCPSession().ingest(lows=[0.0] * 3, highs=[10.0] * 3).freeze(dt=0.5, h_rec=6.0, eta=0.45)
+    rows = sess.compute(x_series=xs).tier1
+    with open(tmp_path / "trace.ndjson", "w", encoding="utf-8") as f:
+        sess.export_ndjson(f)
+    c = FrozenContract.canon_default()
+    pairs = [(rng.randrange(60), rng.randrange(60)) for _ in range(25)]
+    records = [dict(pre_index=a, post_index=b, tauR=2.5) for a, b in pairs[:10]]
+    records += [dict(pre=rows[a].to_dict(), post=rows[b].to_dict(), R=0.01, theta="X") for a, b in pairs[10:]]
+    expected = [
+        evaluate_weld(
+            pre=rows[a], post=rows[b], tau_r=2.5 if k < 10 else rows[b].tau_R, gamma=GammaOmegaPower(p=c.p),
+            alpha=c.alpha, tol_seam=c.tol_seam, tol_id=c.tol_id, infer_R=k < 10, R=None if k < 10 else 0.01,
+            theta="θ" if k < 10 else "X", weld_id=c.weld_id, pre_id=c.pre_doi, post_id=c.post_doi,
+        ).ss1m.to_dict()
+        for k, (a, b) in enumerate(pairs)
+    ]
+    feed = "\n".join(json.dumps(r) for r in records) + "\n"
+    argv = ["weld", "--batch", "-", "--tier1", str(tmp_path / "trace.ndjson"), "--infer-R", "--chunk", "7"]
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(feed))
+    assert cli_main(argv) == 0
+    got = [json.loads(ln) for ln in capsys.readouterr().out.splitlines()]
+    assert [g.pop("record") for g in got] == list(range(len(pairs)))
+    assert got == json.loads(json.dumps(expected))
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(feed))
+    assert cli_main(argv + ["--failures-only"]) == 0
+    failed = [json.loads(ln)["record"] for ln in capsys.readouterr().out.splitlines()]
+    assert failed == [k for k, e in enumerate(expected) if not e["pass_ok"]]
+
+    # Invalid records are reported in place, with their input line, and evaluation continues.
+    lines = feed.splitlines()
+    broken = "\n".join([lines[0], "{not json", json.dumps(dict(pre_index=60, post_index=0, tauR=2.5)), "", lines[1]])
+    monkeypatch.setattr("sys.stdin", io.StringIO(broken + "\n"))
+    assert cli_main(argv) == 1
+    got = [json.loads(ln) for ln in capsys.readouterr().out.splitlines()]
+    assert [g["record"] for g in got] == [0, 1, 2, 3]
+    assert got[1]["line"] == 2 and "invalid JSON" in got[1]["error"]
+    assert got[2]["line"] == 3 and "pre_index 60 outside" in got[2]["error"]
+    assert {k: v for k, v in got[3].items() if k != "record"} == json.loads(json.dumps(expected[1]))
+
+    with pytest.raises(SystemExit, match="--server"):
+        cli_main(["--server", "http://127.0.0.1:9", *argv])
@@ -0,0 +1,337 @@
+import math
+import random
+import statistics
+
+import pytest
+
+from umcp.backend import have_numpy
+from umcp.batch import compute_tier1_batch
+from umcp.contract import FrozenContract
+from umcp.kernel import (
+    IncrementalKernel,
+    Tier1Frame,
+    _row_metrics,
+    _tau_R_for_index,
+    compute_tier1_frame,
+    compute_tier1_series,
+    iter_tier1_windows,
+    numpy_tolerance,
+)
+from umcp.norms import CallableNorm, WeightedL2Norm, get_norm
+from umcp.parallel import MIN_CHUNK_ROWS
+from umcp.regime import (
+    REGIME_CATEGORIES,
+    RegimeIndex,
+    RegimeResult,
+    RegimeTimeline,
+    classify_regime,
+    classify_regime_timeline,
+)
+from umcp.returns import KeyframeDomain, PhaseLockedDomain, StridedDomain, tau_R_series
+from umcp.tier0 import (
+    eps_guard,
+    l2_norm,
+    linf_norm,
+    normalize_to_admitted_trace,
+    normalize_to_admitted_trace_compact,
+)
+from umcp.traceio import iter_trace_windows
+
+
+def _trace(T=200, n=6, seed=7):
+    rng = random.Random(seed)
+    psi = [[rng.random() for _ in range(n)]]
+    for _ in range(T - 1):
+        psi.append([min(1.0, max(0.0, c + rng.uniform(-0.02, 0.02))) for c in psi[-1]])
+    return psi
+
+
+def _assert_rows_match(ref, got, numpy_tol=False):
+    assert len(ref) == len(got)
+    for a, b in zip(ref, got):
+        assert a.t == b.t and a.psi == b.psi and a.weights == b.weights
+        assert a.tau_R == b.tau_R
+        for k in ("F", "omega", "S", "C", "kappa", "I"):
+            tol = numpy_tolerance(k, len(a.psi), a.kappa) if numpy_tol else 0.0
+            assert math.isclose(getattr(a, k), getattr(b, k), rel_tol=0.0, abs_tol=tol), k
+
+
+def test_numpy_backend_matches_reference():
+    pytest.importorskip("numpy")
+    contract = FrozenContract.canon_default()
+    psi = _trace()
+    kw = dict(contract=contract, weights=[1, 2, 3, 1, 1, 2], dt=0.5, h_rec=20.0, eta=0.05)
+    ref = compute_tier1_series(psi, **kw)
+    got = compute_tier1_series(psi, backend="numpy", **kw)
+    assert any(math.isfinite(r.tau_R) for r in ref)
+    _assert_rows_match(ref, got, numpy_tol=True)
+
+    # 64 channels with c in [1e-8.5, 1e-5]: |κ| ~ 1000, where a plain 1e-12 absolute bound fails.
+    rng = random.Random(11)
+    low = [[10.0 ** rng.uniform(-8.5, -5.0) for _ in range(64)] for _ in range(2000)]
+    psi = [row for pair in zip(_trace(T=2000, n=64, seed=5), low) for row in pair]
+    kw = dict(contract=contract, weights=None, dt=0.5, h_rec=20.0, eta=0.05)
+    _assert_rows_match(
+        compute_tier1_series(psi, **kw), compute_tier1_series(psi, backend="numpy", **kw), numpy_tol=True
+    )
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        compute_tier1_series([[0.5]], contract=FrozenContract.canon_default(), dt=1.0, h_rec=1.0, backend="gpu")
+
+
+@pytest.mark.parametrize("norm", [l2_norm, linf_norm])
+def test_indexed_return_search_matches_scan(norm):
+    psi = _trace(T=400, n=5, seed=3)
+    for eta in (0.01, 0.04, 0.2):
+        ref = [_tau_R_for_index(psi, t, dt=0.25, eta=eta, h_rec=30.0, norm=norm) for t in range(len(psi))]
+        assert tau_R_series(psi, dt=0.25, eta=eta, h_rec=30.0, norm=norm) == ref
+        assert tau_R_series(psi, dt=0.25, eta=eta, h_rec=30.0, norm=norm, prune=False, key_dims=1) == ref
+
+
+@pytest.mark.parametrize("return_search", ["scan", "index"])
+def test_incremental_kernel_matches_batch(return_search):
+    contract = FrozenContract.canon_default()
+    psi = _trace(T=150, n=4, seed=11)
+    kw = dict(contract=contract, weights=[1, 1, 2, 4], dt=0.1, h_rec=3.0, eta=0.03)
+    ref = compute_tier1_series(psi, **kw)
+    inc = IncrementalKernel(return_search=return_search, **kw)
+    assert [inc.push(p) for p in psi] == ref
+    assert inc.t == len(psi) and inc.max_lag == 30
+
+
+def test_tier1_frame_columns_and_row_views():
+    contract = FrozenContract.canon_default()
+    psi = _trace(T=50, n=3, seed=5)
+    kw = dict(contract=contract, dt=1.0, h_rec=10.0, eta=0.05)
+    frame = compute_tier1_frame(psi, **kw)
+    rows = compute_tier1_series(psi, **kw)
+    assert frame.psi is psi
+    assert len(frame) == len(rows) and list(frame) == rows
+    assert frame[-1] == rows[-1] and frame[10:12] == rows[10:12]
+    assert list(frame.column("kappa")) == [r.kappa for r in rows]
+    assert [classify_regime(r) for r in frame] == [classify_regime(r) for r in rows]
+    assert Tier1Frame.from_rows(rows).to_rows() == rows
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_parallel_chunks_are_bit_identical(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    contract = FrozenContract.canon_default()
+    psi = _trace(T=MIN_CHUNK_ROWS + 700, n=3, seed=13)
+    kw = dict(contract=contract, dt=1.0, h_rec=40.0, eta=0.03, backend=backend)
+    serial = compute_tier1_frame(psi, **kw)
+    par = compute_tier1_frame(psi, workers=2, **kw)
+    for k in serial.columns:
+        assert list(par.column(k)) == list(serial.column(k)), k
+
+
+@pytest.mark.parametrize("norm_id", ["L1", "L2", "Linf"])
+def test_norm_within_agrees_with_distance(norm_id):
+    norm = get_norm(norm_id)
+    rng = random.Random(17)
+    for _ in range(500):
+        a = [rng.random() for _ in range(8)]
+        b = [x + rng.uniform(-0.01, 0.01) for x in a]
+        d = norm(a, b)
+        for eta in (d, d * (1 + 1e-15), d * 0.5, d * 2.0):
+            assert norm.within(a, b, eta) == (d < eta)
+    assert norm.distances(a, [a, b]) == [norm(a, a), norm(a, b)]
+
+
+def test_norm_id_recorded_and_l2_callable_equivalent():
+    contract = FrozenContract.canon_default()
+    psi = _trace(T=80, n=4, seed=19)
+    kw = dict(contract=contract, dt=1.0, h_rec=10.0, eta=0.04)
+    by_fn = compute_tier1_frame(psi, norm=l2_norm, **kw)
+    by_id = compute_tier1_frame(psi, norm="L2", **kw)
+    assert by_fn.norm_id == by_id.norm_id == "L2"
+    assert by_fn.to_rows() == by_id.to_rows()
+    weighted = WeightedL2Norm((1.0, 1.0, 1.0, 1.0))
+    assert list(compute_tier1_frame(psi, norm=weighted, **kw).column("tau_R")) == list(by_id.column("tau_R"))
+    assert compute_tier1_frame(psi, norm=weighted, **kw)[0].norm_id == "WeightedL2(w=1,1,1,1)"
+    with pytest.raises(ValueError):
+        compute_tier1_frame(psi, norm=lambda a, b: l2_norm(a, b), **kw)
+    named = CallableNorm(lambda a, b: l2_norm(a, b), norm_id="l2-copy")
+    assert compute_tier1_frame(psi, norm=named, **kw)[0].norm_id == "l2-copy"
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_batch_matches_per_trace_frames(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    contract = FrozenContract.canon_default()
+    traces = [_trace(T=T, n=4, seed=s) for T, s in ((60, 1), (1, 2), (35, 3))]
+    weights = [[1, 1, 1, 1], [4, 3, 2, 1], [1, 2, 1, 2]]
+    kw = dict(contract=contract, dt=1.0, h_rec=12.0, eta=0.04)
+    results = compute_tier1_batch(traces, weights=weights, backend=backend, **kw)
+    for tr, w, res in zip(traces, weights, results):
+        ref = compute_tier1_frame(tr, weights=w, backend=backend, **kw)
+        assert res.frame.to_rows() == ref.to_rows()
+        assert res.regimes == [classify_regime(r) for r in ref]
+
+
+@pytest.mark.parametrize(
+    "domain",
+    [StridedDomain(3, 1), PhaseLockedDomain(4, 1), KeyframeDomain((0, 5, 6, 20, 33, 34, 50, 71))],
+)
+def test_return_domains_match_definition_across_engines(domain):
+    contract = FrozenContract.canon_default()
+    psi = _trace(T=90, n=3, seed=23)
+    kw = dict(contract=contract, dt=0.5, h_rec=10.0, eta=0.05, domain=domain)
+    frame = compute_tier1_frame(psi, **kw)
+    assert frame.domain_id == domain.domain_id == frame[3].domain_id
+    expected = []
+    for t in range(len(psi)):
+        lags = [t - u for u in range(max(0, t - 20), t) if domain.contains(t, u) and l2_norm(psi[t], psi[u]) < 0.05]
+        expected.append(min(lags) * 0.5 if lags else math.inf)
+    assert list(frame.column("tau_R")) == expected
+    assert tau_R_series(psi, dt=0.5, eta=0.05, h_rec=10.0, domain=domain) == expected
+    inc = IncrementalKernel(contract=contract, dt=0.5, h_rec=10.0, eta=0.05, domain=domain)
+    assert [inc.push(p).tau_R for p in psi] == expected
+    if have_numpy():
+        assert list(compute_tier1_frame(psi, backend="numpy", **kw).column("tau_R")) == expected
+
+
+def _neumaier_sum(xs):
+    # CPython >= 3.12 sum() over floats.
+    total = err = 0.0
+    for x in xs:
+        t = total + x
+        err += (total - t) + x if abs(total) >= abs(x) else (x - t) + total
+        total = t
+    return total + err if err and math.isfinite(err) else total
+
+
+def test_fused_row_kernel_matches_definitions():
+    eps = FrozenContract.canon_default().epsilon
+    rng = random.Random(29)
+    for _ in range(200):
+        c = [rng.choice([0.0, 1.0, 1e-12, rng.random()]) for _ in range(9)]
+        w = [1.0 / 9] * 9
+        ce = eps_guard(c, eps)
+        F, omega, S, C, kappa, I = _row_metrics(c, w, eps)
+        assert F == _neumaier_sum(wi * ci for wi, ci in zip(w, c))
+        assert math.isclose(F, math.fsum(wi * ci for wi, ci in zip(w, c)), rel_tol=1e-15, abs_tol=1e-15)
+        assert math.isclose(S, -sum(wi * (x * math.log(x) + (1 - x) * math.log(1 - x)) for wi, x in zip(w, ce)), abs_tol=1e-15)
+        assert math.isclose(C, statistics.pstdev(c) / 0.5, rel_tol=1e-15, abs_tol=1e-15)
+        assert kappa == _neumaier_sum(math.log(x) for x in ce)
+        assert I == math.exp(kappa) and omega == 1.0 - F
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_compact_normalization_matches_reference(backend):
+    if backend == "numpy" and not have_numpy():
+        pytest.skip("numpy not installed")
+    rng = random.Random(10)
+    lows, highs = [0.0, -1.0, 2.0], [1.0, 1.0, 5.0]
+    xs = [[rng.uniform(-0.5, 1.5), rng.uniform(-2.0, 2.0), rng.uniform(1.0, 6.0)] for _ in range(123)]
+    psi_ref, flags_ref = normalize_to_admitted_trace(xs, lows, highs)
+    psi, mask = normalize_to_admitted_trace_compact(xs, lows, highs, backend=backend)
+    assert [list(map(float, row)) for row in psi] == psi_ref
+    assert mask.to_flags() == flags_ref
+    assert mask.below_counts == [sum(f[i].below for f in flags_ref) for i in range(3)]
+    assert mask.above_counts == [sum(f[i].above for f in flags_ref) for i in range(3)]
+    assert [(t, i) for t, i, _ in mask.cells()] == [
+        (t, i) for t, fr in enumerate(flags_ref) for i, f in enumerate(fr) if f.clipped
+    ]
+    with pytest.raises(ZeroDivisionError):
+        normalize_to_admitted_trace_compact(xs, lows, [1.0, -1.0, 5.0], backend=backend)
+    psi, mask = normalize_to_admitted_trace_compact([], lows, highs, backend=backend)
+    assert len(psi) == 0 and (mask.T, mask.n, mask.to_flags()) == (0, 3, [])
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_windowed_kernel_matches_whole_trace(backend):
+    if backend == "numpy" and not have_numpy():
+        pytest.skip("numpy not installed")
+    contract = FrozenContract.canon_default()
+    psi = _trace(400, 3, seed=11)
+    kw = dict(contract=contract, dt=1.0, h_rec=25.0, eta=0.3, backend=backend, domain=StridedDomain(3, 1))
+    whole = compute_tier1_frame(psi, **kw)
+    windows = [psi[s:s + 17] for s in range(0, len(psi), 17)]
+    rows = [r for frame in iter_tier1_windows(windows, **kw) for r in frame]
+    assert rows == whole.to_rows()
+    tail = compute_tier1_frame(psi[300:], halo=psi[275:300], t0=300, **kw)
+    assert tail.to_rows() == whole.to_rows()[300:]
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_trace_readers_agree_across_formats(tmp_path, backend):
+    if not have_numpy():
+        pytest.skip("numpy not installed")
+    import numpy as np
+
+    psi = _trace(50, 4, seed=12)
+    (tmp_path / "t.csv").write_text("\n".join(",".join(repr(x) for x in row) for row in psi) + "\n\n")
+    quoted = [[f'"{x!r}"' if (t + i) % 3 == 0 else repr(x) for i, x in enumerate(row)] for t, row in enumerate(psi)]
+    (tmp_path / "q.csv").write_text("\n".join(",".join(row) for row in quoted) + "\n")
+    np.asarray(psi, dtype="<f8").tofile(tmp_path / "t.f64")
+    np.save(tmp_path / "t.npy", np.asarray(psi))
+    for name in ("t.csv", "q.csv", "t.f64", "t.npy"):
+        blocks = list(iter_trace_windows(tmp_path / name, channels=4, window=7, backend=backend))
+        assert [len(b) for b in blocks] == [7] * 7 + [1]
+        assert [[float(x) for x in row] for b in blocks for row in b] == psi
+    with pytest.raises(ValueError):
+        list(iter_trace_windows(tmp_path / "t.f64", channels=3))
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_regime_timeline_matches_row_classifier(backend):
+    if backend == "numpy" and not have_numpy():
+        pytest.skip("numpy not installed")
+    rng = random.Random(15)
+    psi = [[rng.choice([0.98, 0.9, 0.5, 0.2]) + rng.uniform(-0.01, 0.01) for _ in range(3)] for _ in range(300)]
+    psi = [[min(1.0, max(0.0, c)) for c in row] for row in psi[:100]] + [[0.99] * 3] * 50 + psi[150:]
+    frame = compute_tier1_frame(psi, contract=FrozenContract.canon_default(), dt=1.0, h_rec=5.0, eta=0.01, backend=backend)
+    expected = [classify_regime(r) for r in frame]
+    timeline = classify_regime_timeline(frame.columns)
+    assert timeline == expected and list(timeline) == expected
+    runs = timeline.runs()
+    assert runs[0].start == 0 and runs[-1].end == len(psi)
+    assert any(r.end - r.start >= 50 for r in runs)
+    for run in runs:
+        assert all((e.regime, e.critical) == (run.regime, run.critical) for e in expected[run.start:run.end])
+    for a, b in zip(runs, runs[1:]):
+        assert a.end == b.start and (a.regime, a.critical) != (b.regime, b.critical)
+    assert timeline.run_at(120) == next(r for r in runs if r.start <= 120 < r.end)
+
+    grown = RegimeTimeline()
+    grown.extend(expected)
+    assert grown.codes == timeline.codes and grown.run_starts == timeline.run_starts
+
+
+def test_regime_index_matches_rescan():
+    rng = random.Random(16)
+    kinds = [("Stable", "S"), ("Watch", "W"), ("Collapse", "C")]
+    labels = []
+    while len(labels) < 400:
+        regime, phi = rng.choice(kinds)
+        labels += [RegimeResult(regime=regime, phi=phi, critical=rng.random() < 0.3)] * rng.randint(1, 12)
+
+    def category(r, c):
+        return r.critical if c == "Critical" else r.regime == c
+
+    def rescan_transitions(a, b):
+        return [(t, labels[t - 1].regime, labels[t].regime) for t in range(max(1, a), b) if labels[t - 1].regime != labels[t].regime]
+
+    built = RegimeIndex(labels[:150])
+    built.extend(labels[150:])
+    for index in (RegimeIndex(labels), RegimeIndex(RegimeTimeline.from_results(labels)), built):
+        assert len(index) == len(labels)
+        for _ in range(50):
+            a, b = sorted(rng.randrange(0, len(labels) + 1) for _ in range(2))
+            for c in REGIME_CATEGORIES:
+                assert index.occupancy(c, a, b) == sum(category(r, c) for r in labels[a:b])
+                assert index.next_entry(c, a) == next((u for u in range(a, len(labels)) if category(labels[u], c)), None)
+            expected = rescan_transitions(a, b)
+            assert index.transitions(start=a, stop=b) == expected
+            assert index.count_transitions("Watch", "Collapse", a, b) == sum(
+                1 for _, fr, to in expected if (fr, to) == ("Watch", "Collapse")
+            )
+            after = [t for t, _, _ in rescan_transitions(0, len(labels)) if t > a]
+            assert index.next_transition(a) == (after[0] if after else None)
+            before = [t for t, fr, _ in rescan_transitions(0, len(labels)) if t <= b and fr == "Stable"]
+            assert index.previous_transition(b, from_regime="Stable") == (before[-1] if before else None)
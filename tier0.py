@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
 
 import math
 
+from umcp.backend import require_numpy, resolve_backend
+
 
 @dataclass(frozen=True, slots=True)
 class ClipFlag:
@@ -86,5 +88,182 @@ def normalize_to_admitted_trace(
     return psi, flags_all
 
 
+_NOT_CLIPPED = ClipFlag(clipped=False, below=False, above=False)
+_CLIPPED_BELOW = ClipFlag(clipped=True, below=True, above=False)
+_CLIPPED_ABOVE = ClipFlag(clipped=True, below=False, above=True)
+
+
+class ClipMask:
+    """
+    Compact clip-and-flag record for a (T, n) trace.
+
+    Below/above flags are packed bitmaps (bit k = t·n + i, little-endian within each byte) with
+    per-channel clip counts kept alongside, so audits need no rescan. The per-cell
+    `List[List[ClipFlag]]` view is available on demand via `to_flags()`.
+    """
+
+    __slots__ = ("T", "n", "below", "above", "below_counts", "above_counts")
+
+    def __init__(
+        self,
+        *,
+        T: int,
+        n: int,
+        below: bytes | bytearray,
+        above: bytes | bytearray,
+        below_counts: Sequence[int],
+        above_counts: Sequence[int],
+    ) -> None:
+        self.T = int(T)
+        self.n = int(n)
+        self.below = bytearray(below)
+        self.above = bytearray(above)
+        self.below_counts = [int(x) for x in below_counts]
+        self.above_counts = [int(x) for x in above_counts]
+
+    @property
+    def clipped_count(self) -> int:
+        return sum(self.below_counts) + sum(self.above_counts)
+
+    def channel_counts(self) -> List[Tuple[int, int]]:
+        """(below, above) clip counts per channel."""
+        return list(zip(self.below_counts, self.above_counts))
+
+    def flag(self, t: int, i: int) -> ClipFlag:
+        k = t * self.n + i
+        if self.below[k >> 3] >> (k & 7) & 1:
+            return _CLIPPED_BELOW
+        if self.above[k >> 3] >> (k & 7) & 1:
+            return _CLIPPED_ABOVE
+        return _NOT_CLIPPED
+
+    def cells(self) -> Iterator[Tuple[int, int, str]]:
+        """Sparse view: (t, i, "below" | "above") for clipped cells only, in row-major order."""
+        for j, (b, a) in enumerate(zip(self.below, self.above)):
+            if not (b | a):
+                continue
+            for bit in range(8):
+                k = (j << 3) | bit
+                if b >> bit & 1:
+                    yield divmod(k, self.n) + ("below",)
+                elif a >> bit & 1:
+                    yield divmod(k, self.n) + ("above",)
+
+    def extend(self, other: "ClipMask") -> None:
+        """Append the rows of another mask (same n) in place, e.g. for newly ingested samples."""
+        if other.n != self.n:
+            raise ValueError("ClipMask.extend needs the same channel count n")
+        base = self.T * self.n
+        if base % 8 == 0:
+            del self.below[base >> 3:], self.above[base >> 3:]
+            self.below += other.below
+            self.above += other.above
+        else:
+            need = (base + other.T * other.n + 7) >> 3
+            grow = need - len(self.below)
+            if grow > 0:
+                self.below += bytes(grow)
+                self.above += bytes(grow)
+            for t, i, side in other.cells():
+                k = base + t * self.n + i
+                bits = self.below if side == "below" else self.above
+                bits[k >> 3] |= 1 << (k & 7)
+        self.T += other.T
+        self.below_counts = [a + b for a, b in zip(self.below_counts, other.below_counts)]
+        self.above_counts = [a + b for a, b in zip(self.above_counts, other.above_counts)]
+
+    def to_flags(self) -> List[List[ClipFlag]]:
+        """Per-cell ClipFlag lists (the `normalize_to_admitted_trace` shape); built on demand."""
+        flags = [[_NOT_CLIPPED] * self.n for _ in range(self.T)]
+        for t, i, side in self.cells():
+            flags[t][i] = _CLIPPED_BELOW if side == "below" else _CLIPPED_ABOVE
+        return flags
+
+
+def normalize_to_admitted_trace_compact(
+    x_series: Iterable[Sequence[float]],
+    lows: Sequence[float],
+    highs: Sequence[float],
+    *,
+    backend: str = "python",
+) -> Tuple[Any, ClipMask]:
+    """
+    Tier-0 normalize + face-policy clip[0,1], recording clips in a ClipMask instead of T·n ClipFlags.
+
+    Bounds are converted and validated once; Ψ values are bit-identical to
+    `normalize_to_admitted_trace` (same (x − low)/(high − low) division and clip rule). With
+    backend="numpy" (or "auto" with NumPy installed) Ψ is returned as a (T, n) float64 array.
+    """
+    lo = [float(v) for v in lows]
+    den = [float(hi) - lo_v for hi, lo_v in zip(highs, lo)]
+    n = len(lo)
+    if len(highs) != n:
+        raise ValueError("x, lows, highs must have the same length")
+    if any(d == 0.0 for d in den):
+        raise ZeroDivisionError("Normalization bound high==low produces undefined affine map")
+
+    if resolve_backend(backend) == "numpy":
+        np = require_numpy("normalize_to_admitted_trace_compact")
+        X = np.asarray(x_series if isinstance(x_series, (list, tuple, np.ndarray)) else list(x_series), dtype=np.float64)
+        if X.size == 0 and X.shape[0] == 0:
+            empty = ClipMask(T=0, n=n, below=b"", above=b"", below_counts=[0] * n, above_counts=[0] * n)
+            return np.empty((0, n), dtype=np.float64), empty
+        if X.ndim != 2 or X.shape[1] != n:
+            raise ValueError("x, lows, highs must have the same length")
+        Y = (X - np.asarray(lo)) / np.asarray(den)
+        below = Y < 0.0
+        above = Y > 1.0
+        psi = np.where(below, 0.0, np.where(above, 1.0, Y))
+        mask = ClipMask(
+            T=X.shape[0],
+            n=n,
+            below=np.packbits(below.ravel(), bitorder="little").tobytes(),
+            above=np.packbits(above.ravel(), bitorder="little").tobytes(),
+            below_counts=below.sum(axis=0).tolist(),
+            above_counts=above.sum(axis=0).tolist(),
+        )
+        return psi, mask
+
+    psi_out: List[List[float]] = []
+    below_bits = bytearray()
+    above_bits = bytearray()
+    below_counts = [0] * n
+    above_counts = [0] * n
+    k = 0
+    for x in x_series:
+        if len(x) != n:
+            raise ValueError("x, lows, highs must have the same length")
+        need = (k + n + 7) >> 3
+        if len(below_bits) < need:
+            grow = need - len(below_bits)
+            below_bits.extend(bytes(grow))
+            above_bits.extend(bytes(grow))
+        row = [(float(xi) - li) / di for xi, li, di in zip(x, lo, den)]
+        for i, y in enumerate(row):
+            if y < 0.0:
+                row[i] = 0.0
+                below_bits[(k + i) >> 3] |= 1 << ((k + i) & 7)
+                below_counts[i] += 1
+            elif y > 1.0:
+                row[i] = 1.0
+                above_bits[(k + i) >> 3] |= 1 << ((k + i) & 7)
+                above_counts[i] += 1
+        psi_out.append(row)
+        k += n
+    mask = ClipMask(
+        T=len(psi_out),
+        n=n,
+        below=below_bits,
+        above=above_bits,
+        below_counts=below_counts,
+        above_counts=above_counts,
+    )
+    return psi_out, mask
+
+
 def l2_norm(a: Sequence[float], b: Sequence[float]) -> float:
     return math.sqrt(sum((float(x) - float(y)) ** 2 for x, y in zip(a, b)))
+
+
+def linf_norm(a: Sequence[float], b: Sequence[float]) -> float:
+    return max((abs(float(x) - float(y)) for x, y in zip(a, b)), default=0.0)
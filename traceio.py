@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from array import array
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple
+
+import csv
+import mmap
+import sys
+
+from umcp.backend import require_numpy, resolve_backend
+
+TRACE_FORMATS = ("auto", "csv", "f64", "f32", "npy")
+
+# Rows per window when the caller does not choose; a (65536, n) float64 window is 512·n KiB.
+DEFAULT_WINDOW = 65536
+
+_SUFFIX_FORMATS = {".npy": "npy", ".f64": "f64", ".f32": "f32", ".csv": "csv"}
+_RAW_CODES = {"f64": ("d", "<f8"), "f32": ("f", "<f4")}
+
+
+def pack_f64(values: Iterable[float]) -> bytes:
+    """Floats as little-endian IEEE-754 float64 bytes (the raw "f64" layout), on any host byte order."""
+    a = array("d", values)
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a.tobytes()
+
+
+def unpack_f64(data: bytes) -> array:
+    """Inverse of `pack_f64`: little-endian float64 bytes as an array("d")."""
+    a = array("d")
+    a.frombytes(data)
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a
+
+
+def detect_format(path: str | Path, fmt: str = "auto") -> str:
+    """Resolve "auto" from the file suffix (.npy, .f64, .f32; anything else is CSV)."""
+    if fmt not in TRACE_FORMATS:
+        raise ValueError(f"unknown trace format {fmt!r}; expected one of {TRACE_FORMATS}")
+    if fmt != "auto":
+        return fmt
+    return _SUFFIX_FORMATS.get(Path(path).suffix.lower(), "csv")
+
+
+def _raw_shape(path: str | Path, fmt: str, channels: Optional[int]) -> Tuple[int, int]:
+    if channels is None or int(channels) < 1:
+        raise ValueError(f"raw {fmt} traces need a declared channel count (channels >= 1)")
+    n = int(channels)
+    itemsize = 8 if fmt == "f64" else 4
+    size = Path(path).stat().st_size
+    if size % (n * itemsize):
+        raise ValueError(f"{path}: {size} bytes is not a whole number of {n}-channel {fmt} rows")
+    return size // (n * itemsize), n
+
+
+def map_trace(path: str | Path, *, fmt: str = "auto", channels: Optional[int] = None) -> Any:
+    """
+    Memory-map a binary trace as a read-only (T, n) NumPy array without reading it.
+
+    Raw formats are little-endian float64 ("f64") or float32 ("f32") rows of `channels` values;
+    ".npy" files carry their own shape and dtype. Requires NumPy.
+    """
+    np = require_numpy("map_trace")
+    fmt = detect_format(path, fmt)
+    if fmt == "npy":
+        A = np.load(path, mmap_mode="r")
+        if A.ndim != 2:
+            raise ValueError(f"{path}: expected a 2-D (T, n) array, got shape {A.shape}")
+        return A
+    if fmt == "csv":
+        raise ValueError("CSV traces cannot be memory-mapped; use iter_trace_windows")
+    T, n = _raw_shape(path, fmt, channels)
+    if T == 0:
+        return np.empty((0, n), dtype=_RAW_CODES[fmt][1])
+    return np.memmap(path, dtype=_RAW_CODES[fmt][1], mode="r", shape=(T, n))
+
+
+def _raw_windows_python(path: str | Path, fmt: str, channels: Optional[int], window: int) -> Iterator[List[List[float]]]:
+    T, n = _raw_shape(path, fmt, channels)
+    if T == 0:
+        return
+    code = _RAW_CODES[fmt][0]
+    row_bytes = n * (8 if fmt == "f64" else 4)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for s in range(0, T, window):
+            buf = array(code)
+            buf.frombytes(mm[s * row_bytes:min(T, s + window) * row_bytes])
+            if sys.byteorder != "little":
+                buf.byteswap()
+            vals = buf.tolist()
+            yield [vals[i:i + n] for i in range(0, len(vals), n)]
+
+
+def _csv_values(ln: str) -> List[float]:
+    """One CSV line as floats; lines with quoted fields ("0.5") are split by csv.reader."""
+    if '"' in ln:
+        return [float(x) for x in next(csv.reader([ln]))]
+    return [float(x) for x in ln.split(",")]
+
+
+def _csv_windows(path: str | Path, window: int, engine: str) -> Iterator[Any]:
+    np = require_numpy("CSV window parsing") if engine == "numpy" else None
+    n: Optional[int] = None
+    with open(path, "r", encoding="utf-8") as f:
+        nonblank = (ln for ln in f if not ln.isspace())
+        while True:
+            lines = list(islice(nonblank, window))
+            if not lines:
+                return
+            quoted = any('"' in ln for ln in lines)
+            if np is not None and not quoted:
+                block = np.loadtxt(lines, delimiter=",", dtype=np.float64, ndmin=2)
+            else:
+                block = [_csv_values(ln) for ln in lines]
+            if n is None:
+                n = len(block[0])
+            if any(len(row) != n for row in block):
+                raise ValueError(f"{path}: every CSV row must have {n} values")
+            yield np.asarray(block, dtype=np.float64) if np is not None and quoted else block
+
+
+def iter_csv_rows(stream: IO[str]) -> Iterator[List[float]]:
+    """Lazily parse comma-separated rows from a text stream (e.g. stdin), skipping blank lines."""
+    n: Optional[int] = None
+    for ln in stream:
+        if ln.isspace():
+            continue
+        row = _csv_values(ln)
+        if n is None:
+            n = len(row)
+        elif len(row) != n:
+            raise ValueError(f"every CSV row must have {n} values")
+        yield row
+
+
+def iter_trace_windows(
+    path: str | Path,
+    *,
+    fmt: str = "auto",
+    channels: Optional[int] = None,
+    window: int = DEFAULT_WINDOW,
+    backend: str = "auto",
+) -> Iterator[Any]:
+    """
+    Yield a trace file as consecutive windows of at most `window` rows.
+
+    Windows are float64 (rows, n) NumPy arrays with the NumPy engine, else lists of row lists.
+    Binary inputs (raw f64/f32, .npy) are memory-mapped and each window is read straight from the
+    mapping; CSV is parsed `window` lines at a time (comma-separated numbers, optionally quoted; blank
+    lines skipped), so peak memory is one window regardless of file size. Values are exactly those the
+    full-file readers produce.
+    """
+    if int(window) < 1:
+        raise ValueError("window must be >= 1")
+    window = int(window)
+    fmt = detect_format(path, fmt)
+    engine = resolve_backend(backend)
+    if fmt == "csv":
+        yield from _csv_windows(path, window, engine)
+        return
+    if engine == "python" and fmt != "npy":
+        yield from _raw_windows_python(path, fmt, channels, window)
+        return
+    np = require_numpy(f"{fmt} trace input")
+    A = map_trace(path, fmt=fmt, channels=channels)
+    for s in range(0, A.shape[0], window):
+        block = np.asarray(A[s:s + window], dtype=np.float64)
+        yield block if engine == "numpy" else block.tolist()
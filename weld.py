@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, Optional
+from array import array
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import math
+import numbers
 
-from umcp.closures import GammaClosure
-from umcp.kernel import Tier1Row
+from umcp.backend import require_numpy, resolve_backend
+from umcp.closures import GammaClosure, gamma_batch
+from umcp.kernel import Tier1Frame, Tier1Row
 from umcp.regime import classify_regime
 
 
@@ -43,7 +46,11 @@ class SS1mWeld:
     alpha: float
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Every field is a scalar, so this equals dataclasses.asdict without its recursive deep copy.
+        return {name: getattr(self, name) for name in _SS1M_FIELDS}
+
+
+_SS1M_FIELDS = tuple(f.name for f in fields(SS1mWeld))
 
 
 @dataclass(frozen=True, slots=True)
@@ -136,3 +143,372 @@ def evaluate_weld(
         alpha=float(alpha),
     )
     return WeldResult(ss1m=ss1m)
+
+
+WELD_COLUMNS = (
+    "pre_index", "post_index", "tau_R", "delta_kappa", "ir", "D_omega", "D_C", "R", "s",
+    "identity_ok", "return_ok", "pass_ok",
+)
+
+
+class WeldBatch:
+    """
+    Column-wise weld rows for many PRE→POST pairs over one Tier-1 trace.
+
+    Each column holds one entry per pair (see WELD_COLUMNS). Values are computed with the same
+    operations as `evaluate_weld`, so `receipt(k)` equals the SS1mWeld that `evaluate_weld` returns
+    for pair k; receipts are only materialized when asked for.
+    """
+
+    __slots__ = ("tier1", "columns", "tol", "delta_exp", "theta", "weld_id", "pre_id", "post_id", "gamma_id", "alpha")
+
+    def __init__(
+        self,
+        *,
+        tier1: Sequence[Tier1Row],
+        columns: Dict[str, Sequence[Any]],
+        tol: float,
+        delta_exp: float,
+        theta: str,
+        weld_id: str,
+        pre_id: str,
+        post_id: str,
+        gamma_id: str,
+        alpha: float,
+    ) -> None:
+        self.tier1 = tier1
+        self.columns = {k: columns[k] for k in WELD_COLUMNS}
+        self.tol = float(tol)
+        self.delta_exp = float(delta_exp)
+        self.theta = str(theta)
+        self.weld_id = str(weld_id)
+        self.pre_id = str(pre_id)
+        self.post_id = str(post_id)
+        self.gamma_id = str(gamma_id)
+        self.alpha = float(alpha)
+
+    def __len__(self) -> int:
+        return len(self.columns["pass_ok"])
+
+    def column(self, name: str) -> Sequence[Any]:
+        return self.columns[name]
+
+    @property
+    def pass_count(self) -> int:
+        return int(sum(bool(x) for x in self.columns["pass_ok"]))
+
+    def failures(self) -> List[int]:
+        """Positions (into the pair arrays) of pairs that did not PASS."""
+        return [k for k, ok in enumerate(self.columns["pass_ok"]) if not ok]
+
+    def receipt(self, k: int) -> SS1mWeld:
+        """SS1m receipt for pair k."""
+        cols = self.columns
+        post = self.tier1[int(cols["post_index"][k])]
+        return SS1mWeld(
+            delta_kappa=float(cols["delta_kappa"][k]),
+            ir=float(cols["ir"][k]),
+            s=float(cols["s"][k]),
+            tol=self.tol,
+            theta=self.theta,
+            phi=str(classify_regime(post).phi),
+            weld_id=self.weld_id,
+            pre_id=self.pre_id,
+            post_id=self.post_id,
+            tau_R=float(cols["tau_R"][k]),
+            R=float(cols["R"][k]),
+            D_omega=float(cols["D_omega"][k]),
+            D_C=float(cols["D_C"][k]),
+            identity_ok=bool(cols["identity_ok"][k]),
+            return_ok=bool(cols["return_ok"][k]),
+            pass_ok=bool(cols["pass_ok"][k]),
+            delta_exp=self.delta_exp,
+            gamma_id=self.gamma_id,
+            alpha=self.alpha,
+        )
+
+    def take(self, positions: Sequence[int]) -> "WeldBatch":
+        """New batch holding only the given pair positions (same header)."""
+        keep = list(positions)
+        columns: Dict[str, Any] = {}
+        for k, col in self.columns.items():
+            if isinstance(col, array):
+                columns[k] = array(col.typecode, (col[i] for i in keep))
+            else:
+                columns[k] = col[keep]
+        return WeldBatch(
+            tier1=self.tier1, columns=columns, tol=self.tol, delta_exp=self.delta_exp, theta=self.theta,
+            weld_id=self.weld_id, pre_id=self.pre_id, post_id=self.post_id, gamma_id=self.gamma_id,
+            alpha=self.alpha,
+        )
+
+    def receipts(self, positions: Optional[Iterable[int]] = None) -> List[SS1mWeld]:
+        """Receipts for the given pair positions (default: failures only)."""
+        return [self.receipt(k) for k in (self.failures() if positions is None else positions)]
+
+
+def _trace_column(tier1: Sequence[Tier1Row], name: str) -> Sequence[float]:
+    if isinstance(tier1, Tier1Frame):
+        return tier1.column(name)
+    return array("d", (getattr(r, name) for r in tier1))
+
+
+def _weld_pairs(
+    tier1: Sequence[Tier1Row],
+    pre_index: int | Sequence[int],
+    post_index: Sequence[int],
+    tau_r: Optional[float | Sequence[float]],
+) -> Tuple[List[int], List[int], List[float]]:
+    """Validated (pre, post, τR) lists for a bulk weld; see `evaluate_weld_batch`."""
+    post_idx = [int(i) for i in post_index]
+    pre_idx = [int(pre_index)] * len(post_idx) if isinstance(pre_index, numbers.Integral) else [int(i) for i in pre_index]
+    if len(pre_idx) != len(post_idx):
+        raise ValueError("pre_index and post_index must have the same length")
+    T = len(tier1)
+    for i in pre_idx + post_idx:
+        if not -T <= i < T:
+            raise IndexError("weld index out of range")
+    if tau_r is None:
+        tau_col = _trace_column(tier1, "tau_R")
+        tau = [float(tau_col[i]) for i in post_idx]
+    elif isinstance(tau_r, (int, float)):
+        tau = [float(tau_r)] * len(post_idx)
+    else:
+        tau = [float(x) for x in tau_r]
+        if len(tau) != len(post_idx):
+            raise ValueError("tau_r must be a scalar or have one value per pair")
+    return pre_idx, post_idx, tau
+
+
+def evaluate_weld_batch(
+    tier1: Sequence[Tier1Row],
+    *,
+    pre_index: int | Sequence[int],
+    post_index: Sequence[int],
+    tau_r: Optional[float | Sequence[float]] = None,
+    gamma: GammaClosure,
+    alpha: float,
+    tol_seam: float,
+    tol_id: float,
+    infer_R: bool = False,
+    R: Optional[float] = None,
+    theta: str = "θ",
+    weld_id: str = "WELD",
+    pre_id: str = "PRE",
+    post_id: str = "POST",
+    backend: str = "python",
+) -> WeldBatch:
+    """
+    Evaluate many PRE->POST weld rows of one trace (a Tier1Frame or a list of Tier1Row).
+
+    - pre_index is one index (a fixed PRE anchor) or one index per pair; post_index has one per pair.
+    - tau_r is one τR for every pair, one per pair, or None to use each POST row's own τR.
+    - R / infer_R, tolerances and receipt labels are shared by all pairs, as in `evaluate_weld`.
+
+    Γ(ω) is called once per distinct PRE row. With backend="numpy" the ledger arithmetic runs on
+    arrays; both engines give exactly the `evaluate_weld` values.
+    """
+    if R is None and not infer_R:
+        raise ValueError("R must be provided unless infer_R=True")
+    pre_idx, post_idx, tau = _weld_pairs(tier1, pre_index, post_index, tau_r)
+    kappa = _trace_column(tier1, "kappa")
+    I = _trace_column(tier1, "I")
+    omega = _trace_column(tier1, "omega")
+    C = _trace_column(tier1, "C")
+
+    distinct = sorted(set(pre_idx))
+    d_omega_of = dict(zip(distinct, gamma_batch(gamma, [omega[i] for i in distinct])))
+    alpha_f = float(alpha)
+    tol_seam_f = float(tol_seam)
+    tol_id_f = float(tol_id)
+    header = dict(
+        tol=tol_seam_f, delta_exp=tol_id_f, theta=theta, weld_id=weld_id, pre_id=pre_id, post_id=post_id,
+        gamma_id=getattr(gamma, "closure_id", gamma.__class__.__name__), alpha=alpha_f,
+    )
+
+    if resolve_backend(backend) == "numpy":
+        np = require_numpy("evaluate_weld_batch")
+        pre_a = np.asarray(pre_idx, dtype=np.intp)
+        post_a = np.asarray(post_idx, dtype=np.intp)
+        K = np.asarray(kappa, dtype=np.float64)
+        Iv = np.asarray(I, dtype=np.float64)
+        tau_a = np.asarray(tau, dtype=np.float64)
+        dk = K[post_a] - K[pre_a]
+        I_pre = Iv[pre_a]
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            ratio = np.where(I_pre != 0.0, Iv[post_a] / np.where(I_pre != 0.0, I_pre, 1.0), math.inf)
+            ir = np.fromiter(map(math.exp, dk.tolist()), dtype=np.float64, count=dk.size)
+            identity_ok = np.abs(ratio - ir) <= tol_id_f
+            D_omega = np.fromiter((d_omega_of[i] for i in pre_idx), dtype=np.float64, count=len(pre_idx))
+            D_C = alpha_f * np.asarray(C, dtype=np.float64)[pre_a]
+            return_ok = np.isfinite(tau_a)
+            debit = dk + D_omega + D_C
+            if R is None:
+                live = return_ok & (tau_a != 0.0)
+                R_a = np.where(live, debit / np.where(live, tau_a, 1.0), 0.0)
+            else:
+                R_a = np.full(dk.size, float(R))
+            return_term = np.where(return_ok, R_a * np.where(return_ok, tau_a, 0.0), 0.0)
+            s_a = return_term - debit
+        pass_ok = (np.abs(s_a) <= tol_seam_f) & return_ok & identity_ok
+        columns: Dict[str, Any] = dict(
+            pre_index=pre_a, post_index=post_a, tau_R=tau_a, delta_kappa=dk, ir=ir, D_omega=D_omega,
+            D_C=D_C, R=R_a, s=s_a, identity_ok=identity_ok, return_ok=return_ok, pass_ok=pass_ok,
+        )
+        return WeldBatch(tier1=tier1, columns=columns, **header)
+
+    columns = {k: array("d") for k in ("tau_R", "delta_kappa", "ir", "D_omega", "D_C", "R", "s")}
+    columns.update(pre_index=array("q", pre_idx), post_index=array("q", post_idx))
+    flags = {k: array("b") for k in ("identity_ok", "return_ok", "pass_ok")}
+    for a, b, tau_r_val in zip(pre_idx, post_idx, tau):
+        return_ok = math.isfinite(tau_r_val)
+        delta_kappa = float(kappa[b] - kappa[a])
+        ir_ratio = float(I[b] / I[a]) if I[a] != 0.0 else math.inf
+        ir_expected = float(math.exp(delta_kappa))
+        identity_ok = abs(ir_ratio - ir_expected) <= tol_id_f
+        D_omega = d_omega_of[a]
+        D_C = alpha_f * float(C[a])
+        if R is None:
+            R_val = 0.0 if not return_ok or tau_r_val == 0.0 else float((delta_kappa + D_omega + D_C) / tau_r_val)
+        else:
+            R_val = float(R)
+        return_term = float(R_val * tau_r_val) if return_ok else 0.0
+        s = float(return_term - (delta_kappa + D_omega + D_C))
+        for k, v in (
+            ("tau_R", tau_r_val), ("delta_kappa", delta_kappa), ("ir", ir_expected), ("D_omega", D_omega),
+            ("D_C", D_C), ("R", R_val), ("s", s),
+        ):
+            columns[k].append(v)
+        flags["identity_ok"].append(identity_ok)
+        flags["return_ok"].append(return_ok)
+        flags["pass_ok"].append((abs(s) <= tol_seam_f) and return_ok and identity_ok)
+    columns.update(flags)
+    return WeldBatch(tier1=tier1, columns=columns, **header)
+
+
+_RECORD_LABELS = ("theta", "weld_id", "pre_id", "post_id")
+
+
+def _record_row(rec: Dict[str, Any], side: str, tier1: Optional[Sequence[Tier1Row]], k: int) -> Tier1Row:
+    if side in rec and isinstance(rec[side], dict):
+        return Tier1Row.from_dict(rec[side])
+    idx = rec.get(f"{side}_index", rec.get(side))
+    if not isinstance(idx, numbers.Integral) or isinstance(idx, bool):
+        raise ValueError(f"weld record {k}: needs a {side} row or an integer {side}_index")
+    if tier1 is None:
+        raise ValueError(f"weld record {k}: {side}_index requires a Tier-1 trace")
+    if not 0 <= idx < len(tier1):
+        raise ValueError(f"weld record {k}: {side}_index {idx} outside the Tier-1 trace (T={len(tier1)})")
+    return tier1[idx]
+
+
+def _prepare_record(
+    rec: Any, tier1: Optional[Sequence[Tier1Row]], defaults: Dict[str, Any], k: int
+) -> Tuple[Tier1Row, Tier1Row, float, Tuple[Any, ...]]:
+    """PRE row, POST row, τR and group key (R, infer_R, labels) of one record; ValueError if invalid."""
+    if not isinstance(rec, dict):
+        raise ValueError(f"weld record {k}: not a JSON object")
+    try:
+        pre = _record_row(rec, "pre", tier1, k)
+        post = _record_row(rec, "post", tier1, k)
+        tau = rec.get("tauR", defaults.get("tauR"))
+        R = rec.get("R", defaults.get("R"))
+        infer_R = bool(rec.get("infer_R", defaults.get("infer_R", False)))
+        if R is None and not infer_R:
+            raise ValueError(f"weld record {k}: R must be provided unless infer_R is true")
+        tau = float(post.tau_R) if tau is None else float(tau)
+        key = (None if R is None else float(R), infer_R) + tuple(
+            str(rec.get(name, defaults.get(name, ""))) for name in _RECORD_LABELS
+        )
+    except ValueError as e:
+        if str(e).startswith(f"weld record {k}:"):
+            raise
+        raise ValueError(f"weld record {k}: {e}") from None
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"weld record {k}: invalid record ({type(e).__name__}: {e})") from None
+    return pre, post, tau, key
+
+
+def evaluate_weld_records(
+    records: Iterable[Dict[str, Any]],
+    *,
+    tier1: Optional[Sequence[Tier1Row]] = None,
+    gamma: GammaClosure,
+    alpha: float,
+    tol_seam: float,
+    tol_id: float,
+    defaults: Optional[Dict[str, Any]] = None,
+    chunk: int = 4096,
+    backend: str = "python",
+    errors: str = "raise",
+) -> Iterator[Tuple[int, SS1mWeld | ValueError]]:
+    """
+    Evaluate a stream of weld records, yielding (record number, receipt) in input order.
+
+    Each record names its PRE/POST rows inline ("pre"/"post" Tier1Row dicts) or by index into `tier1`
+    ("pre_index"/"post_index"), plus optional "tauR" (default: the POST row's τR), "R", "infer_R" and
+    the receipt labels; missing keys fall back to `defaults`. Records are read `chunk` at a time and
+    each run of records sharing R, infer_R and labels goes through one `evaluate_weld_batch` call, so
+    receipts equal `evaluate_weld` per record while memory stays bounded by the chunk.
+
+    An invalid record (not an object, a missing or out-of-range row, a bad number) raises ValueError
+    with `errors="raise"`; with `errors="report"` it yields (record number, ValueError) in place of a
+    receipt and evaluation continues.
+    """
+    if errors not in ("raise", "report"):
+        raise ValueError("errors must be 'raise' or 'report'")
+    defaults = dict(defaults or {})
+    it = iter(records)
+    base = 0
+    while True:
+        block = [rec for _, rec in zip(range(int(chunk)), it)]
+        if not block:
+            return
+        rows: List[Tier1Row] = []
+        at: Dict[int, int] = {}
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        taus: Dict[int, float] = {}
+        out: List[Optional[SS1mWeld | ValueError]] = [None] * len(block)
+        for j, rec in enumerate(block):
+            k = base + j
+            try:
+                pre, post, tau, key = _prepare_record(rec, tier1, defaults, k)
+            except ValueError as e:
+                if errors == "raise":
+                    raise
+                out[j] = e
+                continue
+            at[j] = len(rows)
+            rows.extend((pre, post))
+            taus[j] = tau
+            groups.setdefault(key, []).append(j)
+        for (R, infer_R, theta, weld_id, pre_id, post_id), members in groups.items():
+            try:
+                batch = evaluate_weld_batch(
+                    rows,
+                    pre_index=[at[j] for j in members],
+                    post_index=[at[j] + 1 for j in members],
+                    tau_r=[taus[j] for j in members],
+                    gamma=gamma,
+                    alpha=alpha,
+                    tol_seam=tol_seam,
+                    tol_id=tol_id,
+                    infer_R=infer_R,
+                    R=R,
+                    theta=theta,
+                    weld_id=weld_id,
+                    pre_id=pre_id,
+                    post_id=post_id,
+                    backend=backend,
+                )
+            except ValueError as e:
+                if errors == "raise":
+                    raise
+                for j in members:
+                    out[j] = ValueError(f"weld record {base + j}: {e}")
+                continue
+            for pos, j in enumerate(members):
+                out[j] = batch.receipt(pos)
+        for j, receipt in enumerate(out):
+            yield base + j, receipt
+        base += len(block)